@@ -1,6 +1,6 @@
-import pandas as pd
 import matplotlib.pyplot as plt
 import os
+from Desktop.Main.experimentStore import ExperimentStore
 
 class MetricsVisualiser:
     def __init__(self):
@@ -18,25 +18,25 @@ class MetricsVisualiser:
         self.Keys = {"KNN": "KNN Background Subtraction", "MOG2": "MOG2 Background Subtraction", "FLOW": "Optical Flow", "Hybrid": "KNN and Optical Flow"}
         self.Scenarios = ["Normal", "Movement", "Background", "Lighting"]
         self.Metrics = ["motion", "ssim", "brightness"]
-        self.OutputDir = "Plots"
+        self.OutputDir = os.path.join(os.path.dirname(__file__), "Plots")
         os.makedirs(self.OutputDir, exist_ok=True)
         self.Data = {}
         self.LoadData()
 
     def LoadData(self):
-        """ Retrieves metric logs
+        """ Retrieves metric logs from the experiment store in one scan
         
         Returns:
         - None
         """
+        Experiments = ExperimentStore().Load("Background", Columns=self.Metrics, Methods=self.Methods, Scenarios=self.Scenarios)
         for Method in self.Methods:
             for Scenario in self.Scenarios:
-                FileName = f"{Method} - {Scenario}.csv"
-                if os.path.exists(FileName):
-                    DF = pd.read_csv(FileName).head(200)
-                    self.Data[(Method, Scenario)] = DF
+                DF = Experiments.get((Method, Scenario))
+                if DF is not None:
+                    self.Data[(Method, Scenario)] = DF.head(200)
                 else:
-                    print(f"⚠️ Missing file: {FileName}")
+                    print(f"⚠️ Missing file: {Method} - {Scenario}.csv")
 
     def Plot(self, PrimaryList, SecondaryList, PrimaryLabel, SecondaryLabel, FileSuffix):
         """ Given metrics from method and scenarios, visualise how each method/Scenario performed
@@ -1,12 +1,8 @@
-import csv
 import os
+from Desktop.Main.metricsSink import GetSink
 
 LogFile = os.path.join(os.path.dirname(__file__), "ResultsLog.csv")
-
-if not os.path.exists(LogFile):
-    with open(LogFile, "w", newline="") as f:
-        writer = csv.writer(f)
-        writer.writerow(["Motion", "SSIM", "Brightness"])
+Sink = GetSink(LogFile, ["Motion", "SSIM", "Brightness"], ["float64", "float64", "float64"])
 
 def LogMetrics(Motion, SSIMScore, Brightness):
     """ Stores the frame Motion, SSIM, Brightness metrics into CSV
@@ -19,6 +15,4 @@ def LogMetrics(Motion, SSIMScore, Brightness):
     Returns:
     - None
     """
-    with open(LogFile, "a", newline="") as f:
-        writer = csv.writer(f)
-        writer.writerow([round(Motion, 4), round(SSIMScore, 4), round(Brightness, 2)])
+    Sink.Write([round(Motion, 4), round(SSIMScore, 4), round(Brightness, 2)])
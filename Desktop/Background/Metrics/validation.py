@@ -0,0 +1,118 @@
+import cv2
+import os
+import time
+import numpy as np
+import pandas as pd
+from Desktop.Background.background import BackgroundMonitor
+
+class FlowValidator:
+    def __init__(self, VideoDirectory):
+        """ Compares the cheaper motion modes against the logged Hybrid experiments
+
+        Arguments:
+        - VideoDirectory (str): Folder holding the recorded Output.mp4 of each scenario, named "{Scenario}.mp4"
+
+        Attributes:
+        - VideoDirectory (str): Folder holding the recorded scenarios
+        - MetricsDirectory (str): Folder holding the logged CSVs
+        - Scenarios (list[str]): Scenarios tested
+        - Configurations (hashmap[str][dict]): Name and BackgroundMonitor arguments of each mode tested
+
+        Returns:
+        - None
+        """
+        self.VideoDirectory = VideoDirectory
+        self.MetricsDirectory = os.path.dirname(__file__)
+        self.Scenarios = ["Normal", "Movement", "Background", "Lighting"]
+        self.Configurations = {
+            "Dense 1.0": {"FlowMode": "dense", "ProcessingScale": 1.0},
+            "Dense 0.5": {"FlowMode": "dense", "ProcessingScale": 0.5},
+            "Dense 0.25": {"FlowMode": "dense", "ProcessingScale": 0.25},
+            "Sparse 0.5": {"FlowMode": "sparse", "ProcessingScale": 0.5},
+            "Grid 0.5": {"FlowMode": "grid", "ProcessingScale": 0.5, "GridStep": 16},
+            "Tiled Dense 0.5": {"FlowMode": "dense", "ProcessingScale": 0.5, "TileGating": True},
+        }
+
+    def MotionBand(self, Motion):
+        """ Group motion ratios by the thresholds GetStatus uses
+
+        Arguments:
+        - Motion (np.ndarray): Motion ratio of each frame
+
+        Returns:
+        - (np.ndarray): 0 still, 1 movement, 2 between, 3 changed
+        """
+        return np.digitize(Motion, [0.1, 0.6, 0.7], right=False)
+
+    def LoadReference(self, Scenario):
+        """ Motion logged by the Hybrid method for a scenario
+
+        Arguments:
+        - Scenario (str): Scenario name
+
+        Returns:
+        - (np.ndarray): Motion ratio of each frame
+        """
+        FileName = os.path.join(self.MetricsDirectory, f"Hybrid - {Scenario}.csv")
+        return pd.read_csv(FileName)["motion"].to_numpy()
+
+    def Replay(self, VideoPath, Configuration):
+        """ Run a recorded scenario through one mode at full speed
+
+        Arguments:
+        - VideoPath (str): Recorded scenario
+        - Configuration (dict): BackgroundMonitor arguments
+
+        Returns:
+        - Tuple:
+            - Motion (np.ndarray): Motion ratio of each frame
+            - Milliseconds (float): Mean processing time per frame
+        """
+        Monitor = BackgroundMonitor(**Configuration)
+        Capture = cv2.VideoCapture(VideoPath)
+        Motion = []
+        Elapsed = 0.0
+        while True:
+            Ret, Frame = Capture.read()
+            if not Ret:
+                break
+            Start = time.perf_counter()
+            Status, MotionRatio, SSIMScore, Brightness = Monitor.ProcessFrame(Frame)
+            Elapsed += time.perf_counter() - Start
+            Motion.append(MotionRatio)
+        Capture.release()
+        return np.array(Motion), 1000 * Elapsed / max(1, len(Motion))
+
+    def Validate(self):
+        """ Replay every scenario through every mode and compare with the logged motion
+
+        Returns:
+        - Results (pd.DataFrame): Agreement of motion bands, correlation and time per frame for each mode and scenario
+        """
+        Rows = []
+        for Scenario in self.Scenarios:
+            VideoPath = os.path.join(self.VideoDirectory, f"{Scenario}.mp4")
+            if not os.path.exists(VideoPath):
+                print(f"Missing recording: {VideoPath}")
+                continue
+            Reference = self.LoadReference(Scenario)
+
+            for Name, Configuration in self.Configurations.items():
+                Motion, Milliseconds = self.Replay(VideoPath, Configuration)
+                Frames = min(len(Motion), len(Reference))
+                Agreement = float(np.mean(self.MotionBand(Motion[:Frames]) == self.MotionBand(Reference[:Frames])))
+                Correlation = float(np.corrcoef(Motion[:Frames], Reference[:Frames])[0, 1]) if Frames > 1 else float("nan")
+                Rows.append({
+                    "Scenario": Scenario,
+                    "Mode": Name,
+                    "Agreement": round(Agreement, 3),
+                    "Correlation": round(Correlation, 3),
+                    "Milliseconds": round(Milliseconds, 2)
+                })
+
+        return pd.DataFrame(Rows)
+
+if __name__ == "__main__":
+    # Recordings are the Output.mp4 written by BackgroundMonitor.Run, renamed to each scenario
+    Validator = FlowValidator(os.path.join(os.path.dirname(__file__), "Recordings"))
+    print(Validator.Validate().to_string(index=False))
@@ -0,0 +1,108 @@
+import cv2
+import numpy as np
+from skimage.metrics import structural_similarity as ssim
+from Desktop.Background.background import BackgroundMonitor
+
+class FastSSIMTests:
+    def __init__(self):
+        """ Create a textured reference frame and a copy with part of it replaced
+
+        Attributes:
+        - Reference (np.ndarray): Grayscale reference frame
+        - Changed (np.ndarray): Reference with a different texture in the middle
+
+        Returns:
+        - None
+        """
+        Generator = np.random.default_rng(0)
+        self.Reference = cv2.GaussianBlur(Generator.integers(0, 256, (240, 320)).astype(np.uint8), (9, 9), 0)
+        self.Changed = self.Reference.copy()
+        self.Changed[60:160, 80:240] = cv2.GaussianBlur(Generator.integers(0, 256, (100, 160)).astype(np.uint8), (5, 5), 0)
+
+    def Monitor(self, Levels):
+        """ Monitor using fast SSIM against the reference frame
+
+        Arguments:
+        - Levels (int): Number of times frames are halved
+
+        Returns:
+        - (BackgroundMonitor): Monitor with its reference statistics precomputed
+        """
+        Monitor = BackgroundMonitor(SSIMMode="fast", SSIMLevels=Levels)
+        Monitor.SetReference(self.Reference)
+        return Monitor
+
+    def TestFullResolution(self):
+        """ Tests fast SSIM without shrinking matches scikit-image
+
+        Returns:
+        - (bool): True if both scores agree
+        """
+        Score = self.Monitor(0).ComputeSSIM(self.Changed)
+        return abs(Score - ssim(self.Reference, self.Changed)) < 1e-9
+
+    def TestPyramid(self):
+        """ Tests fast SSIM on a pyramid level matches scikit-image on the shrunk frames
+
+        Returns:
+        - (bool): True if both scores agree
+        """
+        Score = self.Monitor(1).ComputeSSIM(self.Changed)
+        return abs(Score - ssim(cv2.pyrDown(self.Reference), cv2.pyrDown(self.Changed))) < 1e-9
+
+    def TestRegion(self):
+        """ Tests SSIM over a region uses the precomputed reference and matches scikit-image on that region
+
+        Returns:
+        - (bool): True if both scores agree
+        """
+        Score = self.Monitor(0).ComputeSSIM(self.Changed, (32, 192, 64, 256))
+        return abs(Score - ssim(self.Reference[32:192, 64:256], self.Changed[32:192, 64:256])) < 1e-9
+
+    def TestUnchanged(self):
+        """ Tests an unchanged frame scores one and a changed one scores lower
+
+        Returns:
+        - (bool): True if only the changed frame loses similarity
+        """
+        Monitor = self.Monitor(1)
+        return abs(Monitor.ComputeSSIM(self.Reference) - 1.0) < 1e-9 and Monitor.ComputeSSIM(self.Changed) < 0.9
+
+    def TestUnknownMode(self):
+        """ Tests an unknown SSIM mode is refused
+
+        Returns:
+        - (bool): True if ValueError is raised
+        """
+        try:
+            BackgroundMonitor(SSIMMode="approximate")
+        except ValueError:
+            return True
+        return False
+
+    def RunAllTests(self):
+        """ Run all tests for fast SSIM
+
+        Returns:
+        - None
+        """
+        Results = {
+            "Full Resolution": self.TestFullResolution(),
+            "Pyramid": self.TestPyramid(),
+            "Region": self.TestRegion(),
+            "Unchanged": self.TestUnchanged(),
+            "Unknown Mode": self.TestUnknownMode()
+        }
+
+        Passed = sum(1 for r in Results.values() if r)
+        Total = len(Results)
+
+        print("\nTest Summary:")
+        for Name, Result in Results.items():
+            print(f" - {Name}: {'PASS' if Result else 'FAIL'}")
+
+        print(f"\nFinal Result: {Passed}/{Total} tests passed.")
+
+if __name__ == "__main__":
+    Tests = FastSSIMTests()
+    Tests.RunAllTests()
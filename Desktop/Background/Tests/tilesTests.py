@@ -0,0 +1,116 @@
+import numpy as np
+from Desktop.Background.tiles import TileModel
+
+class TileModelTests:
+    def __init__(self):
+        """ Create a textured frame whose size isn't a multiple of the tile size
+
+        Attributes:
+        - Frame (np.ndarray): 100x150 grayscale frame, 2x3 tiles of 64 with smaller edge tiles
+
+        Returns:
+        - None
+        """
+        Generator = np.random.default_rng(0)
+        self.Frame = Generator.integers(60, 200, (100, 150)).astype(np.uint8)
+
+    def Changed(self):
+        """ Frame with the inside of its top middle tile brightened, away from the edges so neighbouring tiles keep their edge strength
+
+        Returns:
+        - (np.ndarray): Changed copy of the frame
+        """
+        Frame = self.Frame.copy()
+        Frame[8:56, 72:120] += 40
+        return Frame
+
+    def TestStatistics(self):
+        """ Tests tile statistics match each tile computed on its own, including the smaller edge tiles
+
+        Returns:
+        - (bool): True if every tile's mean and deviation agree
+        """
+        Tiles = TileModel(64)
+        Statistics = Tiles.Statistics(self.Frame)
+        Expected = [[self.Frame[Top:Top + 64, Left:Left + 64].astype(np.float64) for Left in (0, 64, 128)] for Top in (0, 64)]
+        Means = np.array([[Tile.mean() for Tile in Row] for Row in Expected])
+        Stds = np.array([[Tile.std() for Tile in Row] for Row in Expected])
+        return Statistics["Mean"].shape == (2, 3) and np.allclose(Statistics["Mean"], Means, atol=1e-3) and np.allclose(Statistics["Std"], Stds, atol=1e-2)
+
+    def TestMotion(self):
+        """ Tests only the changed tile scores as moving, and the first frame scores nothing
+
+        Returns:
+        - (bool): True if the change is found in the right tile
+        """
+        Tiles = TileModel(64)
+        Tiles.Update(self.Frame)
+        First = Tiles.MotionScores.copy()
+        Tiles.Update(self.Changed())
+        Expected = np.zeros((2, 3), dtype=bool)
+        Expected[0, 1] = True
+        return not First.any() and np.array_equal(Tiles.MotionScores > 1.0, Expected)
+
+    def TestPersistentChange(self):
+        """ Tests a change that stays is still on the change map after it stops moving
+
+        Returns:
+        - (bool): True if the tile is still changed against the scene but not moving
+        """
+        Tiles = TileModel(64)
+        for i in range(5):
+            Tiles.Update(self.Frame)
+        Changed = self.Changed()
+        Tiles.Update(Changed)
+        Tiles.Update(Changed)
+        return not (Tiles.MotionScores > 1.0).any() and Tiles.ChangeMap[0, 1] > 1.0 and (Tiles.ChangeMap > 1.0).sum() == 1
+
+    def TestBounds(self):
+        """ Tests the rectangle covers every changed tile, ending at the frame's edge
+
+        Returns:
+        - (bool): True if the bounds are right and nothing changed gives None
+        """
+        Tiles = TileModel(64)
+        Tiles.Update(self.Frame)
+        Changed = np.zeros((2, 3), dtype=bool)
+        Changed[0, 1] = Changed[1, 2] = True
+        return Tiles.Bounds(Changed) == (0, 100, 64, 150) and Tiles.Bounds(np.zeros((2, 3), dtype=bool)) is None
+
+    def TestResize(self):
+        """ Tests a new frame size rebuilds the tiles and starts again
+
+        Returns:
+        - (bool): True if the new size gets its own tiles without comparing to the old frames
+        """
+        Tiles = TileModel(64)
+        Tiles.Update(self.Frame)
+        Tiles.Update(np.zeros((200, 200), dtype=np.uint8))
+        return Tiles.MotionScores.shape == (4, 4) and not Tiles.MotionScores.any()
+
+    def RunAllTests(self):
+        """ Run all tests for the tile model
+
+        Returns:
+        - None
+        """
+        Results = {
+            "Statistics": self.TestStatistics(),
+            "Motion": self.TestMotion(),
+            "Persistent Change": self.TestPersistentChange(),
+            "Bounds": self.TestBounds(),
+            "Resize": self.TestResize()
+        }
+
+        Passed = sum(1 for r in Results.values() if r)
+        Total = len(Results)
+
+        print("\nTest Summary:")
+        for Name, Result in Results.items():
+            print(f" - {Name}: {'PASS' if Result else 'FAIL'}")
+
+        print(f"\nFinal Result: {Passed}/{Total} tests passed.")
+
+if __name__ == "__main__":
+    Tests = TileModelTests()
+    Tests.RunAllTests()
@@ -1,4 +1,5 @@
 from Desktop.Background.Metrics.metrics import LogMetrics
+from Desktop.Background.tiles import TileModel
 import cv2
 import numpy as np
 import time
@@ -6,13 +7,33 @@ from skimage.metrics import structural_similarity as ssim
 from collections import deque   
 
 class BackgroundMonitor:
-    def __init__(self):
+    def __init__(self, FlowMode="dense", ProcessingScale=1.0, GridStep=16, SSIMMode="full", SSIMLevels=1, TileGating=False, TileSize=64):
         """ Hybrid (Optical Flow and KNN) computer vision component to determine background changes
 
+        Arguments:
+        - FlowMode (str): dense for Farneback over every pixel, sparse for Lucas-Kanade on corners, grid for Lucas-Kanade on evenly spaced points
+        - ProcessingScale (float): Factor frames are shrunk by before measuring motion
+        - GridStep (int): Spacing in pixels between points in grid mode, after shrinking
+        - SSIMMode (str): full for scikit-image SSIM at full resolution, fast for SSIM on a pyramid level against precomputed reference statistics
+        - SSIMLevels (int): Number of times frames are halved before fast SSIM
+        - TileGating (bool): True to only run optical flow and SSIM over the tiles that changed
+        - TileSize (int): Width and height of a tile in pixels
+
         Attributes:
         - Cap (cv2.VideoCapture): Laptop's camera
         - PrevGrayFrame (np.ndarray): Grayscale frame for Optical Flow
+        - PrevSmallFrame (np.ndarray): Shrunk grayscale frame motion is measured on
+        - FlowMode (str): How motion is measured
+        - ProcessingScale (float): Factor frames are shrunk by before measuring motion
+        - GridStep (int): Spacing between points in grid mode
         - ReferenceFrame (np.ndarray): Frame for SSIM comparison 
+        - ReferenceStatistics (hashmap[str][np.ndarray]): Shrunk reference frame with its local means and variances, for fast SSIM
+        - SSIMMode (str): How SSIM is computed
+        - SSIMLevels (int): Number of times frames are halved before fast SSIM
+        - Tiles (TileModel): Per tile statistics of the scene, None without tile gating
+        - ReferenceTiles (hashmap[str][np.ndarray]): Per tile statistics of the reference frame
+        - FullEvery (int): Frames between full optical flow runs while gating, in case tiles miss slow motion
+        - FramesSinceFull (int): Frames since optical flow last ran over the whole frame
         - LastSSIMCheck (float): Timestamp for last SSIM check
         - LastSSIMScore (float): Latest SSIM score
         - SSIMInterval (float): Delay between SSIM scores
@@ -21,6 +42,7 @@ class BackgroundMonitor:
 
         Raises:
         - RuntimError: Camera not accessible
+        - ValueError: Unknown flow or SSIM mode
 
         Returns:
         - None
@@ -29,8 +51,24 @@ class BackgroundMonitor:
         #if not self.Cap.isOpened():
         #    raise RuntimeError("Error: Camera not found.")
 
+        if FlowMode not in ("dense", "sparse", "grid"):
+            raise ValueError(f"Unknown flow mode {FlowMode}")
+        if SSIMMode not in ("full", "fast"):
+            raise ValueError(f"Unknown SSIM mode {SSIMMode}")
+
         self.PrevGrayFrame = None
+        self.PrevSmallFrame = None
+        self.FlowMode = FlowMode
+        self.ProcessingScale = ProcessingScale
+        self.GridStep = GridStep
         self.ReferenceFrame = None
+        self.ReferenceStatistics = None
+        self.SSIMMode = SSIMMode
+        self.SSIMLevels = SSIMLevels
+        self.Tiles = TileModel(TileSize) if TileGating else None
+        self.ReferenceTiles = None
+        self.FullEvery = 10
+        self.FramesSinceFull = 0
         self.LastSSIMCheck = time.time()
         self.LastSSIMScore = 1.0
         self.SSIMInterval = 5
@@ -73,6 +111,185 @@ class BackgroundMonitor:
 
         return Status
 
+    def Shrink(self, Gray):
+        """ Shrink a grayscale frame to the processing scale
+
+        Arguments:
+        - Gray (np.ndarray): Grayscale frame
+
+        Returns:
+        - (np.ndarray): Shrunk frame, the same frame if the scale is 1
+        """
+        if self.ProcessingScale == 1.0:
+            return Gray
+        return cv2.resize(Gray, None, fx=self.ProcessingScale, fy=self.ProcessingScale, interpolation=cv2.INTER_AREA)
+
+    def ComputeMotion(self, Previous, Current):
+        """ Fraction of the scene moving more than a pixel between two frames
+
+        Arguments:
+        - Previous (np.ndarray): Previous shrunk grayscale frame
+        - Current (np.ndarray): Current shrunk grayscale frame
+
+        Returns:
+        - MotionRatio (float): Fraction of pixels, corners or grid points that moved
+        """
+        # Displacements shrink with the frame, so the one pixel threshold is scaled too
+        Threshold = 1.0 * self.ProcessingScale
+
+        if self.FlowMode == "dense":
+            WindowSize = max(5, int(round(15 * self.ProcessingScale)))
+            Levels = 3 if self.ProcessingScale > 0.5 else 2
+            Flow = cv2.calcOpticalFlowFarneback(
+                Previous, Current, None,
+                0.5, Levels, WindowSize, 3, 5, 1.2, 0
+            )
+            Mag, Ang = cv2.cartToPolar(Flow[..., 0], Flow[..., 1])
+            return float(np.mean(Mag > Threshold))
+
+        if self.FlowMode == "sparse":
+            Points = cv2.goodFeaturesToTrack(Previous, maxCorners=200, qualityLevel=0.01, minDistance=max(3, int(7 * self.ProcessingScale)))
+            if Points is None:
+                return 0.0
+        else:
+            Height, Width = Previous.shape
+            Offset = self.GridStep // 2
+            Xs, Ys = np.meshgrid(np.arange(Offset, Width, self.GridStep), np.arange(Offset, Height, self.GridStep))
+            Points = np.stack([Xs.ravel(), Ys.ravel()], axis=1).astype(np.float32).reshape(-1, 1, 2)
+
+        NextPoints, Status, Error = cv2.calcOpticalFlowPyrLK(
+            Previous, Current, Points, None,
+            winSize=(15, 15), maxLevel=2
+        )
+        Distance = np.linalg.norm((NextPoints - Points).reshape(-1, 2), axis=1)
+        Moved = (Status.ravel() == 1) & (Distance > Threshold)
+        return float(np.mean(Moved))
+
+    def LocalStatistics(self, Gray):
+        """ Shrink a frame to the SSIM pyramid level and compute its local means and variances
+
+        Arguments:
+        - Gray (np.ndarray): Grayscale frame
+
+        Returns:
+        - (hashmap[str][np.ndarray]): Shrunk frame, local means and local variances over 7x7 windows
+        """
+        Small = Gray
+        for Level in range(self.SSIMLevels):
+            Small = cv2.pyrDown(Small)
+        Small = Small.astype(np.float64)
+
+        # Matches scikit-image: 7x7 uniform window with sample covariance
+        CovarianceNorm = 49 / 48
+        Mean = cv2.blur(Small, (7, 7), borderType=cv2.BORDER_REFLECT)
+        Variance = CovarianceNorm * (cv2.blur(Small * Small, (7, 7), borderType=cv2.BORDER_REFLECT) - Mean * Mean)
+        return {"Frame": Small, "Mean": Mean, "Variance": Variance}
+
+    def SetReference(self, Gray):
+        """ Store a new reference frame, precomputing its statistics for fast SSIM
+
+        Arguments:
+        - Gray (np.ndarray): Grayscale frame
+
+        Returns:
+        - None
+        """
+        self.ReferenceFrame = Gray.copy()
+        if self.SSIMMode == "fast":
+            self.ReferenceStatistics = self.LocalStatistics(self.ReferenceFrame)
+        if self.Tiles is not None:
+            self.ReferenceTiles = self.Tiles.Statistics(self.ReferenceFrame)
+
+    def ComputeSSIM(self, Gray, Bounds=None):
+        """ Mean SSIM between the reference frame and the current frame
+
+        Arguments:
+        - Gray (np.ndarray): Grayscale frame
+        - Bounds (tuple[int, int, int, int]): Top, bottom, left and right of the region to compare, None for the whole frame
+
+        Returns:
+        - (float): Mean SSIM score
+        """
+        if Bounds is None:
+            Top, Bottom, Left, Right = 0, Gray.shape[0], 0, Gray.shape[1]
+        else:
+            Top, Bottom, Left, Right = Bounds
+
+        if self.SSIMMode == "full":
+            if Bounds is None:
+                return ssim(self.ReferenceFrame, Gray)
+            return ssim(self.ReferenceFrame[Top:Bottom, Left:Right], Gray[Top:Bottom, Left:Right])
+
+        Reference = self.ReferenceStatistics
+        if Bounds is None:
+            Current = self.LocalStatistics(Gray)
+        else:
+            # Region is aligned to the pyramid so it lines up with the precomputed reference
+            Factor = 2 ** self.SSIMLevels
+            Top, Left = Top // Factor * Factor, Left // Factor * Factor
+            Bottom, Right = Bottom // Factor * Factor, Right // Factor * Factor
+            Reference = {Key: Value[Top // Factor:Bottom // Factor, Left // Factor:Right // Factor] for Key, Value in Reference.items()}
+            Current = self.LocalStatistics(Gray[Top:Bottom, Left:Right])
+
+        CovarianceNorm = 49 / 48
+        Covariance = CovarianceNorm * (cv2.blur(Reference["Frame"] * Current["Frame"], (7, 7), borderType=cv2.BORDER_REFLECT) - Reference["Mean"] * Current["Mean"])
+
+        C1 = (0.01 * 255) ** 2
+        C2 = (0.03 * 255) ** 2
+        Numerator = (2 * Reference["Mean"] * Current["Mean"] + C1) * (2 * Covariance + C2)
+        Denominator = (Reference["Mean"] ** 2 + Current["Mean"] ** 2 + C1) * (Reference["Variance"] + Current["Variance"] + C2)
+        Map = Numerator / Denominator
+        return float(Map[3:-3, 3:-3].mean())
+
+    def GatedSSIM(self, Gray):
+        """ SSIM computed only over tiles that differ from the reference, counting the rest as unchanged
+
+        Arguments:
+        - Gray (np.ndarray): Grayscale frame
+
+        Returns:
+        - (float): Mean SSIM score
+        """
+        Changed = self.Tiles.Scores(self.Tiles.Previous, self.ReferenceTiles) > 1.0
+        if Changed.mean() > 0.5:
+            return self.ComputeSSIM(Gray)
+
+        Bounds = self.Tiles.Bounds(Changed)
+        if Bounds is None:
+            return 1.0
+
+        Top, Bottom, Left, Right = Bounds
+        if Bottom - Top < 7 * 2 ** self.SSIMLevels or Right - Left < 7 * 2 ** self.SSIMLevels:
+            return self.ComputeSSIM(Gray)
+        Area = (Bottom - Top) * (Right - Left) / Gray.size
+        return self.ComputeSSIM(Gray, Bounds) * Area + (1.0 - Area)
+
+    def GatedMotion(self, Previous, Current):
+        """ Optical flow only over tiles that changed since the previous frame, counting the rest as still
+
+        Arguments:
+        - Previous (np.ndarray): Previous shrunk grayscale frame
+        - Current (np.ndarray): Current shrunk grayscale frame
+
+        Returns:
+        - MotionRatio (float): Fraction of the scene that moved
+        """
+        Changed = self.Tiles.MotionScores > 1.0
+        self.FramesSinceFull += 1
+        if self.FramesSinceFull >= self.FullEvery or Changed.mean() > 0.5:
+            self.FramesSinceFull = 0
+            return self.ComputeMotion(Previous, Current)
+
+        Bounds = self.Tiles.Bounds(Changed)
+        if Bounds is None:
+            return 0.0
+
+        Top, Bottom, Left, Right = [int(round(Value * self.ProcessingScale)) for Value in Bounds]
+        if Bottom - Top < 8 or Right - Left < 8:
+            return self.ComputeMotion(Previous, Current)
+        Area = (Bottom - Top) * (Right - Left) / Current.size
+        return self.ComputeMotion(Previous[Top:Bottom, Left:Right], Current[Top:Bottom, Left:Right]) * Area
+
     def ProcessFrame(self, Frame):
         """ Extracts Brightness, SSIM, and Motion values from current frame
         
@@ -87,34 +304,40 @@ class BackgroundMonitor:
             - MeanBrightness (float): Frame average brightness
         """
         Gray = cv2.cvtColor(Frame, cv2.COLOR_BGR2GRAY)
+        if self.Tiles is not None:
+            self.Tiles.Update(Gray)
 
         if self.PrevGrayFrame is None:
             self.PrevGrayFrame = Gray
             if self.ReferenceFrame is None:
-                self.ReferenceFrame = Gray.copy()
+                self.SetReference(Gray)
                 self.LastSSIMScore = 1.0
             return "Initialising", 0.0, self.LastSSIMScore, float(np.mean(Gray))
 
-        Flow = cv2.calcOpticalFlowFarneback(
-            self.PrevGrayFrame, Gray, None,
-            0.5, 3, 15, 3, 5, 1.2, 0
-        )
+        Small = self.Shrink(Gray)
+        if self.PrevSmallFrame is None or self.PrevSmallFrame.shape != Small.shape:
+            self.PrevSmallFrame = self.Shrink(self.PrevGrayFrame)
+        if self.Tiles is not None:
+            MotionRatio = self.GatedMotion(self.PrevSmallFrame, Small)
+        else:
+            MotionRatio = self.ComputeMotion(self.PrevSmallFrame, Small)
         self.PrevGrayFrame = Gray
-
-        Mag, Ang = cv2.cartToPolar(Flow[..., 0], Flow[..., 1])
-        MotionRatio = float(np.mean(Mag > 1.0))
+        self.PrevSmallFrame = Small
 
         MeanBrightness = float(np.mean(Gray))
 
         CurrentTime = time.time()
         if self.ReferenceFrame is None:
-            self.ReferenceFrame = Gray.copy()
+            self.SetReference(Gray)
             self.LastSSIMScore = 1.0
 
         if CurrentTime - self.LastSSIMCheck > self.SSIMInterval:
             self.LastSSIMCheck = CurrentTime
             try:
-                SSIMScore, _ = ssim(self.ReferenceFrame, Gray, full=True)
+                if self.Tiles is not None:
+                    SSIMScore = self.GatedSSIM(Gray)
+                else:
+                    SSIMScore = self.ComputeSSIM(Gray)
             except Exception:
                 SSIMScore = self.LastSSIMScore
             self.LastSSIMScore = float(SSIMScore)
@@ -125,7 +348,7 @@ class BackgroundMonitor:
                 self.StableCount = 0
 
             if getattr(self, "StableCount", 0) >= 3:
-                self.ReferenceFrame = Gray.copy()
+                self.SetReference(Gray)
                 self.StableCount = 0
 
         Status = self.GetStatus(MotionRatio, MeanBrightness)
@@ -0,0 +1,146 @@
+import cv2
+import numpy as np
+
+class TileModel:
+    def __init__(self, TileSize=64, Alpha=0.05, MeanTolerance=4.0, StdTolerance=4.0, EdgeTolerance=4.0):
+        """ Splits the scene into tiles and keeps running brightness, contrast and edge statistics for each
+
+        Arguments:
+        - TileSize (int): Width and height of a tile in pixels, edge tiles take the remainder
+        - Alpha (float): Weight of the newest frame in the running statistics
+        - MeanTolerance (float): Change in tile brightness counted as one unit of change
+        - StdTolerance (float): Change in tile contrast counted as one unit of change
+        - EdgeTolerance (float): Change in tile edge strength counted as one unit of change
+
+        Attributes:
+        - TileSize (int): Width and height of a tile in pixels
+        - Alpha (float): Weight of the newest frame in the running statistics
+        - Tolerances (tuple[float, float, float]): Brightness, contrast and edge tolerances
+        - Shape (tuple[int, int]): Height and width of the frames the tiles were built for
+        - RowStarts (np.ndarray): First pixel row of each tile row
+        - ColStarts (np.ndarray): First pixel column of each tile column
+        - Counts (np.ndarray): Pixels in each tile
+        - Previous (hashmap[str][np.ndarray]): Statistics of the previous frame
+        - Running (hashmap[str][np.ndarray]): Running statistics of the scene
+        - MotionScores (np.ndarray): Change of each tile since the previous frame, above 1 means changed
+        - ChangeMap (np.ndarray): Change of each tile against the running statistics, above 1 means changed
+
+        Returns:
+        - None
+        """
+        self.TileSize = TileSize
+        self.Alpha = Alpha
+        self.Tolerances = (MeanTolerance, StdTolerance, EdgeTolerance)
+        self.Shape = None
+        self.RowStarts = None
+        self.ColStarts = None
+        self.Counts = None
+        self.Previous = None
+        self.Running = None
+        self.MotionScores = None
+        self.ChangeMap = None
+
+    def Build(self, Shape):
+        """ Work out the tile boundaries for a frame size
+
+        Arguments:
+        - Shape (tuple[int, int]): Height and width of the frames
+
+        Returns:
+        - None
+        """
+        Height, Width = Shape
+        self.Shape = Shape
+        self.RowStarts = np.arange(0, Height, self.TileSize)
+        self.ColStarts = np.arange(0, Width, self.TileSize)
+        RowSizes = np.diff(np.append(self.RowStarts, Height))
+        ColSizes = np.diff(np.append(self.ColStarts, Width))
+        self.Counts = np.outer(RowSizes, ColSizes).astype(np.float64)
+        self.Previous = None
+        self.Running = None
+
+    def TileMean(self, Values):
+        """ Average of a per pixel array over each tile
+
+        Arguments:
+        - Values (np.ndarray): Per pixel values
+
+        Returns:
+        - (np.ndarray): Average of each tile, one entry per tile
+        """
+        Sums = np.add.reduceat(np.add.reduceat(Values, self.RowStarts, axis=0), self.ColStarts, axis=1)
+        return Sums / self.Counts
+
+    def Statistics(self, Gray):
+        """ Brightness, contrast and edge strength of each tile
+
+        Arguments:
+        - Gray (np.ndarray): Grayscale frame
+
+        Returns:
+        - (hashmap[str][np.ndarray]): Mean, standard deviation and edge strength of each tile
+        """
+        if self.Shape != Gray.shape[:2]:
+            self.Build(Gray.shape[:2])
+
+        Pixels = Gray.astype(np.float32)
+        Mean = self.TileMean(Pixels)
+        Variance = np.maximum(self.TileMean(Pixels * Pixels) - Mean * Mean, 0.0)
+        Edges = np.abs(cv2.Sobel(Pixels, cv2.CV_32F, 1, 0, ksize=3)) + np.abs(cv2.Sobel(Pixels, cv2.CV_32F, 0, 1, ksize=3))
+        return {"Mean": Mean, "Std": np.sqrt(Variance), "Edge": self.TileMean(Edges)}
+
+    def Scores(self, Current, Previous):
+        """ Change of each tile between two sets of statistics
+
+        Arguments:
+        - Current (hashmap[str][np.ndarray]): Newer statistics
+        - Previous (hashmap[str][np.ndarray]): Older statistics
+
+        Returns:
+        - (np.ndarray): Largest change in tolerance units, above 1 means changed
+        """
+        MeanTolerance, StdTolerance, EdgeTolerance = self.Tolerances
+        return np.maximum.reduce([
+            np.abs(Current["Mean"] - Previous["Mean"]) / MeanTolerance,
+            np.abs(Current["Std"] - Previous["Std"]) / StdTolerance,
+            np.abs(Current["Edge"] - Previous["Edge"]) / EdgeTolerance,
+        ])
+
+    def Update(self, Gray):
+        """ Add a frame, scoring each tile against the previous frame and the running statistics
+
+        Arguments:
+        - Gray (np.ndarray): Grayscale frame
+
+        Returns:
+        - Current (hashmap[str][np.ndarray]): Statistics of the frame
+        """
+        Current = self.Statistics(Gray)
+        if self.Previous is None:
+            self.MotionScores = np.zeros_like(Current["Mean"])
+            self.ChangeMap = np.zeros_like(Current["Mean"])
+            self.Running = {Key: Value.copy() for Key, Value in Current.items()}
+        else:
+            self.MotionScores = self.Scores(Current, self.Previous)
+            self.ChangeMap = self.Scores(Current, self.Running)
+            for Key, Value in Current.items():
+                self.Running[Key] += self.Alpha * (Value - self.Running[Key])
+        self.Previous = Current
+        return Current
+
+    def Bounds(self, Changed):
+        """ Pixel rectangle covering every changed tile
+
+        Arguments:
+        - Changed (np.ndarray): True for each changed tile
+
+        Returns:
+        - (tuple[int, int, int, int]): Top, bottom, left and right pixel bounds, None if nothing changed
+        """
+        Rows, Cols = np.nonzero(Changed)
+        if len(Rows) == 0:
+            return None
+        Height, Width = self.Shape
+        RowEnds = np.append(self.RowStarts[1:], Height)
+        ColEnds = np.append(self.ColStarts[1:], Width)
+        return (int(self.RowStarts[Rows.min()]), int(RowEnds[Rows.max()]), int(self.ColStarts[Cols.min()]), int(ColEnds[Cols.max()]))
@@ -1,8 +1,9 @@
-import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import os
 from matplotlib.patches import Patch
+from Desktop.Main.experimentStore import ExperimentStore
+from Desktop.Main.plotSegments import EncodeStatus, RunLengths, DrawSpans
 
 class MetricsVisualiser:
     def __init__(self):
@@ -12,6 +13,7 @@ class MetricsVisualiser:
         - Methods (hashmap[str][str]): All implementations and full names
         - Scenarios (list[str]): Name of all situations tested on
         - OutputDirectory (str): Where PNGs are saved
+        - Experiments (hashmap[tuple[str, str]][pd.DataFrame]): Every method and scenario, read in one scan
 
         Returns:
         - None
@@ -23,8 +25,9 @@ class MetricsVisualiser:
         }
 
         self.Scenarios = ["Behind", "Hiding", "Moving", "Object", "Standing"]
-        self.OutputDirectory = "Plots"
+        self.OutputDirectory = os.path.join(os.path.dirname(__file__), "Plots")
         os.makedirs(self.OutputDirectory, exist_ok=True)
+        self.Experiments = ExperimentStore().Load("Lingering", Methods=list(self.Methods), Scenarios=self.Scenarios)
 
     def LoadCSV(self, Method, Scenario):
         """ Returns recorded CSV as a dataframe
@@ -34,10 +37,9 @@ class MetricsVisualiser:
         - Scenario (str): Situation implementation was tested in
 
         Returns:
-        - pd.DataFrame: Data from CSV file
+        - pd.DataFrame: Data from CSV file, copied so plotting can add columns
         """
-        FileName = f"{Method} - {Scenario}.csv"
-        return pd.read_csv(FileName)
+        return self.Experiments[(Method, Scenario)].copy()
 
     def StatusToNumeric(self, Status):
         """ Convert the status of monitor to a numeric value
@@ -83,7 +85,7 @@ class MetricsVisualiser:
         Returns:
         - None
         """
-        DF["StatusNumeric"] = DF["Status"].apply(self.StatusToNumeric)
+        DF["StatusNumeric"] = EncodeStatus(DF["Status"], self.StatusToNumeric)
 
         Frames = len(DF)
         Seconds = DF["FrameNumber"] 
@@ -93,19 +95,12 @@ class MetricsVisualiser:
             Ax.plot(Seconds, Expected + 0.05, linestyle="--", linewidth=2, color="#AA00FF", alpha=0.6, label="Expected")
 
         Ax.plot(Seconds, DF["StatusNumeric"], linewidth=2, alpha=0.9, label="Achieved", color="tab:blue")
-        NoPersonMask = DF["Status"].str.lower().str.contains("no", na=False)
-        for i in np.where(NoPersonMask)[0]:
-            Time = Seconds.iloc[i]
-            Ax.axvspan(Time - 0.5, Time + 0.5, color="red", alpha=0.12)
-        PresentMask = DF["PersonDetected"] == 1
-        if PresentMask.any():
-            Segments = np.where(PresentMask)[0]
-            Start = Segments[0]
-            for i in range(1, len(Segments)):
-                if Segments[i] != Segments[i - 1] + 1:
-                    Ax.hlines(-0.2, DF["FrameNumber"].iloc[Start], DF["FrameNumber"].iloc[Segments[i - 1]], linewidth=5, color="black") 
-                    Start = Segments[i]
-            Ax.hlines(-0.2, DF["FrameNumber"].iloc[Start], DF["FrameNumber"].iloc[Segments[-1]], linewidth=5, color="black")
+        NoPersonMask = DF["Status"].str.lower().str.contains("no", na=False).to_numpy()
+        DrawSpans(Ax, Seconds.to_numpy(), NoPersonMask, color="red", alpha=0.12)
+        Starts, Ends = RunLengths((DF["PersonDetected"] == 1).to_numpy())
+        if len(Starts):
+            FrameNumbers = DF["FrameNumber"].to_numpy()
+            Ax.hlines(np.full(len(Starts), -0.2), FrameNumbers[Starts], FrameNumbers[Ends], linewidth=5, color="black")
 
         Ax.set_title(Title, fontsize=13, weight="bold")
         Ax.set_ylabel("Status")
@@ -1,11 +1,8 @@
-import csv
 import os
+from Desktop.Main.metricsSink import GetSink
 
 LogFile = os.path.join(os.path.dirname(__file__), "LingeringLog.csv")
-if not os.path.exists(LogFile):
-    with open(LogFile, "w", newline="") as File:
-        writer = csv.writer(File)
-        writer.writerow(["FrameNumber", "PersonDetected", "Confidence", "DwellTime", "Status"])
+Sink = GetSink(LogFile, ["FrameNumber", "PersonDetected", "Confidence", "DwellTime", "Status"], ["int64", "int64", "float64", "float64", "string"])
 
 def SafeCasting(Metric, Cast, Default):
     """ Casting values safely in case values aren't recorded due to issue with the model
@@ -41,6 +38,4 @@ def LogLingering(FrameNumber, PersonDetected, Confidence, DwellTime, Status):
     DwellTime = SafeCasting(DwellTime, float, 0.0)
     Status = SafeCasting(Status, str, "Unknown")
 
-    with open(LogFile, "a", newline="") as File:
-        writer = csv.writer(File)
-        writer.writerow([int(FrameNumber) if FrameNumber is not None else None, PersonDetected, round(Confidence, 3), round(DwellTime, 2), Status])
\ No newline at end of file
+    Sink.Write([int(FrameNumber) if FrameNumber is not None else None, PersonDetected, round(Confidence, 3), round(DwellTime, 2), Status])
\ No newline at end of file
@@ -4,9 +4,12 @@ import mediapipe as mp
 import time
 
 class LingeringMonitor:
-    def __init__(self):
+    def __init__(self, Pose=None):
         """ Initialise lingering detection
 
+        Arguments:
+        - Pose (mediapipe.python.solutions.pose.Pose): Shared pose estimation model, created if not provided
+
         Attributes:
         - Cap (cv2.VideoCapture): Current camera feed
         - MpPose (module): Mediapipes pose module
@@ -28,7 +31,9 @@ class LingeringMonitor:
         #    raise RuntimeError("Camera not accessible.")
 
         self.MpPose = mp.solutions.pose
-        self.Pose = self.MpPose.Pose(model_complexity=0, min_detection_confidence=0.5, min_tracking_confidence=0.5)
+        if Pose is None:
+            Pose = self.MpPose.Pose(model_complexity=0, min_detection_confidence=0.5, min_tracking_confidence=0.5)
+        self.Pose = Pose
         self.LoiteringThreshold = 10
         self.MaxFrames = 60000
         self.PersonDetected = False
@@ -117,18 +122,22 @@ class LingeringMonitor:
             return False 
         return True
 
-    def Live(self, Frame):
+    def Live(self, Frame, Context=None):
         """ Live implementation for constant running of the system
 
         Arguments:
         - Frame (np.ndarray): Current frame captured
+        - Context (FrameContext): Shared model outputs for the current frame
 
         Returns:
         - FinalResult (bool): True if loitering else false
         """
         self.FrameNumber += 1
-        RGB = cv2.cvtColor(Frame, cv2.COLOR_BGR2RGB)
-        Result = self.Pose.process(RGB)
+        if Context is not None:
+            Result = Context.PoseResults()
+        else:
+            RGB = cv2.cvtColor(Frame, cv2.COLOR_BGR2RGB)
+            Result = self.Pose.process(RGB)
         Status, Colour, DwellTime = self.ProcessFrame(Result)
         FinalResult = self.GetDisplay(Status, Frame, Colour)
         return FinalResult
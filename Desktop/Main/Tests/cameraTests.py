@@ -0,0 +1,138 @@
+import os
+import time
+import shutil
+import tempfile
+import cv2
+import numpy as np
+from Desktop.Main.camera import CameraManager
+
+class CameraManagerTests:
+    def __init__(self, Frames=10):
+        """ Record a short video to read instead of a camera
+
+        Arguments:
+        - Frames (int): Number of frames recorded
+
+        Attributes:
+        - Directory (str): Temporary folder of the recording
+        - Path (str): Recorded video, opened like a camera
+        - Frames (int): Number of frames recorded
+
+        Returns:
+        - None
+        """
+        self.Directory = tempfile.mkdtemp()
+        self.Path = os.path.join(self.Directory, "Recording.avi")
+        self.Frames = Frames
+        Writer = cv2.VideoWriter(self.Path, cv2.VideoWriter_fourcc(*"MJPG"), 10, (64, 48))
+        for Index in range(Frames):
+            Writer.write(np.full((48, 64, 3), Index * 20, dtype=np.uint8))
+        Writer.release()
+
+    def ReadAll(self, Camera, Timeout=5.0):
+        """ Wait until the capture thread has read every recorded frame
+
+        Arguments:
+        - Camera (CameraManager): Camera reading the recording
+        - Timeout (float): Seconds to wait
+
+        Returns:
+        - (bool): True if every frame was read in time
+        """
+        End = time.time() + Timeout
+        while time.time() < End:
+            Latest = Camera.Latest()
+            if Latest is not None and Latest.Sequence == self.Frames:
+                return True
+            time.sleep(0.01)
+        return False
+
+    def TestRingBuffer(self):
+        """ Tests only the most recent frames are kept, oldest first
+
+        Returns:
+        - (bool): True if the buffer holds the last frames in order
+        """
+        Camera = CameraManager(self.Path, BufferSize=4)
+        Done = self.ReadAll(Camera)
+        Sequences = [Captured.Sequence for Captured in Camera.Buffer]
+        Camera.Release()
+        return Done and Sequences == [7, 8, 9, 10]
+
+    def TestSince(self):
+        """ Tests consumers only get frames newer than the last one they saw
+
+        Returns:
+        - (bool): True if every buffered frame is newer than the start and none are newer than the latest
+        """
+        Camera = CameraManager(self.Path, BufferSize=4)
+        Done = self.ReadAll(Camera)
+        Everything = Camera.Since(0.0)
+        Nothing = Camera.Since(Camera.Latest().Timestamp)
+        Camera.Release()
+        return Done and len(Everything) == 4 and Nothing == []
+
+    def TestResize(self):
+        """ Tests each resolution is resized once and shared between consumers
+
+        Returns:
+        - (bool): True if resized frames have the right shape and are reused
+        """
+        Camera = CameraManager(self.Path, Size=(32, 24))
+        Done = self.ReadAll(Camera)
+        Default = Camera.GetFrame()
+        Again = Camera.GetFrame()
+        Larger = Camera.GetFrame(Size=(128, 96))
+        Camera.Release()
+        return Done and Default.shape == (24, 32, 3) and Again is Default and Larger.shape == (96, 128, 3)
+
+    def TestRelease(self):
+        """ Tests releasing stops the capture thread
+
+        Returns:
+        - (bool): True if the thread has finished
+        """
+        Camera = CameraManager(self.Path)
+        Camera.GetFrame()
+        Camera.Release()
+        return not Camera.Thread.is_alive()
+
+    def TestMissingCamera(self):
+        """ Tests a camera that can't be opened raises an error
+
+        Returns:
+        - (bool): True if RuntimeError is raised
+        """
+        try:
+            CameraManager(os.path.join(self.Directory, "Missing.avi"))
+        except RuntimeError:
+            return True
+        return False
+
+    def RunAllTests(self):
+        """ Run all tests for the camera manager
+
+        Returns:
+        - None
+        """
+        Results = {
+            "Ring Buffer": self.TestRingBuffer(),
+            "Since": self.TestSince(),
+            "Resize": self.TestResize(),
+            "Release": self.TestRelease(),
+            "Missing Camera": self.TestMissingCamera()
+        }
+        shutil.rmtree(self.Directory, ignore_errors=True)
+
+        Passed = sum(1 for r in Results.values() if r)
+        Total = len(Results)
+
+        print("\nTest Summary:")
+        for Name, Result in Results.items():
+            print(f" - {Name}: {'PASS' if Result else 'FAIL'}")
+
+        print(f"\nFinal Result: {Passed}/{Total} tests passed.")
+
+if __name__ == "__main__":
+    Tests = CameraManagerTests()
+    Tests.RunAllTests()
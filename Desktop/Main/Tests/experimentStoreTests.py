@@ -0,0 +1,139 @@
+import os
+import shutil
+import tempfile
+import pandas as pd
+from Desktop.Main.experimentStore import ExperimentStore
+
+class ExperimentStoreTests:
+    def __init__(self):
+        """ Create a temporary metrics folder of experiment CSVs and a store reading it
+
+        Attributes:
+        - Directory (str): Temporary folder for the CSVs and the dataset
+        - Metrics (str): Folder of experiment CSVs
+        - Experiments (hashmap[str][pd.DataFrame]): Rows written to each CSV, by file name
+
+        Returns:
+        - None
+        """
+        self.Directory = tempfile.mkdtemp()
+        self.Metrics = os.path.join(self.Directory, "Metrics")
+        os.makedirs(self.Metrics)
+        self.Experiments = {
+            "PE - Standing.csv": pd.DataFrame({
+                "FrameNumber": [1, 2, 3],
+                "Status": ["PRESENT", "LINGERING", "NO PERSON"],
+                "DwellTime": [0.0, 1.5, 0.0]
+            }),
+            "PE - Hiding.csv": pd.DataFrame({
+                "Status": ["NO PERSON", "PRESENT"],
+                "FrameNumber": [1, 2],
+                "Confidence": [None, 0.75]
+            }),
+            "Occlusion MaskLog.csv": pd.DataFrame({
+                "FrameNumber": [1, 2],
+                "Status": ["MASK DETECTED", "NO DETECTION"],
+                "Masked": [True, False]
+            })
+        }
+        for Name, DF in self.Experiments.items():
+            DF.to_csv(os.path.join(self.Metrics, Name), index=False)
+
+    def Store(self):
+        """ Store reading the temporary metrics folder into a fresh dataset
+
+        Returns:
+        - (ExperimentStore): Store for the Lingering monitor
+        """
+        Root = tempfile.mkdtemp(dir=self.Directory)
+        Store = ExperimentStore(Root)
+        Store.Sources = {"Lingering": self.Metrics}
+        return Store
+
+    def TestRoundTrip(self):
+        """ Tests every experiment reads back with its CSV's rows, column order and dtypes
+
+        Returns:
+        - (bool): True if each experiment matches reading its CSV directly
+        """
+        Loaded = self.Store().Load("Lingering")
+        Expected = {
+            ("PE", "Standing"): "PE - Standing.csv",
+            ("PE", "Hiding"): "PE - Hiding.csv",
+            ("Occlusion", "All"): "Occlusion MaskLog.csv"
+        }
+        return set(Loaded) == set(Expected) and all(
+            Loaded[Key].equals(pd.read_csv(os.path.join(self.Metrics, Name))) for Key, Name in Expected.items()
+        )
+
+    def TestColumnPruning(self):
+        """ Tests only the requested columns are read, ignoring columns no experiment logged
+
+        Returns:
+        - (bool): True if each experiment holds just the requested columns it has
+        """
+        Loaded = self.Store().Load("Lingering", Columns=["Status", "DwellTime", "Missing"])
+        return (
+            list(Loaded[("PE", "Standing")].columns) == ["Status", "DwellTime"]
+            and list(Loaded[("PE", "Hiding")].columns) == ["Status"]
+            and Loaded[("PE", "Standing")]["Status"].tolist() == ["PRESENT", "LINGERING", "NO PERSON"]
+        )
+
+    def TestFilters(self):
+        """ Tests only the requested methods and scenarios are read
+
+        Returns:
+        - (bool): True if the other experiments are left out
+        """
+        Store = self.Store()
+        Methods = Store.Load("Lingering", Methods=["PE"])
+        Scenarios = Store.Load("Lingering", Methods=["PE"], Scenarios=["Hiding"])
+        return set(Methods) == {("PE", "Standing"), ("PE", "Hiding")} and set(Scenarios) == {("PE", "Hiding")}
+
+    def TestRebuild(self):
+        """ Tests the dataset is only rebuilt when a CSV is added or changed
+
+        Returns:
+        - (bool): True if changes are picked up and an unchanged folder isn't stale
+        """
+        Store = self.Store()
+        Store.Load("Lingering")
+        Fresh = not Store.Stale("Lingering")
+
+        Path = os.path.join(self.Metrics, "PE - Moving.csv")
+        pd.DataFrame({"FrameNumber": [1], "Status": ["PRESENT"]}).to_csv(Path, index=False)
+        Added = Store.Stale("Lingering") and ("PE", "Moving") in Store.Load("Lingering")
+
+        pd.DataFrame({"FrameNumber": [1, 2], "Status": ["PRESENT", "PRESENT"]}).to_csv(Path, index=False)
+        Modified = os.path.getmtime(Path) + 10
+        os.utime(Path, (Modified, Modified))
+        Changed = Store.Stale("Lingering") and len(Store.Load("Lingering")[("PE", "Moving")]) == 2
+        os.remove(Path)
+        return Fresh and Added and Changed
+
+    def RunAllTests(self):
+        """ Run all tests for the experiment store
+
+        Returns:
+        - None
+        """
+        Results = {
+            "Round Trip": self.TestRoundTrip(),
+            "Column Pruning": self.TestColumnPruning(),
+            "Filters": self.TestFilters(),
+            "Rebuild": self.TestRebuild()
+        }
+        shutil.rmtree(self.Directory, ignore_errors=True)
+
+        Passed = sum(1 for r in Results.values() if r)
+        Total = len(Results)
+
+        print("\nTest Summary:")
+        for Name, Result in Results.items():
+            print(f" - {Name}: {'PASS' if Result else 'FAIL'}")
+
+        print(f"\nFinal Result: {Passed}/{Total} tests passed.")
+
+if __name__ == "__main__":
+    Tests = ExperimentStoreTests()
+    Tests.RunAllTests()
@@ -0,0 +1,190 @@
+import time
+import threading
+import numpy as np
+from types import SimpleNamespace
+from Desktop.Main.frameContext import FrameContext
+
+class CountingPose:
+    def __init__(self, Delay=0.0):
+        """ Pose model stand in counting how often it runs
+
+        Arguments:
+        - Delay (float): Seconds each run takes
+
+        Attributes:
+        - Calls (int): Number of runs
+        - Delay (float): Seconds each run takes
+
+        Returns:
+        - None
+        """
+        self.Calls = 0
+        self.Delay = Delay
+
+    def process(self, Frame):
+        """ Count the run and return empty landmarks
+
+        Arguments:
+        - Frame (np.ndarray): RGB frame
+
+        Returns:
+        - (SimpleNamespace): Output without landmarks
+        """
+        self.Calls += 1
+        time.sleep(self.Delay)
+        return SimpleNamespace(pose_landmarks=None)
+
+class Tensor:
+    def __init__(self, Array):
+        """ Detection tensor stand in
+
+        Arguments:
+        - Array (np.ndarray): Values held
+
+        Attributes:
+        - Array (np.ndarray): Values held
+
+        Returns:
+        - None
+        """
+        self.Array = Array
+
+    def __getitem__(self, Index):
+        """ Select rows
+
+        Arguments:
+        - Index (np.ndarray): Rows kept
+
+        Returns:
+        - (Tensor): Selected rows
+        """
+        return Tensor(self.Array[Index])
+
+    def cpu(self):
+        """ Tensor on the cpu
+
+        Returns:
+        - (Tensor): Itself
+        """
+        return self
+
+    def numpy(self):
+        """ Values as an array
+
+        Returns:
+        - (np.ndarray): Values held
+        """
+        return self.Array
+
+class FrameContextTests:
+    def __init__(self):
+        """ Create a blank frame to share
+
+        Attributes:
+        - Frame (np.ndarray): Blank BGR frame
+
+        Returns:
+        - None
+        """
+        self.Frame = np.zeros((48, 64, 3), dtype=np.uint8)
+
+    def TestOncePerFrame(self):
+        """ Tests pose runs once for every monitor asking on the same frame, and again on a new frame
+
+        Returns:
+        - (bool): True if pose runs once per frame
+        """
+        Pose = CountingPose()
+        Context = FrameContext(Pose=Pose)
+        Context.Update(self.Frame)
+        First = Context.PoseResults()
+        Same = Context.PoseResults() is First
+        Context.Update(self.Frame)
+        Context.PoseResults()
+        return Same and Pose.Calls == 2
+
+    def TestConcurrent(self):
+        """ Tests monitors asking at once on different threads share one run
+
+        Returns:
+        - (bool): True if pose runs once
+        """
+        Pose = CountingPose(Delay=0.05)
+        Context = FrameContext(Pose=Pose)
+        Context.Update(self.Frame)
+        Threads = [threading.Thread(target=Context.PoseResults) for i in range(4)]
+        for Thread in Threads:
+            Thread.start()
+        for Thread in Threads:
+            Thread.join()
+        return Pose.Calls == 1
+
+    def TestPeek(self):
+        """ Tests peeking only returns results computed for the current frame
+
+        Returns:
+        - (bool): True if nothing is returned before computing or after a new frame
+        """
+        Context = FrameContext()
+        Context.Update(self.Frame)
+        Before = Context.Peek("Value")
+        Context.Get("Value", lambda Frame: 1)
+        During = Context.Peek("Value")
+        Context.Update(self.Frame)
+        return Before is None and During == 1 and Context.Peek("Value") is None
+
+    def TestStaleResult(self):
+        """ Tests a result finished after the frame changed isn't kept for the new frame
+
+        Returns:
+        - (bool): True if the new frame computes its own result
+        """
+        Context = FrameContext()
+        Context.Update(self.Frame)
+        def Compute(Frame):
+            Context.Update(self.Frame)
+            return "Old"
+        Old = Context.Get("Value", Compute)
+        return Old == "Old" and Context.Get("Value", lambda Frame: "New") == "New"
+
+    def TestPersonBoxes(self):
+        """ Tests only person boxes are kept from the detections
+
+        Returns:
+        - (bool): True if the other classes are dropped
+        """
+        Boxes = SimpleNamespace(
+            xyxy=Tensor(np.array([[0, 0, 10, 10], [5, 5, 20, 20], [1, 1, 2, 2]], dtype=np.float32)),
+            cls=np.array([0, 2, 0], dtype=np.float32)
+        )
+        Yolo = lambda Frame, verbose=False: [SimpleNamespace(boxes=Boxes)]
+        Context = FrameContext(Yolo=Yolo)
+        Context.Update(self.Frame)
+        return Context.PersonBoxes().tolist() == [[0, 0, 10, 10], [1, 1, 2, 2]]
+
+    def RunAllTests(self):
+        """ Run all tests for the shared frame context
+
+        Returns:
+        - None
+        """
+        Results = {
+            "Once Per Frame": self.TestOncePerFrame(),
+            "Concurrent": self.TestConcurrent(),
+            "Peek": self.TestPeek(),
+            "Stale Result": self.TestStaleResult(),
+            "Person Boxes": self.TestPersonBoxes()
+        }
+
+        Passed = sum(1 for r in Results.values() if r)
+        Total = len(Results)
+
+        print("\nTest Summary:")
+        for Name, Result in Results.items():
+            print(f" - {Name}: {'PASS' if Result else 'FAIL'}")
+
+        print(f"\nFinal Result: {Passed}/{Total} tests passed.")
+
+if __name__ == "__main__":
+    Tests = FrameContextTests()
+    Tests.RunAllTests()
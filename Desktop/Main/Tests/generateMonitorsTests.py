@@ -0,0 +1,172 @@
+import time
+import threading
+from Desktop.Main.generateMonitors import MonitorRegistry
+from Desktop.Main.scheduler import MonitorScheduler
+
+class StubMonitor:
+    def __init__(self):
+        """ Monitor or shared model stand in recording when it's released
+
+        Attributes:
+        - Released (bool): True once released or closed
+
+        Returns:
+        - None
+        """
+        self.Released = False
+
+    def Release(self):
+        """ Release the monitor
+
+        Returns:
+        - None
+        """
+        self.Released = True
+
+    def close(self):
+        """ Close the shared model
+
+        Returns:
+        - None
+        """
+        self.Released = True
+
+class MonitorRegistryTests:
+    def Registry(self, Scheduler, *Names):
+        """ Registry holding stand ins instead of building the real monitors
+
+        Arguments:
+        - Scheduler (MonitorScheduler): Runs the monitors
+        - Names (list[str]): Monitors and shared models already built
+
+        Returns:
+        - (MonitorRegistry): Registry with the stand ins
+        """
+        Registry = MonitorRegistry(Scheduler)
+        for Name in Names:
+            Registry.Monitors[Name] = StubMonitor()
+            if Name in ("Pose", "Yolo"):
+                setattr(Registry.Context, Name, Registry.Monitors[Name])
+        return Registry
+
+    def WaitFor(self, Condition, Timeout=5.0):
+        """ Wait until a condition holds or the timeout passes
+
+        Arguments:
+        - Condition (function): Returns true once done
+        - Timeout (float): Seconds to wait
+
+        Returns:
+        - (bool): True if the condition held in time
+        """
+        End = time.time() + Timeout
+        while time.time() < End:
+            if Condition():
+                return True
+            time.sleep(0.01)
+        return Condition()
+
+    def TestImmediate(self):
+        """ Tests a monitor with no running task is released straight away along with its unused shared model
+
+        Returns:
+        - (bool): True if both are released and the context no longer holds the model
+        """
+        Scheduler = MonitorScheduler()
+        Registry = self.Registry(Scheduler, "Mask", "Yolo")
+        Mask, Yolo = Registry.Monitors["Mask"], Registry.Monitors["Yolo"]
+        Registry.Release("Mask")
+        Scheduler.Release()
+        return Mask.Released and Yolo.Released and not Registry.Monitors and Registry.Context.Yolo is None
+
+    def TestDeferred(self):
+        """ Tests a monitor whose late task is still running is only released once the task finishes
+
+        Returns:
+        - (bool): True if the monitor is kept while running and released after
+        """
+        Scheduler = MonitorScheduler(Deadline=0.01)
+        Registry = self.Registry(Scheduler, "Mask", "Yolo")
+        Mask = Registry.Monitors["Mask"]
+        Finish = threading.Event()
+        Scheduler.Submit({"Mask": lambda: Finish.wait(5)})
+        Scheduler.Collect()
+        Registry.Release("Mask")
+        Kept = not Mask.Released and "Mask" in Registry.Deferred and "Yolo" in Registry.Monitors
+        Finish.set()
+        Released = self.WaitFor(lambda: Mask.Released and not Registry.Monitors)
+        Scheduler.Release()
+        return Kept and Released and not Registry.Deferred
+
+    def TestEnabledAgain(self):
+        """ Tests a monitor enabled again before its late task finishes isn't released
+
+        Returns:
+        - (bool): True if the monitor survives the task finishing
+        """
+        Scheduler = MonitorScheduler(Deadline=0.01)
+        Registry = self.Registry(Scheduler, "Mask", "Yolo")
+        Mask = Registry.Monitors["Mask"]
+        Finish = threading.Event()
+        Scheduler.Submit({"Mask": lambda: Finish.wait(5)})
+        Scheduler.Collect()
+        Registry.Enable({"Mask": False})
+        Enabled = Registry.Enable({"Mask": True})
+        Finished = Scheduler.Running["Mask"]
+        Finish.set()
+        Finished.result(timeout=5)
+        time.sleep(0.05)
+        Scheduler.Release()
+        return Enabled == {"Mask": Mask} and not Mask.Released and "Mask" in Registry.Monitors
+
+    def TestSharedModel(self):
+        """ Tests a shared model is kept until the last monitor using it is released
+
+        Returns:
+        - (bool): True if pose outlives the first monitor and is closed with the second
+        """
+        Registry = self.Registry(None, "Loitering", "Proximity", "Pose", "Yolo")
+        Pose = Registry.Monitors["Pose"]
+        Registry.Release("Loitering")
+        Kept = not Pose.Released and Registry.Context.Pose is Pose
+        Registry.Release("Proximity")
+        return Kept and Pose.Released and Registry.Context.Pose is None and not Registry.Monitors
+
+    def TestUnknown(self):
+        """ Tests an unknown monitor can't be built
+
+        Returns:
+        - (bool): True if KeyError is raised
+        """
+        try:
+            MonitorRegistry().Get("Microwave")
+        except KeyError:
+            return True
+        return False
+
+    def RunAllTests(self):
+        """ Run all tests for the monitor registry
+
+        Returns:
+        - None
+        """
+        Results = {
+            "Immediate": self.TestImmediate(),
+            "Deferred": self.TestDeferred(),
+            "Enabled Again": self.TestEnabledAgain(),
+            "Shared Model": self.TestSharedModel(),
+            "Unknown": self.TestUnknown()
+        }
+
+        Passed = sum(1 for r in Results.values() if r)
+        Total = len(Results)
+
+        print("\nTest Summary:")
+        for Name, Result in Results.items():
+            print(f" - {Name}: {'PASS' if Result else 'FAIL'}")
+
+        print(f"\nFinal Result: {Passed}/{Total} tests passed.")
+
+if __name__ == "__main__":
+    Tests = MonitorRegistryTests()
+    Tests.RunAllTests()
@@ -0,0 +1,180 @@
+import threading
+import cv2
+import numpy as np
+from Desktop.Main.livestream import LiveStream, StreamQuality
+
+class LiveStreamTests:
+    def __init__(self):
+        """ Create a frame to stream
+
+        Attributes:
+        - Frame (np.ndarray): Gradient BGR frame
+
+        Returns:
+        - None
+        """
+        self.Frame = np.tile(np.arange(160, dtype=np.uint8), (120, 1))[:, :, None].repeat(3, axis=2)
+
+    def TestEncodeOnce(self):
+        """ Tests clients waiting on the same frame share one encode
+
+        Returns:
+        - (bool): True if the frame is encoded once and every client gets it
+        """
+        Streamer = LiveStream()
+        Streamer.Update(self.Frame)
+        Results = []
+        Threads = [threading.Thread(target=lambda: Results.append(Streamer.Next(0))) for i in range(4)]
+        for Thread in Threads:
+            Thread.start()
+        for Thread in Threads:
+            Thread.join()
+        return Streamer.Encodes == 1 and len(Results) == 4 and len({Encoded for Sequence, Encoded in Results}) == 1
+
+    def TestResolutions(self):
+        """ Tests each resolution and quality is encoded once at its own size
+
+        Returns:
+        - (bool): True if two encodes are made and the smaller one decodes at its size
+        """
+        Streamer = LiveStream()
+        Streamer.Update(self.Frame)
+        Sequence, Full = Streamer.Next(0)
+        Sequence, Small = Streamer.Next(0, Size=(80, 60), Quality=50)
+        Sequence, Again = Streamer.Next(0, Size=(80, 60), Quality=50)
+        Decoded = cv2.imdecode(np.frombuffer(Small, dtype=np.uint8), cv2.IMREAD_COLOR)
+        return Streamer.Encodes == 2 and Again is Small and Decoded.shape == (60, 80, 3) and Full != Small
+
+    def TestNoNewFrame(self):
+        """ Tests a client that already sent the current frame gets nothing
+
+        Returns:
+        - (bool): True if no frame is returned before the timeout
+        """
+        Streamer = LiveStream()
+        Streamer.Update(self.Frame)
+        Sequence, Encoded = Streamer.Next(0)
+        Same, Nothing = Streamer.Next(Sequence, Timeout=0.05)
+        return Encoded is not None and Same == Sequence and Nothing is None
+
+    def TestNewFrame(self):
+        """ Tests a new frame replaces the encodes of the previous one
+
+        Returns:
+        - (bool): True if the new frame is encoded again
+        """
+        Streamer = LiveStream()
+        Streamer.Update(self.Frame)
+        First, Old = Streamer.Next(0)
+        Streamer.Update(255 - self.Frame)
+        Second, New = Streamer.Next(First)
+        return Second == First + 1 and New != Old and Streamer.Encodes == 2 and list(Streamer.Encoded) == [(Second, None, 95)]
+
+    def TestSlowSends(self):
+        """ Tests the profile steps down after slow sends in a row, and only then
+
+        Returns:
+        - (bool): True if the level drops on the third slow send
+        """
+        Quality = StreamQuality("high")
+        Quality.Report(1.0)
+        Quality.Report(1.0)
+        Before = Quality.Level
+        Quality.Report(1.0)
+        return Before == 0 and Quality.Level == 1 and Quality.Current() == ((640, 480), 70, 15.0)
+
+    def TestRecovery(self):
+        """ Tests the profile steps back up once sends keep up, but not above the requested profile
+
+        Returns:
+        - (bool): True if the level returns to the requested one and stays there
+        """
+        Quality = StreamQuality("medium")
+        for i in range(Quality.SlowLimit):
+            Quality.Report(1.0)
+        Dropped = Quality.Level
+        Quality.Report(0.0)
+        Waiting = Quality.Level
+        for i in range(2):
+            Quality.LastChange -= Quality.RecoverAfter
+            Quality.Report(0.0)
+        return Dropped == 2 and Waiting == 2 and Quality.Level == 1
+
+    def TestNotAdaptive(self):
+        """ Tests a fixed stream never changes profile
+
+        Returns:
+        - (bool): True if the level stays the same
+        """
+        Quality = StreamQuality("high", Adaptive=False)
+        for i in range(10):
+            Quality.Report(1.0)
+        return Quality.Level == 0
+
+    def TestOverrides(self):
+        """ Tests requested values are used, and lowered but never raised after stepping down
+
+        Returns:
+        - (bool): True if the overrides hold at every level
+        """
+        Quality = StreamQuality("high", Width=800, Height=600, Quality=50, FPS=20)
+        Requested = Quality.Current()
+        Quality.Level = 2
+        return Requested == ((800, 600), 50, 20.0) and Quality.Current() == ((320, 240), 45, 5.0)
+
+    def TestAspectRatio(self):
+        """ Tests a lone width or height keeps the profile's shape
+
+        Returns:
+        - (bool): True if the missing side follows the profile
+        """
+        Width = StreamQuality("medium", Width=320).Current()[0]
+        Height = StreamQuality("medium", Height=240).Current()[0]
+        return Width == (320, 240) and Height == (320, 240)
+
+    def TestLimits(self):
+        """ Tests oversized requests are clamped keeping their shape, and invalid ones refused
+
+        Returns:
+        - (bool): True if values are clamped and errors raised
+        """
+        Clamped = StreamQuality("high", Width=4000, Height=2000, Quality=500, FPS=1000).Current()
+        Errors = 0
+        for Arguments in ({"Profile": "ultra"}, {"Quality": 0}, {"Width": -10}, {"FPS": 0}):
+            try:
+                StreamQuality(**Arguments)
+            except ValueError:
+                Errors += 1
+        return Clamped == ((1920, 960), 100, 60.0) and Errors == 4
+
+    def RunAllTests(self):
+        """ Run all tests for the live stream and its quality controls
+
+        Returns:
+        - None
+        """
+        Results = {
+            "Encode Once": self.TestEncodeOnce(),
+            "Resolutions": self.TestResolutions(),
+            "No New Frame": self.TestNoNewFrame(),
+            "New Frame": self.TestNewFrame(),
+            "Slow Sends": self.TestSlowSends(),
+            "Recovery": self.TestRecovery(),
+            "Not Adaptive": self.TestNotAdaptive(),
+            "Overrides": self.TestOverrides(),
+            "Aspect Ratio": self.TestAspectRatio(),
+            "Limits": self.TestLimits()
+        }
+
+        Passed = sum(1 for r in Results.values() if r)
+        Total = len(Results)
+
+        print("\nTest Summary:")
+        for Name, Result in Results.items():
+            print(f" - {Name}: {'PASS' if Result else 'FAIL'}")
+
+        print(f"\nFinal Result: {Passed}/{Total} tests passed.")
+
+if __name__ == "__main__":
+    Tests = LiveStreamTests()
+    Tests.RunAllTests()
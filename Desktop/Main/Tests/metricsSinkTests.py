@@ -0,0 +1,149 @@
+import os
+import csv
+import shutil
+import tempfile
+from Desktop.Main.metricsSink import MetricsSink
+
+Header = ["FrameNumber", "Distance", "Status"]
+Types = ["int64", "float64", "string"]
+
+class MetricsSinkTests:
+    def __init__(self):
+        """ Create a temporary folder for the logs
+
+        Attributes:
+        - Directory (str): Folder the logs are written to
+
+        Returns:
+        - None
+        """
+        self.Directory = tempfile.mkdtemp()
+
+    def Log(self, Name):
+        """ Path of a fresh log in the temporary folder
+
+        Arguments:
+        - Name (str): Name of the log
+
+        Returns:
+        - (str): Path of the csv log
+        """
+        return os.path.join(self.Directory, f"{Name}.csv")
+
+    def ReadCSV(self, Path):
+        """ Read a csv log
+
+        Arguments:
+        - Path (str): Log file
+
+        Returns:
+        - (list[list[str]]): Rows, header first
+        """
+        with open(Path, newline="") as File:
+            return list(csv.reader(File))
+
+    def ReadParts(self, Path):
+        """ Read every part of a parquet log as one table
+
+        Arguments:
+        - Path (str): Folder of parts
+
+        Returns:
+        - (pyarrow.Table): Rows of every part
+        """
+        import pyarrow.dataset as ds
+        return ds.dataset(Path, format="parquet").to_table()
+
+    def TestNullFirstBatch(self):
+        """ Tests a column that's empty in the first batch keeps its type for later batches
+
+        Returns:
+        - (bool): True if both batches are written with the declared types
+        """
+        import pyarrow as pa
+        Sink = MetricsSink(self.Log("Null"), Header, BatchSize=2, Format="parquet", Types=Types)
+        Sink.Write([1, None, "Far"])
+        Sink.Write([2, None, "Far"])
+        Sink.Write([3, 1.5, "Close"])
+        Sink.Write([4, 0.5, "Close"])
+        Sink.Close()
+        Table = self.ReadParts(Sink.Path)
+        return Table.schema.field("Distance").type == pa.float64() and Table.column("Distance").to_pylist() == [None, None, 1.5, 0.5]
+
+    def TestRestart(self):
+        """ Tests a second run adds to the log instead of replacing it
+
+        Returns:
+        - (bool): True if csv and parquet logs hold both runs
+        """
+        Path = self.Log("Restart")
+        for Format in ("csv", "parquet"):
+            for Run in range(2):
+                Sink = MetricsSink(Path, Header, Format=Format, Types=Types)
+                Sink.Write([Run, 1.0, "Far"])
+                Sink.Close()
+        Rows = self.ReadCSV(Path)
+        Table = self.ReadParts(os.path.splitext(Path)[0] + ".parquet")
+        return Rows == [Header, ["0", "1.0", "Far"], ["1", "1.0", "Far"]] and sorted(Table.column("FrameNumber").to_pylist()) == [0, 1]
+
+    def TestEquivalence(self):
+        """ Tests csv and parquet logs of the same rows hold the same values
+
+        Returns:
+        - (bool): True if both logs read back the same
+        """
+        import pandas as pd
+        Rows = [[Index, None if Index % 3 == 0 else Index / 4, "Close" if Index % 2 else "Far"] for Index in range(25)]
+        Paths = {}
+        for Format in ("csv", "parquet"):
+            Sink = MetricsSink(self.Log("Equivalence"), Header, BatchSize=10, Format=Format, Types=Types)
+            for Row in Rows:
+                Sink.Write(Row)
+            Sink.Close()
+            Paths[Format] = Sink.Path
+        CSV = pd.read_csv(Paths["csv"])
+        Parquet = self.ReadParts(Paths["parquet"]).to_pandas()
+        return CSV.equals(Parquet)
+
+    def TestFailedWrite(self):
+        """ Tests rows are kept when a write fails and written once it succeeds
+
+        Returns:
+        - (bool): True if no rows are lost
+        """
+        Path = self.Log("Failed")
+        os.makedirs(Path)
+        Sink = MetricsSink(Path, Header, Types=Types)
+        Sink.Write([1, 1.0, "Far"])
+        Failed = not Sink.Flush()
+        os.rmdir(Path)
+        Sink.Write([2, 2.0, "Far"])
+        Sink.Close()
+        return Failed and self.ReadCSV(Path) == [Header, ["1", "1.0", "Far"], ["2", "2.0", "Far"]]
+
+    def RunAllTests(self):
+        """ Run all tests for the metrics sink
+
+        Returns:
+        - None
+        """
+        Results = {
+            "Null First Batch": self.TestNullFirstBatch(),
+            "Restart": self.TestRestart(),
+            "Equivalence": self.TestEquivalence(),
+            "Failed Write": self.TestFailedWrite()
+        }
+        shutil.rmtree(self.Directory, ignore_errors=True)
+
+        Passed = sum(1 for r in Results.values() if r)
+        Total = len(Results)
+
+        print("\nTest Summary:")
+        for Name, Result in Results.items():
+            print(f" - {Name}: {'PASS' if Result else 'FAIL'}")
+
+        print(f"\nFinal Result: {Passed}/{Total} tests passed.")
+
+if __name__ == "__main__":
+    Tests = MetricsSinkTests()
+    Tests.RunAllTests()
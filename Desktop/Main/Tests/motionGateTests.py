@@ -0,0 +1,135 @@
+import numpy as np
+from Desktop.Main.motionGate import MotionGate
+
+class MotionGateTests:
+    def __init__(self):
+        """ Create a still frame and a frame where something moved
+
+        Attributes:
+        - Still (np.ndarray): Grey BGR frame
+        - Moving (np.ndarray): Still frame with a bright block added
+
+        Returns:
+        - None
+        """
+        self.Still = np.full((240, 320, 3), 100, dtype=np.uint8)
+        self.Moving = self.Still.copy()
+        self.Moving[60:180, 80:240] = 220
+
+    def Idle(self, IdleInterval=3):
+        """ Gate that has already seen the still frame, with no hold after motion and its last motion moved into the past
+
+        Arguments:
+        - IdleInterval (int): Ticks between runs while idle
+
+        Returns:
+        - (MotionGate): Gate past its first frame
+        """
+        Gate = MotionGate(IdleInterval=IdleInterval, Hold=0.0)
+        Gate.ShouldRun(self.Still)
+        Gate.LastActive -= 1.0
+        return Gate
+
+    def TestFirstFrame(self):
+        """ Tests the monitors run on the first frame
+
+        Returns:
+        - (bool): True if the first frame runs
+        """
+        return MotionGate().ShouldRun(self.Still)
+
+    def TestIdle(self):
+        """ Tests a still scene only runs once every idle interval
+
+        Returns:
+        - (bool): True if every third tick runs
+        """
+        Gate = self.Idle(IdleInterval=3)
+        return [Gate.ShouldRun(self.Still) for i in range(6)] == [False, False, True, False, False, True]
+
+    def TestMotion(self):
+        """ Tests motion goes back to full rate straight away, then idles again once the scene is still
+
+        Returns:
+        - (bool): True if the moving frame runs and the still ones after it are skipped
+        """
+        Gate = self.Idle(IdleInterval=10)
+        Before = Gate.ShouldRun(self.Still)
+        Moved = Gate.ShouldRun(self.Moving)
+        Gate.LastActive -= 1.0
+        After = Gate.ShouldRun(self.Moving)
+        return not Before and Moved and not After
+
+    def TestPerson(self):
+        """ Tests a still person keeps the full rate until they leave
+
+        Returns:
+        - (bool): True if every tick runs while the person is there
+        """
+        Gate = self.Idle(IdleInterval=10)
+        Gate.Observe(True)
+        Present = [Gate.ShouldRun(self.Still) for i in range(5)]
+        Gate.Observe(False)
+        Gate.LastActive -= 1.0
+        return all(Present) and not Gate.ShouldRun(self.Still)
+
+    def TestHold(self):
+        """ Tests the full rate is held for a while after the last motion
+
+        Returns:
+        - (bool): True if still frames keep running during the hold
+        """
+        Gate = MotionGate(IdleInterval=10, Hold=60.0)
+        Gate.ShouldRun(self.Still)
+        return all(Gate.ShouldRun(self.Still) for i in range(5))
+
+    def TestNoise(self):
+        """ Tests small flicker below the threshold isn't motion
+
+        Returns:
+        - (bool): True if the noisy frame is skipped
+        """
+        Gate = self.Idle(IdleInterval=10)
+        Noisy = self.Still + np.random.default_rng(0).integers(0, 6, self.Still.shape, dtype=np.uint8)
+        return not Gate.ShouldRun(Noisy)
+
+    def TestCounters(self):
+        """ Tests runs and skips are counted per monitor
+
+        Returns:
+        - (bool): True if the summary holds every count
+        """
+        Gate = MotionGate()
+        Gate.Count(["Mask", "Proximity"], True)
+        Gate.Count(["Mask"], False)
+        Gate.Count(["Mask"], False)
+        return Gate.Summary() == {"Mask": {"Runs": 1, "Skips": 2}, "Proximity": {"Runs": 1, "Skips": 0}}
+
+    def RunAllTests(self):
+        """ Run all tests for the motion gate
+
+        Returns:
+        - None
+        """
+        Results = {
+            "First Frame": self.TestFirstFrame(),
+            "Idle": self.TestIdle(),
+            "Motion": self.TestMotion(),
+            "Person": self.TestPerson(),
+            "Hold": self.TestHold(),
+            "Noise": self.TestNoise(),
+            "Counters": self.TestCounters()
+        }
+
+        Passed = sum(1 for r in Results.values() if r)
+        Total = len(Results)
+
+        print("\nTest Summary:")
+        for Name, Result in Results.items():
+            print(f" - {Name}: {'PASS' if Result else 'FAIL'}")
+
+        print(f"\nFinal Result: {Passed}/{Total} tests passed.")
+
+if __name__ == "__main__":
+    Tests = MotionGateTests()
+    Tests.RunAllTests()
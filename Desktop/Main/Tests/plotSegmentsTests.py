@@ -0,0 +1,194 @@
+import os
+import shutil
+import tempfile
+import numpy as np
+import pandas as pd
+import matplotlib
+matplotlib.use("Agg")
+from Desktop.Main.plotSegments import EncodeStatus, RunLengths, DrawSpans
+from Desktop.Background.Metrics import comparison as BackgroundComparison
+from Desktop.Lingering.Metrics import comparisons as LingeringComparisons
+from Desktop.Mask.Metrics import comparisons as MaskComparisons
+from Desktop.Movement.Metrics import comparisonDistance as DistanceComparisons
+
+def LingeringFrame():
+    """ Lingering log with several presence runs, missed frames and a skipped frame number
+
+    Returns:
+    - (pd.DataFrame): Fixture log
+    """
+    Statuses = ["PRESENT", "PRESENT", "NO PERSON", "LINGERING", "LINGERING", "NO PERSON", "PRESENT", None]
+    return pd.DataFrame({
+        "FrameNumber": [1, 2, 3, 4, 5, 7, 8, 9],
+        "PersonDetected": [1, 1, 0, 1, 1, 0, 1, 1],
+        "Confidence": [0.9] * 8,
+        "DwellTime": [0.0, 1.0, 0.0, 2.0, 3.0, 0.0, 0.0, 0.0],
+        "Status": Statuses
+    })
+
+class PlotSegmentsTests:
+    def __init__(self):
+        """ Create a temporary folder for the rendered plots
+
+        Attributes:
+        - Directory (str): Folder plots are saved to
+
+        Returns:
+        - None
+        """
+        self.Directory = tempfile.mkdtemp()
+
+    def Visualiser(self, Module, **Attributes):
+        """ Build a visualiser around fixture data instead of the experiment store
+
+        Arguments:
+        - Module (module): Visualiser module
+        - Attributes (dict): Attributes to set
+
+        Returns:
+        - (MetricsVisualiser): Visualiser saving to the temporary folder
+        """
+        Visualiser = Module.MetricsVisualiser.__new__(Module.MetricsVisualiser)
+        for Name, Value in Attributes.items():
+            setattr(Visualiser, Name, Value)
+        return Visualiser
+
+    def TestRunLengths(self):
+        """ Tests runs are found in row order and split where positions skip
+
+        Returns:
+        - (bool): True if both splits are right
+        """
+        Starts, Ends = RunLengths([1, 1, 0, 1, 1, 1, 0, 1])
+        Rows = Starts.tolist() == [0, 3, 7] and Ends.tolist() == [1, 5, 7]
+        Starts, Ends = RunLengths([1, 1, 1, 1], [1, 2, 4, 5])
+        return Rows and Starts.tolist() == [0, 2] and Ends.tolist() == [1, 3]
+
+    def TestEncodeStatus(self):
+        """ Tests statuses are converted like Series.apply, including missing ones
+
+        Returns:
+        - (bool): True if every frame matches
+        """
+        Visualiser = self.Visualiser(LingeringComparisons)
+        Statuses = LingeringFrame()["Status"]
+        Expected = Statuses.apply(Visualiser.StatusToNumeric).to_numpy(dtype=np.float64)
+        return np.array_equal(EncodeStatus(Statuses, Visualiser.StatusToNumeric), Expected, equal_nan=True)
+
+    def TestDrawSpans(self):
+        """ Tests a run isn't shaded across a skipped frame number
+
+        Returns:
+        - (bool): True if two spans are drawn
+        """
+        import matplotlib.pyplot as plt
+        Figure, Ax = plt.subplots()
+        Collection = DrawSpans(Ax, np.array([1, 2, 4, 5]), np.array([True, True, True, True]), color="red")
+        plt.close(Figure)
+        return Collection is not None and len(Collection.get_paths()) == 2
+
+    def TestLingering(self):
+        """ Tests the lingering visualiser renders scenarios with several presence runs
+
+        Returns:
+        - (bool): True if the plot is saved
+        """
+        Visualiser = self.Visualiser(
+            LingeringComparisons,
+            Methods={"PE": "Pose Estimation"},
+            Scenarios=["Behind", "Hiding", "Moving", "Object", "Standing"],
+            OutputDirectory=self.Directory
+        )
+        Visualiser.Experiments = {("PE", Scenario): LingeringFrame() for Scenario in Visualiser.Scenarios}
+        Visualiser.Generate()
+        return os.path.exists(os.path.join(self.Directory, "PE_ALL.png"))
+
+    def TestDistance(self):
+        """ Tests the distance visualiser renders, including a missing scenario
+
+        Returns:
+        - (bool): True if the plot is saved
+        """
+        DF = pd.DataFrame({
+            "Distance": [300.0, 250.0, None, 120.0],
+            "Approach": [None, -50.0, None, -130.0],
+            "Status": ["Person safe distance", "Person safe distance", "No person", "Person too close"]
+        })
+        Visualiser = self.Visualiser(
+            DistanceComparisons,
+            Methods={"PD": "Pose Estimation"},
+            Scenarios=["Standing", "Sitting", "Crouch"],
+            OutputDirectory=self.Directory,
+            Experiments={("PD", "Standing"): DF, ("PD", "Sitting"): DF}
+        )
+        Visualiser.GeneratePlots()
+        return os.path.exists(os.path.join(self.Directory, "PD_ALL.png"))
+
+    def TestMask(self):
+        """ Tests the mask visualiser renders
+
+        Returns:
+        - (bool): True if the plot is saved
+        """
+        DF = pd.DataFrame({
+            "FrameNumber": [1, 2, 3, 5, 6],
+            "Status": ["NO MASK - SAFE", "NO DETECTION", "NO DETECTION", "MASK DETECTED", "MASK DETECTED"],
+            "Confidence": [0.9, 0.0, 0.0, 0.8, 0.85]
+        })
+        Visualiser = self.Visualiser(
+            MaskComparisons,
+            Methods={"O": "Occlusion Based"},
+            OutputDirectory=self.Directory,
+            Experiments={("Occlusion Based", "All"): DF}
+        )
+        Visualiser.GeneratePlots()
+        return os.path.exists(os.path.join(self.Directory, "O_MASK.png"))
+
+    def TestBackground(self):
+        """ Tests the background visualiser renders
+
+        Returns:
+        - (bool): True if the plot is saved
+        """
+        DF = pd.DataFrame({"motion": np.linspace(0, 1, 20), "ssim": np.linspace(1, 0.5, 20), "brightness": np.full(20, 120.0)})
+        Visualiser = self.Visualiser(
+            BackgroundComparison,
+            Methods=["KNN"],
+            Keys={"KNN": "KNN Background Subtraction"},
+            Scenarios=["Normal"],
+            Metrics=["motion", "ssim", "brightness"],
+            OutputDir=self.Directory,
+            Data={("KNN", "Normal"): DF}
+        )
+        Visualiser.Plot(Visualiser.Methods, Visualiser.Scenarios, "Method", "Scenario", "_scenarios")
+        return os.path.exists(os.path.join(self.Directory, "KNN_scenarios.png"))
+
+    def RunAllTests(self):
+        """ Run all tests for the plot helpers and visualisers
+
+        Returns:
+        - None
+        """
+        Results = {
+            "Run Lengths": self.TestRunLengths(),
+            "Encode Status": self.TestEncodeStatus(),
+            "Draw Spans": self.TestDrawSpans(),
+            "Lingering": self.TestLingering(),
+            "Distance": self.TestDistance(),
+            "Mask": self.TestMask(),
+            "Background": self.TestBackground()
+        }
+        shutil.rmtree(self.Directory, ignore_errors=True)
+
+        Passed = sum(1 for r in Results.values() if r)
+        Total = len(Results)
+
+        print("\nTest Summary:")
+        for Name, Result in Results.items():
+            print(f" - {Name}: {'PASS' if Result else 'FAIL'}")
+
+        print(f"\nFinal Result: {Passed}/{Total} tests passed.")
+
+if __name__ == "__main__":
+    Tests = PlotSegmentsTests()
+    Tests.RunAllTests()
@@ -0,0 +1,196 @@
+import time
+import threading
+from types import SimpleNamespace
+from Desktop.Main.setReferences import ReferencePublisher, SetBackend
+
+class FakeRoot:
+    def __init__(self, Delay=0.0):
+        """ Local stand in for the database root that records multi-path updates
+
+        Arguments:
+        - Delay (float): Seconds each update takes, to mimic a slow network
+
+        Attributes:
+        - Delay (float): Seconds each update takes
+        - Updates (list[dict]): Updates received, in order
+        - Fail (int): Number of coming updates that raise
+        - Lock (threading.Lock): Guards the updates, as the publisher sends from its thread
+
+        Returns:
+        - None
+        """
+        self.Delay = Delay
+        self.Updates = []
+        self.Fail = 0
+        self.Lock = threading.Lock()
+
+    def update(self, Updates):
+        """ Record a multi-path update
+
+        Arguments:
+        - Updates (dict): Value of each path
+
+        Raises:
+        - ConnectionError: Update set to fail
+
+        Returns:
+        - None
+        """
+        time.sleep(self.Delay)
+        with self.Lock:
+            if self.Fail:
+                self.Fail -= 1
+                raise ConnectionError("Offline")
+            self.Updates.append(dict(Updates))
+
+    def Values(self, Path):
+        """ Values sent to a path
+
+        Arguments:
+        - Path (str): Path written
+
+        Returns:
+        - (list): Values sent, in order
+        """
+        with self.Lock:
+            return [Update[Path] for Update in self.Updates if Path in Update]
+
+def Backend(Alert, Timestamp):
+    """ Backend message as SetBackend sends it
+
+    Arguments:
+    - Alert (bool): True if something is detected
+    - Timestamp (int): Time of the message
+
+    Returns:
+    - (dict): Message
+    """
+    return {"alert": Alert, "message": "Alert" if Alert else "", "timestamp": Timestamp}
+
+class PublisherTests:
+    def __init__(self):
+        """ Create a fake backend reference
+
+        Attributes:
+        - Reference (SimpleNamespace): Fake backend message reference
+
+        Returns:
+        - None
+        """
+        self.Reference = SimpleNamespace(path="/BackendMessages")
+
+    def Stopped(self, Root):
+        """ Publisher whose thread is stopped, so each test flushes by hand
+
+        Arguments:
+        - Root (FakeRoot): Fake database root
+
+        Returns:
+        - (ReferencePublisher): Publisher tested
+        """
+        Publisher = ReferencePublisher(Root, Heartbeat=10.0, Interval=0.05)
+        Publisher.Release()
+        return Publisher
+
+    def TestCoalescing(self):
+        """ Tests values published between batches are merged and unchanged values skipped
+
+        Returns:
+        - (bool): True if only the newest value is sent and the other three writes are saved
+        """
+        Root = FakeRoot()
+        Publisher = self.Stopped(Root)
+        for Timestamp in range(1, 4):
+            Publisher.Publish(self.Reference, Backend(False, Timestamp), IgnoreKeys=("timestamp",))
+        Publisher.Flush()
+        Publisher.Publish(self.Reference, Backend(False, 4), IgnoreKeys=("timestamp",))
+        Publisher.Flush()
+        return Root.Values("BackendMessages") == [Backend(False, 3)] and Publisher.WritesSaved == 3
+
+    def TestForce(self):
+        """ Tests forced values are sent even when unchanged
+
+        Returns:
+        - (bool): True if both alerts are sent
+        """
+        Root = FakeRoot()
+        Publisher = self.Stopped(Root)
+        SetBackend(self.Reference, True, "Alert", 1, Publisher)
+        Publisher.Flush()
+        SetBackend(self.Reference, True, "Alert", 2, Publisher)
+        Publisher.Flush()
+        return [Value["timestamp"] for Value in Root.Values("BackendMessages")] == [1, 2]
+
+    def TestForcedNotReplaced(self):
+        """ Tests a forced value waiting to be sent isn't replaced by the next value
+
+        Returns:
+        - (bool): True if the alert and the value after it are sent in order
+        """
+        Root = FakeRoot()
+        Publisher = self.Stopped(Root)
+        Publisher.Publish(self.Reference, Backend(True, 2), IgnoreKeys=("timestamp",), Force=True)
+        Publisher.Publish(self.Reference, Backend(False, 3), IgnoreKeys=("timestamp",))
+        Publisher.Publish(self.Reference, Backend(False, 4), IgnoreKeys=("timestamp",))
+        Publisher.Flush()
+        Publisher.Flush()
+        return Root.Values("BackendMessages") == [Backend(True, 2), Backend(False, 4)] and not Publisher.Pending
+
+    def TestFailedForced(self):
+        """ Tests a forced value is queued again ahead of newer values when the update fails
+
+        Returns:
+        - (bool): True if the alert is sent once the database is back
+        """
+        Root = FakeRoot()
+        Root.Fail = 1
+        Publisher = self.Stopped(Root)
+        Publisher.Publish(self.Reference, Backend(True, 2), IgnoreKeys=("timestamp",), Force=True)
+        Flushed = Publisher.Flush()
+        Publisher.Publish(self.Reference, Backend(False, 3), IgnoreKeys=("timestamp",))
+        Publisher.Flush()
+        Publisher.Flush()
+        return not Flushed and Root.Values("BackendMessages") == [Backend(True, 2), Backend(False, 3)]
+
+    def TestSlowUpdate(self):
+        """ Tests an alert published while a slow update is in flight reaches the database
+
+        Returns:
+        - (bool): True if the alert at timestamp 2 is sent between ticks 1 and 3
+        """
+        Root = FakeRoot(Delay=1.5)
+        Publisher = ReferencePublisher(Root, Heartbeat=10.0, Interval=0.05)
+        SetBackend(self.Reference, False, "", 1, Publisher)
+        time.sleep(0.2)
+        SetBackend(self.Reference, True, "Alert", 2, Publisher)
+        SetBackend(self.Reference, False, "", 3, Publisher)
+        Publisher.Release()
+        Timestamps = [Value["timestamp"] for Value in Root.Values("BackendMessages")]
+        return Timestamps == [1, 2, 3]
+
+    def RunAllTests(self):
+        """ Run all tests for the reference publisher
+
+        Returns:
+        - None
+        """
+        Results = {
+            "Coalescing": self.TestCoalescing(),
+            "Force": self.TestForce(),
+            "Forced Not Replaced": self.TestForcedNotReplaced(),
+            "Failed Forced": self.TestFailedForced(),
+            "Slow Update": self.TestSlowUpdate()
+        }
+
+        Passed = sum(1 for r in Results.values() if r)
+        Total = len(Results)
+
+        print("\nTest Summary:")
+        for Name, Result in Results.items():
+            print(f" - {Name}: {'PASS' if Result else 'FAIL'}")
+
+        print(f"\nFinal Result: {Passed}/{Total} tests passed.")
+
+if __name__ == "__main__":
+    Tests = PublisherTests()
+    Tests.RunAllTests()
@@ -0,0 +1,135 @@
+import time
+import threading
+from Desktop.Main.scheduler import MonitorScheduler
+
+class RecordingPerformance:
+    def __init__(self):
+        """ Performance monitor stand in keeping every recorded latency
+
+        Attributes:
+        - Latencies (hashmap[str][list[float]]): Seconds each monitor took
+
+        Returns:
+        - None
+        """
+        self.Latencies = {}
+
+    def Record(self, Name, Seconds):
+        """ Keep how long a monitor took
+
+        Arguments:
+        - Name (str): Name of the monitor
+        - Seconds (float): Time taken
+
+        Returns:
+        - None
+        """
+        self.Latencies.setdefault(Name, []).append(Seconds)
+
+class MonitorSchedulerTests:
+    def TestInTime(self):
+        """ Tests monitors finishing before the deadline are all collected
+
+        Returns:
+        - (bool): True if every result is returned and none are late
+        """
+        Scheduler = MonitorScheduler(Deadline=1.0)
+        Scheduler.Submit({"Background": lambda: True, "Mask": lambda: False})
+        Results = Scheduler.Collect()
+        Scheduler.Release()
+        return Results == {"Background": True, "Mask": False} and Scheduler.Late == [] and not Scheduler.Running
+
+    def TestLate(self):
+        """ Tests a slow monitor is marked late, isn't started again while running, and is collected once done
+
+        Returns:
+        - (bool): True if the late monitor runs once and its result arrives on a later tick
+        """
+        Scheduler = MonitorScheduler(Deadline=0.05)
+        Release = threading.Event()
+        Calls = []
+        def Slow():
+            Calls.append(1)
+            Release.wait(5)
+            return True
+        Tasks = {"Slow": Slow, "Fast": lambda: True}
+
+        Scheduler.Submit(Tasks)
+        First = Scheduler.Collect()
+        FirstLate = list(Scheduler.Late)
+        Scheduler.Submit(Tasks)
+        Release.set()
+        Scheduler.Running["Slow"].result(timeout=5)
+        Second = Scheduler.Collect()
+        Scheduler.Release()
+        return First == {"Fast": True} and FirstLate == ["Slow"] and Second == {"Slow": True, "Fast": True} and len(Calls) == 1
+
+    def TestDeadline(self):
+        """ Tests collecting waits no longer than the deadline
+
+        Returns:
+        - (bool): True if collecting returns close to the deadline
+        """
+        Scheduler = MonitorScheduler(Deadline=0.1)
+        Release = threading.Event()
+        Scheduler.Submit({"Slow": lambda: Release.wait(5)})
+        Start = time.time()
+        Scheduler.Collect()
+        Waited = time.time() - Start
+        Release.set()
+        Scheduler.Release()
+        return Waited < 0.5 and Scheduler.Late == ["Slow"]
+
+    def TestFailure(self):
+        """ Tests a monitor raising an error counts as no detection
+
+        Returns:
+        - (bool): True if the failed monitor returns false
+        """
+        def Failing():
+            raise RuntimeError("Camera unplugged")
+        Scheduler = MonitorScheduler(Deadline=1.0)
+        Scheduler.Submit({"Failing": Failing})
+        Results = Scheduler.Collect()
+        Scheduler.Release()
+        return Results == {"Failing": False}
+
+    def TestPerformance(self):
+        """ Tests how long each monitor takes is recorded
+
+        Returns:
+        - (bool): True if one latency is recorded per monitor run
+        """
+        Performance = RecordingPerformance()
+        Scheduler = MonitorScheduler(Deadline=1.0, Performance=Performance)
+        Scheduler.Submit({"Mask": lambda: time.sleep(0.01) or True})
+        Scheduler.Collect()
+        Scheduler.Release()
+        return len(Performance.Latencies.get("Mask", [])) == 1 and Performance.Latencies["Mask"][0] >= 0.01
+
+    def RunAllTests(self):
+        """ Run all tests for the monitor scheduler
+
+        Returns:
+        - None
+        """
+        Results = {
+            "In Time": self.TestInTime(),
+            "Late": self.TestLate(),
+            "Deadline": self.TestDeadline(),
+            "Failure": self.TestFailure(),
+            "Performance": self.TestPerformance()
+        }
+
+        Passed = sum(1 for r in Results.values() if r)
+        Total = len(Results)
+
+        print("\nTest Summary:")
+        for Name, Result in Results.items():
+            print(f" - {Name}: {'PASS' if Result else 'FAIL'}")
+
+        print(f"\nFinal Result: {Passed}/{Total} tests passed.")
+
+if __name__ == "__main__":
+    Tests = MonitorSchedulerTests()
+    Tests.RunAllTests()
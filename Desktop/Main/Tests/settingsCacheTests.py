@@ -0,0 +1,168 @@
+from types import SimpleNamespace
+from Desktop.Main.generateReferences import SettingsCache, RetrieveControlPanel, RetrieveModels
+
+class FakeReference:
+    def __init__(self, Data):
+        """ Local stand in for a database reference that emits change events
+
+        Arguments:
+        - Data (dict): Initial value of the reference
+
+        Attributes:
+        - Data (dict): Current value of the reference
+        - Callbacks (list[function]): Listeners to send events to
+        - Reads (int): Number of full reads made
+        - OnRead (function): Called during a full read, after the data is taken, None to do nothing
+
+        Returns:
+        - None
+        """
+        self.Data = Data
+        self.Callbacks = []
+        self.Reads = 0
+        self.OnRead = None
+
+    def get(self):
+        """ Full read of the reference
+
+        Returns:
+        - Data (dict): Current value of the reference
+        """
+        self.Reads += 1
+        Data = self.Data
+        if self.OnRead is not None:
+            self.OnRead()
+        return Data
+
+    def listen(self, Callback):
+        """ Register a listener for change events
+
+        Arguments:
+        - Callback (function): Called with each event
+
+        Returns:
+        - (SimpleNamespace): Registration that can be closed
+        """
+        self.Callbacks.append(Callback)
+        return SimpleNamespace(close=lambda: self.Callbacks.remove(Callback))
+
+    def Emit(self, EventType, Path, Data):
+        """ Send a change event to every listener
+
+        Arguments:
+        - EventType (str): Either put or patch
+        - Path (str): Path changed, relative to the reference
+        - Data (any): New value at the path
+
+        Returns:
+        - None
+        """
+        Event = SimpleNamespace(event_type=EventType, path=Path, data=Data)
+        for Callback in list(self.Callbacks):
+            Callback(Event)
+
+class SettingsCacheTests:
+    def __init__(self):
+        """ Create fake control panel and model references
+
+        Attributes:
+        - ControlPanel (FakeReference): Fake control panel settings
+        - Models (FakeReference): Fake model settings
+        - Cache (SettingsCache): Cache tested
+
+        Returns:
+        - None
+        """
+        self.ControlPanel = FakeReference({"power": False, "lock": False, "camera": False})
+        self.Models = FakeReference({"background": True, "proximity": True, "loitering": True, "mask": True})
+        self.Cache = SettingsCache({"ControlPanel": self.ControlPanel, "Models": self.Models})
+        self.Cache.Start()
+
+    def TestInitialRead(self):
+        """ Tests settings are available straight after starting
+
+        Returns:
+        - (bool): True if cached settings match the references
+        """
+        return RetrieveControlPanel(self.Cache.Reference("ControlPanel")) == (False, False, False)
+
+    def TestPutChild(self):
+        """ Tests a put on a single setting updates only that setting
+
+        Returns:
+        - (bool): True if power is turned on
+        """
+        self.ControlPanel.Emit("put", "/power", True)
+        return RetrieveControlPanel(self.Cache.Reference("ControlPanel")) == (True, False, False)
+
+    def TestPatch(self):
+        """ Tests a patch updates several settings at once
+
+        Returns:
+        - (bool): True if both models are turned off
+        """
+        self.Models.Emit("patch", "/", {"mask": False, "background": False})
+        return RetrieveModels(self.Cache.Reference("Models")) == (False, True, True, False)
+
+    def TestNoReads(self):
+        """ Tests events don't cause any extra reads
+
+        Returns:
+        - (bool): True if each reference was only read when starting
+        """
+        for i in range(10):
+            RetrieveControlPanel(self.Cache.Reference("ControlPanel"))
+        return self.ControlPanel.Reads == 1 and self.Models.Reads == 1
+
+    def TestResyncDuringEvent(self):
+        """ Tests a full read doesn't replace an event that arrived while it was in flight
+
+        Returns:
+        - (bool): True if the event's value is kept until the next resync
+        """
+        self.ControlPanel.Data = {"power": False, "lock": False, "camera": False}
+        self.ControlPanel.OnRead = lambda: self.ControlPanel.Emit("put", "/lock", True)
+        self.Cache.Resync()
+        self.ControlPanel.OnRead = None
+        Kept = RetrieveControlPanel(self.Cache.Reference("ControlPanel"))[1]
+        self.ControlPanel.Data = {"power": True, "lock": False, "camera": False}
+        self.Cache.Resync()
+        return Kept and RetrieveControlPanel(self.Cache.Reference("ControlPanel")) == (True, False, False)
+
+    def TestRelease(self):
+        """ Tests events are ignored after releasing
+
+        Returns:
+        - (bool): True if the cache keeps its last value
+        """
+        self.Cache.Release()
+        self.ControlPanel.Emit("put", "/", {"power": False, "lock": True, "camera": True})
+        return RetrieveControlPanel(self.Cache.Reference("ControlPanel")) == (True, False, False)
+
+    def RunAllTests(self):
+        """ Run all tests for the settings cache
+
+        Returns:
+        - None
+        """
+        Results = {
+            "Initial Read": self.TestInitialRead(),
+            "Put Child": self.TestPutChild(),
+            "Patch": self.TestPatch(),
+            "No Reads": self.TestNoReads(),
+            "Resync During Event": self.TestResyncDuringEvent(),
+            "Release": self.TestRelease()
+        }
+
+        Passed = sum(1 for r in Results.values() if r)
+        Total = len(Results)
+
+        print("\nTest Summary:")
+        for Name, Result in Results.items():
+            print(f" - {Name}: {'PASS' if Result else 'FAIL'}")
+
+        print(f"\nFinal Result: {Passed}/{Total} tests passed.")
+
+if __name__ == "__main__":
+    Tests = SettingsCacheTests()
+    Tests.RunAllTests()
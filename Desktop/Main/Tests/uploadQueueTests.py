@@ -0,0 +1,176 @@
+import os
+import time
+import tempfile
+from types import SimpleNamespace
+from Desktop.Main.cloud import UploadQueue
+
+class StubClient:
+    def __init__(self, Failures=0):
+        """ Local stand in for the Supabase client
+
+        Arguments:
+        - Failures (int): Number of uploads that fail before they start succeeding
+
+        Attributes:
+        - Failures (int): Uploads left to fail
+        - Files (hashmap[str][bytes]): Images uploaded
+        - Logs (list[dict]): Log rows inserted
+
+        Returns:
+        - None
+        """
+        self.Failures = Failures
+        self.Files = {}
+        self.Logs = []
+        self.storage = SimpleNamespace(from_=lambda Bucket: self)
+
+    def upload(self, FileName, ImageData, Options):
+        """ Store the image, failing while failures are left
+
+        Arguments:
+        - FileName (str): Name of image
+        - ImageData (bytes): Encoded image
+        - Options (dict): Upload options
+
+        Raises:
+        - ConnectionError: Simulated network failure
+
+        Returns:
+        - None
+        """
+        if self.Failures > 0:
+            self.Failures -= 1
+            raise ConnectionError("Offline")
+        self.Files[FileName] = ImageData
+
+    def get_public_url(self, FileName):
+        """ URL of an uploaded image
+
+        Arguments:
+        - FileName (str): Name of image
+
+        Returns:
+        - (str): URL of the image
+        """
+        return f"stub://{FileName}"
+
+    def table(self, Name):
+        """ Table to insert into
+
+        Arguments:
+        - Name (str): Name of the table
+
+        Returns:
+        - (SimpleNamespace): Insert interface
+        """
+        return SimpleNamespace(insert=lambda Row: SimpleNamespace(execute=lambda: self.Logs.append(Row)))
+
+class UploadQueueTests:
+    def __init__(self):
+        """ Create a folder for logs written to disk
+
+        Attributes:
+        - SpillDirectory (str): Temporary folder for logs kept offline
+
+        Returns:
+        - None
+        """
+        self.SpillDirectory = tempfile.mkdtemp()
+
+    def WaitFor(self, Condition, Timeout=5.0):
+        """ Wait until a condition holds or the timeout passes
+
+        Arguments:
+        - Condition (function): Returns true once done
+        - Timeout (float): Seconds to wait
+
+        Returns:
+        - (bool): True if the condition held in time
+        """
+        End = time.time() + Timeout
+        while time.time() < End:
+            if Condition():
+                return True
+            time.sleep(0.01)
+        return Condition()
+
+    def TestUpload(self):
+        """ Tests a queued log gets uploaded
+
+        Returns:
+        - (bool): True if image and log row are stored
+        """
+        Client = StubClient()
+        Uploader = UploadQueue(Client, SpillDirectory=self.SpillDirectory)
+        Uploader.Enqueue(b"image", "Someone is loitering\n", 1)
+        Done = self.WaitFor(lambda: Client.Logs)
+        Uploader.Release()
+        return Done and Client.Files["1.jpg"] == b"image" and Client.Logs[0]["image_url"] == "stub://1.jpg"
+
+    def TestRetry(self):
+        """ Tests a failed upload is retried
+
+        Returns:
+        - (bool): True if log is uploaded after failures
+        """
+        Client = StubClient(Failures=2)
+        Uploader = UploadQueue(Client, Retries=3, Backoff=0.01, SpillDirectory=self.SpillDirectory)
+        Uploader.Enqueue(b"image", "Retry", 2)
+        Done = self.WaitFor(lambda: Client.Logs)
+        Uploader.Release()
+        return Done and Uploader.Spilled == 0
+
+    def TestOffline(self):
+        """ Tests logs are written to disk when offline and uploaded once back online
+
+        Returns:
+        - (bool): True if the log is kept then uploaded
+        """
+        Client = StubClient(Failures=2)
+        Uploader = UploadQueue(Client, Retries=2, Backoff=0.01, SpillDirectory=self.SpillDirectory, RecoverInterval=0.1)
+        Uploader.Enqueue(b"image", "Offline", 3)
+        Spilled = self.WaitFor(lambda: Uploader.Spilled == 1)
+        Recovered = self.WaitFor(lambda: Client.Logs)
+        Uploader.Release()
+        return Spilled and Recovered and not os.listdir(self.SpillDirectory)
+
+    def TestSameSecond(self):
+        """ Tests logs kept on disk in the same second don't overwrite each other
+
+        Returns:
+        - (bool): True if both logs are kept then uploaded
+        """
+        Client = StubClient()
+        Uploader = UploadQueue(Client, SpillDirectory=self.SpillDirectory, RecoverInterval=0.5)
+        Uploader.Spill(b"first", "First", 4)
+        Uploader.Spill(b"second", "Second", 4)
+        Kept = len([Name for Name in os.listdir(self.SpillDirectory) if Name.endswith(".json")]) == 2
+        Recovered = self.WaitFor(lambda: len(Client.Logs) == 2)
+        Uploader.Release()
+        return Kept and Recovered and sorted(Row["message"] for Row in Client.Logs) == ["First", "Second"]
+
+    def RunAllTests(self):
+        """ Run all tests for the upload queue
+
+        Returns:
+        - None
+        """
+        Results = {
+            "Upload": self.TestUpload(),
+            "Retry": self.TestRetry(),
+            "Offline": self.TestOffline(),
+            "Same Second": self.TestSameSecond()
+        }
+
+        Passed = sum(1 for r in Results.values() if r)
+        Total = len(Results)
+
+        print("\nTest Summary:")
+        for Name, Result in Results.items():
+            print(f" - {Name}: {'PASS' if Result else 'FAIL'}")
+
+        print(f"\nFinal Result: {Passed}/{Total} tests passed.")
+
+if __name__ == "__main__":
+    Tests = UploadQueueTests()
+    Tests.RunAllTests()
@@ -1,12 +1,64 @@
 import cv2
+import time
+import threading
+from collections import deque
+
+class CapturedFrame:
+    def __init__(self, Raw, Timestamp, Sequence):
+        """ Frame read from the camera, resized only when a consumer asks for a resolution
+
+        Arguments:
+        - Raw (np.ndarray): Frame as read from the camera
+        - Timestamp (float): Time the frame was read
+        - Sequence (int): Position of the frame since the camera started
+
+        Attributes:
+        - Raw (np.ndarray): Frame as read from the camera
+        - Timestamp (float): Time the frame was read
+        - Sequence (int): Position of the frame since the camera started
+        - Resized (hashmap[tuple][np.ndarray]): Resized copies of the frame, by resolution
+
+        Returns:
+        - None
+        """
+        self.Raw = Raw
+        self.Timestamp = Timestamp
+        self.Sequence = Sequence
+        self.Resized = {}
+
+    def Resize(self, Size):
+        """ Return the frame at the given resolution, resizing once per resolution
+
+        Arguments:
+        - Size (tuple[int, int]): Width and height wanted
+
+        Returns:
+        - (np.ndarray): Resized frame, shared between consumers so should not be drawn on
+        """
+        Frame = self.Resized.get(Size)
+        if Frame is None:
+            Frame = cv2.resize(self.Raw, Size)
+            self.Resized[Size] = Frame
+        return Frame
 
 class CameraManager:
-    def __init__(self):
-        """ Retrieve frames from camera to analyse
+    def __init__(self, CameraIndex=0, BufferSize=4, Size=(900, 700)):
+        """ Reads the camera on its own thread and keeps the latest frames for every consumer
+
+        Arguments:
+        - CameraIndex (int): Camera to open
+        - BufferSize (int): Number of recent frames kept
+        - Size (tuple[int, int]): Default resolution returned by GetFrame
 
         Attributes:
         - Cap (cv2.VideoCapture): Camera
         - Frame (np.ndarray): Current frame
+        - Size (tuple[int, int]): Default resolution returned by GetFrame
+        - Buffer (deque[CapturedFrame]): Most recent frames, oldest first
+        - Lock (threading.Lock): Avoid reading the buffer while it's being written
+        - FirstFrame (threading.Event): Set once a frame has been read
+        - Running (bool): True while the capture thread should keep reading
+        - Thread (threading.Thread): Reads frames from the camera
 
         Raises:
         - RuntimeError: Camera not accessible
@@ -14,27 +66,81 @@ class CameraManager:
         Returns:
         - None
         """
-        self.Cap = cv2.VideoCapture(0)
+        self.Cap = cv2.VideoCapture(CameraIndex)
         if not self.Cap.isOpened():
             raise RuntimeError("Can't access camera")
-        self.Frame = None 
-    
-    def GetFrame(self):
+        self.Frame = None
+        self.Size = Size
+        self.Buffer = deque(maxlen=BufferSize)
+        self.Lock = threading.Lock()
+        self.FirstFrame = threading.Event()
+        self.Running = True
+        self.Thread = threading.Thread(target=self.CaptureLoop, daemon=True)
+        self.Thread.start()
+
+    def CaptureLoop(self):
+        """ Keep reading the camera into the buffer until released
+
+        Returns:
+        - None
+        """
+        Sequence = 0
+        while self.Running:
+            Ret, Frame = self.Cap.read()
+            if not Ret:
+                time.sleep(0.01)
+                continue
+            Sequence += 1
+            with self.Lock:
+                self.Buffer.append(CapturedFrame(Frame, time.time(), Sequence))
+            self.FirstFrame.set()
+
+    def Latest(self):
+        """ Return the most recent frame without waiting for the camera
+
+        Returns:
+        - (CapturedFrame): Most recent frame, None if nothing has been read yet
+        """
+        with self.Lock:
+            if not self.Buffer:
+                return None
+            return self.Buffer[-1]
+
+    def Since(self, Timestamp):
+        """ Return the buffered frames read after the given time
+
+        Arguments:
+        - Timestamp (float): Time of the last frame the consumer has seen
+
+        Returns:
+        - (list[CapturedFrame]): Newer frames, oldest first
+        """
+        with self.Lock:
+            return [Captured for Captured in self.Buffer if Captured.Timestamp > Timestamp]
+
+    def GetFrame(self, Size=None, Timeout=1.0):
         """ Return current frame
 
+        Arguments:
+        - Size (tuple[int, int]): Resolution wanted, defaults to the camera's size
+        - Timeout (float): Seconds to wait for the first frame after starting
+
         Returns:
         - Frame (np.ndarray): Current frame
         """
-        Ret, Frame = self.Cap.read()
-        if not Ret:
-            return None 
-        self.Frame = cv2.resize(Frame, (900, 700))
+        self.FirstFrame.wait(Timeout)
+        Captured = self.Latest()
+        if Captured is None:
+            return None
+        self.Frame = Captured.Resize(Size or self.Size)
         return self.Frame
-    
+
     def Release(self):
         """ Turns off camera
 
         Returns:
         - None
         """
-        self.Cap.release()
\ No newline at end of file
+        self.Running = False
+        self.Thread.join(timeout=1.0)
+        self.Cap.release()
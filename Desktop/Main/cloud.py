@@ -1,37 +1,254 @@
-from supabase import create_client 
-import cv2 
+from supabase import create_client
+import cv2
 import os
+import json
+import time
+import uuid
+import queue
+import threading
 from dotenv import load_dotenv
 from pathlib import Path
 
 load_dotenv(Path(__file__).resolve().parents[2]/".env")
 SupabaseURL = os.getenv("SUPABASE_URL")
 SupabaseKey = os.getenv("SUPABASE_KEY")
-Supabase = create_client(SupabaseURL, SupabaseKey)
+Supabase = None
 
-def UploadLog(Frame, FileName, Message):
-    """ Upload log to database
+def GetClient():
+    """ Create the database client the first time it's needed
+
+    Returns:
+    - Supabase (supabase.Client): Database client
+    """
+    global Supabase
+    if Supabase is None:
+        Supabase = create_client(SupabaseURL, SupabaseKey)
+    return Supabase
+
+def UploadImage(ImageData, FileName, Message, Client=None):
+    """ Upload an encoded image and its log to database
 
     Arguments:
-    - Frame (np.ndarray): Frame when suspicious activity is detected
+    - ImageData (bytes): JPEG encoded image
     - FileName (str): Name of image
     - Message (str): Message to upload
+    - Client (supabase.Client): Database client, defaults to the shared one
 
     Returns:
     - None
     """
-    Success, Buffer = cv2.imencode(".jpg", Frame)
-    ImageData = Buffer.tobytes()
+    if Client is None:
+        Client = GetClient()
 
-    Supabase.storage.from_("snapshots").upload(
-        FileName, 
+    Client.storage.from_("snapshots").upload(
+        FileName,
         ImageData,
-        {"content-type": "image/jpeg"}
+        {"content-type": "image/jpeg", "upsert": "true"}
     )
 
-    PublicURL = Supabase.storage.from_("snapshots").get_public_url(FileName)
+    PublicURL = Client.storage.from_("snapshots").get_public_url(FileName)
 
-    Supabase.table("logs").insert({
+    Client.table("logs").insert({
         "message": Message,
         "image_url": PublicURL
-    }).execute()
\ No newline at end of file
+    }).execute()
+
+def UploadLog(Frame, FileName, Message):
+    """ Upload log to database
+
+    Arguments:
+    - Frame (np.ndarray): Frame when suspicious activity is detected
+    - FileName (str): Name of image
+    - Message (str): Message to upload
+
+    Returns:
+    - None
+    """
+    Success, Buffer = cv2.imencode(".jpg", Frame)
+    UploadImage(Buffer.tobytes(), FileName, Message)
+
+class UploadQueue:
+    def __init__(self, Client=None, Workers=2, MaxSize=16, Retries=4, Backoff=1.0, SpillDirectory=None, RecoverInterval=30.0):
+        """ Uploads logs on background threads so the detection loop never waits on the network
+
+        Arguments:
+        - Client (supabase.Client): Database client, defaults to the shared one
+        - Workers (int): Number of upload threads
+        - MaxSize (int): Logs held in memory before new ones are written to disk
+        - Retries (int): Attempts per log before it's written to disk
+        - Backoff (float): Seconds waited after the first failed attempt, doubled after each failure
+        - SpillDirectory (str): Where logs are kept while offline
+        - RecoverInterval (float): Seconds an idle worker waits before retrying logs kept on disk
+
+        Attributes:
+        - Client (supabase.Client): Database client
+        - Queue (queue.Queue): Logs waiting to be uploaded
+        - Retries (int): Attempts per log
+        - Backoff (float): Seconds waited after the first failed attempt
+        - SpillDirectory (str): Where logs are kept while offline
+        - RecoverInterval (float): Seconds an idle worker waits before retrying logs kept on disk
+        - SpillLock (threading.Lock): Avoid two workers reading the same logs from disk
+        - Uploaded (int): Logs uploaded
+        - Spilled (int): Logs written to disk
+        - Running (bool): True while the workers should keep uploading
+        - Threads (list[threading.Thread]): Upload threads
+
+        Returns:
+        - None
+        """
+        self.Client = Client
+        self.Queue = queue.Queue(maxsize=MaxSize)
+        self.Retries = Retries
+        self.Backoff = Backoff
+        self.SpillDirectory = SpillDirectory or os.path.join(os.path.dirname(__file__), "PendingLogs")
+        self.RecoverInterval = RecoverInterval
+        self.SpillLock = threading.Lock()
+        self.Uploaded = 0
+        self.Spilled = 0
+        self.Running = True
+        self.Threads = [threading.Thread(target=self.Worker, daemon=True) for i in range(Workers)]
+        for Thread in self.Threads:
+            Thread.start()
+
+    def Enqueue(self, Frame, Message, Timestamp):
+        """ Hand a log to the workers without waiting, writing it to disk if the queue is full
+
+        Arguments:
+        - Frame (np.ndarray): Frame when suspicious activity is detected
+        - Message (str): Message to upload
+        - Timestamp (int): Time of the detection, used to name the image
+
+        Returns:
+        - None
+        """
+        try:
+            self.Queue.put_nowait((Frame, Message, Timestamp))
+        except queue.Full:
+            self.Spill(Frame, Message, Timestamp)
+
+    def Encode(self, Frame):
+        """ JPEG encode a frame, unless it's already encoded
+
+        Arguments:
+        - Frame (np.ndarray or bytes): Frame or encoded image
+
+        Returns:
+        - (bytes): JPEG encoded image
+        """
+        if isinstance(Frame, bytes):
+            return Frame
+        Success, Buffer = cv2.imencode(".jpg", Frame)
+        return Buffer.tobytes()
+
+    def Upload(self, Frame, Message, Timestamp):
+        """ Upload a log, retrying with backoff, and write it to disk if every attempt fails
+
+        Arguments:
+        - Frame (np.ndarray or bytes): Frame or encoded image
+        - Message (str): Message to upload
+        - Timestamp (int): Time of the detection
+
+        Returns:
+        - (bool): True if uploaded
+        """
+        ImageData = self.Encode(Frame)
+        for Attempt in range(self.Retries):
+            try:
+                UploadImage(ImageData, f"{Timestamp}.jpg", Message, self.Client)
+                self.Uploaded += 1
+                return True
+            except Exception as Error:
+                print(f"Upload failed ({Attempt + 1}/{self.Retries}): {Error}")
+                if Attempt < self.Retries - 1:
+                    time.sleep(self.Backoff * 2 ** Attempt)
+        self.Spill(ImageData, Message, Timestamp)
+        return False
+
+    def Spill(self, Frame, Message, Timestamp):
+        """ Keep a log on disk until it can be uploaded, named uniquely so logs from the same second don't overwrite each other
+
+        Arguments:
+        - Frame (np.ndarray or bytes): Frame or encoded image
+        - Message (str): Message to upload
+        - Timestamp (int): Time of the detection
+
+        Returns:
+        - None
+        """
+        ImageData = self.Encode(Frame)
+        with self.SpillLock:
+            os.makedirs(self.SpillDirectory, exist_ok=True)
+            BasePath = os.path.join(self.SpillDirectory, f"{Timestamp}-{uuid.uuid4().hex[:8]}")
+            with open(BasePath + ".jpg", "wb") as File:
+                File.write(ImageData)
+            with open(BasePath + ".json", "w") as File:
+                json.dump({"message": Message, "timestamp": Timestamp}, File)
+            self.Spilled += 1
+
+    def Recover(self):
+        """ Move logs kept on disk back into the queue while there's space
+
+        Returns:
+        - None
+        """
+        with self.SpillLock:
+            # A released queue would never upload them, so leave them on disk
+            if not self.Running or not os.path.isdir(self.SpillDirectory):
+                return
+            for Name in sorted(os.listdir(self.SpillDirectory)):
+                if not Name.endswith(".json"):
+                    continue
+                if self.Queue.full():
+                    return
+                BasePath = os.path.join(self.SpillDirectory, Name[:-len(".json")])
+                try:
+                    with open(BasePath + ".json") as File:
+                        Log = json.load(File)
+                    with open(BasePath + ".jpg", "rb") as File:
+                        ImageData = File.read()
+                except (OSError, ValueError):
+                    continue
+                self.Queue.put_nowait((ImageData, Log["message"], Log["timestamp"]))
+                os.remove(BasePath + ".json")
+                os.remove(BasePath + ".jpg")
+
+    def Worker(self):
+        """ Upload logs from the queue, retrying logs on disk when idle
+
+        Returns:
+        - None
+        """
+        while self.Running:
+            try:
+                Frame, Message, Timestamp = self.Queue.get(timeout=self.RecoverInterval)
+            except queue.Empty:
+                self.Recover()
+                continue
+            try:
+                self.Upload(Frame, Message, Timestamp)
+            finally:
+                self.Queue.task_done()
+
+    def Pending(self):
+        """ Number of logs waiting in memory
+
+        Returns:
+        - (int): Queue size
+        """
+        return self.Queue.qsize()
+
+    def Release(self):
+        """ Write whatever is still queued to disk and stop the workers
+
+        Returns:
+        - None
+        """
+        with self.SpillLock:
+            self.Running = False
+        while True:
+            try:
+                Frame, Message, Timestamp = self.Queue.get_nowait()
+            except queue.Empty:
+                break
+            self.Spill(Frame, Message, Timestamp)
+            self.Queue.task_done()
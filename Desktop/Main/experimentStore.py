@@ -0,0 +1,160 @@
+import os
+import re
+import json
+import shutil
+import pandas as pd
+
+class ExperimentStore:
+    def __init__(self, Root=None):
+        """ Keeps every experiment CSV in one partitioned Parquet dataset per monitor, read in a single scan
+
+        Arguments:
+        - Root (str): Folder holding the datasets, defaults to Desktop/Experiments
+
+        Attributes:
+        - Desktop (str): Desktop folder the monitors' Metrics folders are in
+        - Root (str): Folder holding the datasets
+        - Sources (hashmap[str][str]): Metrics folder of each monitor
+
+        Returns:
+        - None
+        """
+        self.Desktop = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        self.Root = Root or os.path.join(self.Desktop, "Experiments")
+        self.Sources = {
+            "Background": os.path.join(self.Desktop, "Background", "Metrics"),
+            "Lingering": os.path.join(self.Desktop, "Lingering", "Metrics"),
+            "Movement": os.path.join(self.Desktop, "Movement", "Metrics"),
+            "Mask": os.path.join(self.Desktop, "Mask", "Metrics")
+        }
+
+    def Experiments(self, Monitor):
+        """ Find a monitor's experiment CSVs, named "{Method} - {Scenario}.csv" or "{Method} MaskLog.csv"
+
+        Arguments:
+        - Monitor (str): Name of the monitor
+
+        Returns:
+        - (list[tuple[str, str, str]]): Method, scenario and path of each experiment
+        """
+        Found = []
+        Directory = self.Sources[Monitor]
+        for Name in sorted(os.listdir(Directory)):
+            Match = re.fullmatch(r"(.+) - (.+)\.csv", Name)
+            if Match:
+                Found.append((Match.group(1), Match.group(2), os.path.join(Directory, Name)))
+                continue
+            Match = re.fullmatch(r"(.+) MaskLog\.csv", Name)
+            if Match:
+                Found.append((Match.group(1), "All", os.path.join(Directory, Name)))
+        return Found
+
+    def Manifest(self, Monitor):
+        """ Read what a monitor's dataset was built from
+
+        Arguments:
+        - Monitor (str): Name of the monitor
+
+        Returns:
+        - (hashmap[str][any]): Modified time of each CSV, and the columns and dtypes of each experiment, None if not built
+        """
+        Marker = os.path.join(self.Root, Monitor, "_built")
+        try:
+            with open(Marker) as File:
+                return json.load(File)
+        except (OSError, ValueError):
+            return None
+
+    def Stale(self, Monitor):
+        """ Check if a monitor's dataset is missing, or its CSVs were added, removed or changed since it was built
+
+        Arguments:
+        - Monitor (str): Name of the monitor
+
+        Returns:
+        - (bool): True if the dataset needs building
+        """
+        Manifest = self.Manifest(Monitor)
+        if Manifest is None:
+            return True
+        Files = {os.path.basename(Path): os.path.getmtime(Path) for Method, Scenario, Path in self.Experiments(Monitor)}
+        return Files != Manifest["Files"]
+
+    def Build(self, Monitor):
+        """ Convert a monitor's CSVs into its dataset, partitioned by method and scenario
+
+        Arguments:
+        - Monitor (str): Name of the monitor
+
+        Returns:
+        - (int): Number of experiments stored
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        Frames = []
+        Manifest = {"Files": {}, "Experiments": []}
+        for Method, Scenario, Path in self.Experiments(Monitor):
+            Manifest["Files"][os.path.basename(Path)] = os.path.getmtime(Path)
+            DF = pd.read_csv(Path)
+            # Experiments log different columns, so the combined table reorders them and widens ints to floats
+            Manifest["Experiments"].append({
+                "Method": Method,
+                "Scenario": Scenario,
+                "Columns": list(DF.columns),
+                "Types": [str(Type) for Type in DF.dtypes]
+            })
+            DF.insert(0, "Index", range(len(DF)))
+            DF["Method"] = Method
+            DF["Scenario"] = Scenario
+            Frames.append(DF)
+
+        Directory = os.path.join(self.Root, Monitor)
+        shutil.rmtree(Directory, ignore_errors=True)
+        os.makedirs(Directory, exist_ok=True)
+        if Frames:
+            Table = pa.Table.from_pandas(pd.concat(Frames, ignore_index=True), preserve_index=False)
+            pq.write_to_dataset(Table, Directory, partition_cols=["Method", "Scenario"], existing_data_behavior="overwrite_or_ignore")
+        with open(os.path.join(Directory, "_built"), "w") as File:
+            json.dump(Manifest, File, indent=2)
+        return len(Frames)
+
+    def Load(self, Monitor, Columns=None, Methods=None, Scenarios=None):
+        """ Read a monitor's experiments in one scan, building the dataset first if its CSVs changed
+
+        Arguments:
+        - Monitor (str): Name of the monitor
+        - Columns (list[str]): Metric columns to read, all by default
+        - Methods (list[str]): Methods to read, all by default
+        - Scenarios (list[str]): Scenarios to read, all by default
+
+        Returns:
+        - (hashmap[tuple[str, str]][pd.DataFrame]): Rows of each method and scenario, in logged order, with their CSV's columns and dtypes
+        """
+        import pyarrow.dataset as ds
+
+        if self.Stale(Monitor):
+            self.Build(Monitor)
+        Manifest = self.Manifest(Monitor)
+        if not Manifest["Experiments"]:
+            return {}
+        Originals = {(Experiment["Method"], Experiment["Scenario"]): Experiment for Experiment in Manifest["Experiments"]}
+
+        Dataset = ds.dataset(os.path.join(self.Root, Monitor), format="parquet", partitioning="hive", exclude_invalid_files=True)
+        Filter = None
+        if Methods is not None:
+            Filter = ds.field("Method").isin(list(Methods))
+        if Scenarios is not None:
+            ScenarioFilter = ds.field("Scenario").isin(list(Scenarios))
+            Filter = ScenarioFilter if Filter is None else Filter & ScenarioFilter
+        if Columns is not None:
+            Columns = ["Index", "Method", "Scenario"] + [Column for Column in Columns if Column in Dataset.schema.names]
+
+        DF = Dataset.to_table(columns=Columns, filter=Filter).to_pandas()
+        Groups = {}
+        for (Method, Scenario), Group in DF.groupby(["Method", "Scenario"], sort=False, observed=True):
+            Original = Originals[(str(Method), str(Scenario))]
+            Types = {Column: Type for Column, Type in zip(Original["Columns"], Original["Types"]) if Column in Group.columns}
+            Group = Group.sort_values("Index")[list(Types)].astype(Types)
+            Groups[(str(Method), str(Scenario))] = Group.reset_index(drop=True)
+        return Groups
@@ -9,9 +9,13 @@ import threading
 from Desktop.Main.camera import CameraManager
 from Desktop.Main.location import GetLocation
 from Desktop.Main.generateMonitors import GenerateMonitors
-from Desktop.Main.generateReferences import GenerateFirebase, RetrieveControlPanel, RetrieveAlerts, RetrieveLocks, RetrieveModels
-from Desktop.Main.setReferences import SetIP, SetLocation, SetBackend
-from Desktop.Main.cloud import UploadLog
+from Desktop.Main.scheduler import MonitorScheduler
+from Desktop.Main.motionGate import MotionGate
+from Desktop.Main.generateReferences import GenerateFirebase, SettingsCache, RetrieveControlPanel, RetrieveAlerts, RetrieveLocks, RetrieveModels
+from Desktop.Main.setReferences import SetIP, SetLocation, SetBackend, ReferencePublisher
+from firebase_admin import db
+from Desktop.Main.cloud import UploadQueue
+from Desktop.Performance.performance import PerformanceMonitor
 import socket
 
 def Firebase():
@@ -24,10 +28,29 @@ def Firebase():
     StreamCurrent = False
     PreviousSuspiciousDetected = False
 
-    LocalIP = str(socket.gethostbyname(socket.gethostname()))
-    SetIP(IPReference, LocalIP)
+    Settings = SettingsCache({
+        "ControlPanel": ControlPanel,
+        "Alerts": AlertReference,
+        "Locks": LockingReference,
+        "Models": ModelReference
+    }, ResyncInterval=60)
+    Settings.Start()
+
+    Publisher = ReferencePublisher(db.reference())
 
-    Monitors = GenerateMonitors()
+    LocalIP = str(socket.gethostbyname(socket.gethostname()))
+    SetIP(IPReference, LocalIP, Publisher)
+
+    Uploader = UploadQueue()
+    Performance = PerformanceMonitor()
+    Scheduler = MonitorScheduler(Deadline=0.8, Performance=Performance)
+    Monitors = GenerateMonitors(Scheduler)
+    Gate = MotionGate()
+    Performance.Track("Uploads", Uploader.Pending)
+    Performance.Track("Writes", Publisher.Waiting)
+    Performance.Track("Late", lambda: len(Scheduler.Running))
+    Performance.Extra("Gate", Gate.Summary)
+    Performance.Extra("Yolo", lambda: Monitors.Monitors["Yolo"].Latency() if "Yolo" in Monitors.Monitors else {})
 
     ctypes.windll.kernel32.SetThreadExecutionState(0x80000002)
     Camera = None
@@ -36,10 +59,12 @@ def Firebase():
     StartAudioStream()
 
     while True:
-        PowerOn, LockOn, CameraOn = RetrieveControlPanel(ControlPanel)
-        AlertsEnabled, AlertsVolume = RetrieveAlerts(AlertReference)
-        DetectionLock, PowerLock = RetrieveLocks(LockingReference)
-        BackgroundModel, ProximityModel, LoiteringModel, MaskModel = RetrieveModels(ModelReference)
+        Performance.StartTick()
+        Settings.MaybeResync()
+        PowerOn, LockOn, CameraOn = RetrieveControlPanel(Settings.Reference("ControlPanel"))
+        AlertsEnabled, AlertsVolume = RetrieveAlerts(Settings.Reference("Alerts"))
+        DetectionLock, PowerLock = RetrieveLocks(Settings.Reference("Locks"))
+        BackgroundModel, ProximityModel, LoiteringModel, MaskModel = RetrieveModels(Settings.Reference("Models"))
 
         if PowerOn and Camera is None:
             Camera = CameraManager()
@@ -65,7 +90,7 @@ def Firebase():
         Message = "Powered off"
 
         Latitude, Longitude = asyncio.run(GetLocation())
-        SetLocation(LocationReference, Latitude, Longitude)
+        SetLocation(LocationReference, Latitude, Longitude, Publisher)
 
         if LockOn:
             ctypes.windll.user32.LockWorkStation()
@@ -77,7 +102,10 @@ def Firebase():
                 ctypes.windll.user32.LockWorkStation()
 
             Frame = Camera.GetFrame()
-            SuspiciousDetected, Message = Main(BackgroundModel, ProximityModel, LoiteringModel, MaskModel, Frame, Monitors)
+            if Frame is None:
+                Message = "Camera unavailable"
+            else:
+                SuspiciousDetected, Message = Main(BackgroundModel, ProximityModel, LoiteringModel, MaskModel, Frame, Monitors, Scheduler, Gate)
 
             if SuspiciousDetected:
                 if DetectionLock:
@@ -87,13 +115,14 @@ def Firebase():
                     winsound.Beep(1500, int(500 * AlertsVolume))
 
                 if not PreviousSuspiciousDetected:
-                    ImageName = str(CurrentTime) + ".jpg"
-                    UploadLog(Frame, ImageName, Message)
+                    Uploader.Enqueue(Frame, Message, CurrentTime)
             PreviousSuspiciousDetected = SuspiciousDetected
             
 
-        SetBackend(BackendReference, SuspiciousDetected, Message, CurrentTime)
+        SetBackend(BackendReference, SuspiciousDetected, Message, CurrentTime, Publisher)
         print("Sent:", Message)
+        Performance.EndTick()
+        Performance.MaybePublish(PerformanceReference, Publisher)
         time.sleep(1)
 
 Firebase()
\ No newline at end of file
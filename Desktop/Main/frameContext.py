@@ -0,0 +1,122 @@
+import cv2
+import threading
+
+class FrameContext:
+    def __init__(self, Pose=None, Yolo=None):
+        """ Shares model outputs of the current frame between monitors so each model runs once per frame
+
+        Arguments:
+        - Pose (mediapipe.solutions.pose.Pose): Shared pose estimation model
+        - Yolo (YOLO): Shared object detection model
+
+        Attributes:
+        - Pose (mediapipe.solutions.pose.Pose): Shared pose estimation model
+        - Yolo (YOLO): Shared object detection model
+        - Frame (np.ndarray): Current frame
+        - FrameID (int): Identifier of the current frame
+        - Cache (hashmap[str][tuple]): Results computed for the current frame, stored with their frame id
+        - Lock (threading.Lock): Guards the frame and cache
+        - KeyLocks (hashmap[str][threading.Lock]): Avoid monitors computing the same result at once
+
+        Returns:
+        - None
+        """
+        self.Pose = Pose
+        self.Yolo = Yolo
+        self.Frame = None
+        self.FrameID = 0
+        self.Cache = {}
+        self.Lock = threading.Lock()
+        self.KeyLocks = {}
+
+    def Update(self, Frame):
+        """ Move onto a new frame, so previous results are no longer used
+
+        Arguments:
+        - Frame (np.ndarray): Current frame
+
+        Returns:
+        - FrameID (int): Identifier of the new frame
+        """
+        with self.Lock:
+            self.FrameID += 1
+            self.Frame = Frame
+            self.Cache = {}
+        return self.FrameID
+
+    def Get(self, Key, Compute):
+        """ Return a result for the current frame, computing it only if it isn't stored yet
+
+        Arguments:
+        - Key (str): Name of the result
+        - Compute (function): Computes the result from the current frame
+
+        Returns:
+        - (any): Result for the current frame
+        """
+        with self.Lock:
+            KeyLock = self.KeyLocks.setdefault(Key, threading.Lock())
+
+        with KeyLock:
+            with self.Lock:
+                FrameID = self.FrameID
+                Frame = self.Frame
+                Stored = self.Cache.get(Key)
+            if Stored is not None and Stored[0] == FrameID:
+                return Stored[1]
+
+            Result = Compute(Frame)
+            with self.Lock:
+                if FrameID == self.FrameID:
+                    self.Cache[Key] = (FrameID, Result)
+            return Result
+
+    def Peek(self, Key):
+        """ Return a result for the current frame only if a monitor already computed it
+
+        Arguments:
+        - Key (str): Name of the result
+
+        Returns:
+        - (any): Result for the current frame, None if it wasn't computed
+        """
+        with self.Lock:
+            Stored = self.Cache.get(Key)
+            if Stored is not None and Stored[0] == self.FrameID:
+                return Stored[1]
+        return None
+
+    def RGB(self):
+        """ Current frame converted to RGB
+
+        Returns:
+        - (np.ndarray): RGB frame
+        """
+        return self.Get("RGB", lambda Frame: cv2.cvtColor(Frame, cv2.COLOR_BGR2RGB))
+
+    def PoseResults(self):
+        """ Pose landmarks of the current frame
+
+        Returns:
+        - (mediapipe.python.solution_base.SolutionOutputs): Pose estimation output
+        """
+        return self.Get("Pose", lambda Frame: self.Pose.process(self.RGB()))
+
+    def YoloResults(self):
+        """ Bounding boxes of the current frame
+
+        Returns:
+        - (ultralytics.engine.results.Results): Object detection output
+        """
+        return self.Get("Yolo", lambda Frame: self.Yolo(Frame, verbose=False)[0])
+
+    def PersonBoxes(self):
+        """ Bounding boxes of every person in the current frame
+
+        Returns:
+        - (np.ndarray): x1, y1, x2, y2 of each person, one row per person
+        """
+        def Extract(Frame):
+            Boxes = self.YoloResults().boxes
+            return Boxes.xyxy[Boxes.cls == 0].cpu().numpy()
+        return self.Get("PersonBoxes", Extract)
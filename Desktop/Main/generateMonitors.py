@@ -1,34 +1,181 @@
-from Desktop.Background import background
-from Desktop.Movement import distance
-from Desktop.Lingering import lingering
-from Desktop.Mask import mask
-from Desktop.Keyboard import keyboardMonitor
-from Desktop.USB import USB
-from Desktop.Battery import battery
-from Desktop.Trackpad import trackpad
-from Desktop.Performance import performance
-
-def GenerateMonitors():
-    """ Generate monitor objects to use
+from Desktop.Main.frameContext import FrameContext
+import os
+import threading
+
+def CreateMonitor(Registry, Name):
+    """ Import and build a monitor or shared model, so unused ones never load their libraries
+
+    Arguments:
+    - Registry (MonitorRegistry): Registry supplying shared models
+    - Name (str): Name of the monitor or shared model
+
+    Raises:
+    - KeyError: Unknown monitor
+
+    Returns:
+    - (any): Monitor or shared model
+    """
+    if Name == "Pose":
+        import mediapipe as mp
+        return mp.solutions.pose.Pose(model_complexity=0, min_detection_confidence=0.5, min_tracking_confidence=0.5)
+    if Name == "Yolo":
+        from Desktop.Main.inferenceEngine import DetectorEngine
+        return DetectorEngine("yolo11n.pt", os.getenv("YOLO_ENGINE", "torch"))
+    if Name == "Loitering":
+        from Desktop.Lingering import lingering
+        return lingering.LingeringMonitor(Registry.Get("Pose"))
+    if Name == "Proximity":
+        from Desktop.Movement import distance
+        return distance.DistanceMonitor(Registry.Get("Pose"), Registry.Get("Yolo"))
+    if Name == "Mask":
+        from Desktop.Mask import mask
+        # Mask only queries persons YOLO finds, through the shared context
+        Registry.Get("Yolo")
+        return mask.MaskMonitor()
+    if Name == "Background":
+        from Desktop.Background import background
+        return background.BackgroundMonitor()
+    if Name == "USB":
+        from Desktop.USB import USB
+        return USB.USBMonitor()
+    if Name == "Battery":
+        from Desktop.Battery import battery
+        return battery.BatteryMonitor(10)
+    if Name == "Keyboard":
+        from Desktop.Keyboard import keyboardMonitor
+        return keyboardMonitor.KeyboardMonitor()
+    if Name == "Trackpad":
+        from Desktop.Trackpad import trackpad
+        return trackpad.TrackpadMonitor()
+    raise KeyError(f"Unknown monitor {Name}")
+
+class MonitorRegistry:
+    def __init__(self, Scheduler=None):
+        """ Imports and builds each monitor the first time it's enabled, and releases it once disabled
+
+        Arguments:
+        - Scheduler (MonitorScheduler): Runs the monitors, releases wait for its late tasks, None if monitors run inline
+
+        Attributes:
+        - Dependencies (hashmap[str][list[str]]): Shared models each monitor uses
+        - Monitors (hashmap[str][any]): Monitors and shared models built so far
+        - Context (FrameContext): Shares pose and YOLO outputs of each frame between monitors
+        - Scheduler (MonitorScheduler): Runs the monitors
+        - Deferred (set[str]): Disabled monitors waiting for their running task to finish before they're released
+        - Lock (threading.RLock): Guards building and releasing, reentrant as monitors build their shared models
+
+        Returns:
+        - None
+        """
+        self.Dependencies = {
+            "Loitering": ["Pose"],
+            "Proximity": ["Pose", "Yolo"],
+            "Mask": ["Yolo"]
+        }
+        self.Monitors = {}
+        self.Context = FrameContext()
+        self.Scheduler = Scheduler
+        self.Deferred = set()
+        self.Lock = threading.RLock()
+
+    def Get(self, Name):
+        """ Return a monitor, importing and building it if needed
+
+        Arguments:
+        - Name (str): Name of the monitor or shared model
+
+        Returns:
+        - (any): Monitor or shared model
+        """
+        with self.Lock:
+            self.Deferred.discard(Name)
+            if Name not in self.Monitors:
+                self.Monitors[Name] = CreateMonitor(self, Name)
+                if Name in ("Pose", "Yolo"):
+                    setattr(self.Context, Name, self.Monitors[Name])
+            return self.Monitors[Name]
+
+    def Enable(self, Settings):
+        """ Build the monitors switched on and release those switched off
+
+        Arguments:
+        - Settings (hashmap[str][bool]): Whether each monitor is enabled
+
+        Returns:
+        - (hashmap[str][any]): Enabled monitors
+        """
+        Enabled = {}
+        for Name, On in Settings.items():
+            if On:
+                Enabled[Name] = self.Get(Name)
+            else:
+                self.Release(Name)
+        return Enabled
+
+    def Release(self, Name):
+        """ Release a monitor, and any shared model nothing else built uses, once the scheduler has no task running it
+
+        Arguments:
+        - Name (str): Name of the monitor
+
+        Returns:
+        - None
+        """
+        with self.Lock:
+            if Name not in self.Monitors:
+                return
+            Future = self.Scheduler.Running.get(Name) if self.Scheduler is not None else None
+            if Future is not None and not Future.done():
+                # A late task may still be inside the monitor or its shared models, so release once it finishes
+                if Name not in self.Deferred:
+                    self.Deferred.add(Name)
+                    Future.add_done_callback(lambda Done, Name=Name: self.ReleaseDeferred(Name))
+                return
+            self.Deferred.discard(Name)
+
+            Monitor = self.Monitors.pop(Name)
+            if hasattr(Monitor, "Release"):
+                Monitor.Release()
+
+            for Shared in self.Dependencies.get(Name, []):
+                if any(Shared in self.Dependencies.get(Other, []) for Other in self.Monitors):
+                    continue
+                Model = self.Monitors.pop(Shared, None)
+                if Model is None:
+                    continue
+                if hasattr(Model, "close"):
+                    Model.close()
+                setattr(self.Context, Shared, None)
+
+    def ReleaseDeferred(self, Name):
+        """ Release a monitor whose late task finished, unless it was enabled again meanwhile
+
+        Arguments:
+        - Name (str): Name of the monitor
+
+        Returns:
+        - None
+        """
+        with self.Lock:
+            if Name in self.Deferred:
+                self.Release(Name)
+
+    def ReleaseAll(self):
+        """ Release every monitor
+
+        Returns:
+        - None
+        """
+        for Name in list(self.Monitors):
+            self.Release(Name)
+
+def GenerateMonitors(Scheduler=None):
+    """ Generate the registry monitors are built from when first enabled
+
+    Arguments:
+    - Scheduler (MonitorScheduler): Runs the monitors, so releases can wait for its late tasks
 
     Returns:
-    - (tuple):
-        - LoiteringMonitor (LingeringMonitor): Monitors loitering
-        - ProximityMonitor (DistanceMonitor): Monitors proximity
-        - MaskMonitor (MaskMonitor): Monitors mask
-        - BackgroundMonitor (BackgroundMonitor): Monitors background
-        - USBMonitor (USBMonitor): Monitors USBs
-        - BatteryMonitor (BatteryMonitor): Monitors battery
-        - KeyboardMonitor (KeyboardMonitor): Monitors keyboard
-        - TrackpadMonitor (TrackpadMonitor): Monitors trackpad
+    - (MonitorRegistry): Builds each monitor on first use
     """
-    LoiteringMonitor = lingering.LingeringMonitor()
-    ProximityMonitor = distance.DistanceMonitor()
-    MaskMonitor = mask.MaskMonitor()
-    BackgroundMonitor = background.BackgroundMonitor()
-    USBMonitor = USB.USBMonitor()
-    BatteryMonitor = battery.BatteryMonitor(10)
-    KeyboardMonitor = keyboardMonitor.KeyboardMonitor()
-    TrackpadMonitor = trackpad.TrackpadMonitor()
-    PerformanceMonitor = performance.PerformanceMonitor()
-    return (LoiteringMonitor, ProximityMonitor, MaskMonitor, BackgroundMonitor, USBMonitor, BatteryMonitor, KeyboardMonitor, TrackpadMonitor)
\ No newline at end of file
+    return MonitorRegistry(Scheduler)
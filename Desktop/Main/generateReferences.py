@@ -1,4 +1,7 @@
 import os
+import copy
+import time
+import threading
 from pathlib import Path
 from dotenv import load_dotenv
 import firebase_admin
@@ -102,4 +105,161 @@ def RetrieveModels(ModelReference):
     ProximityModel = ModelSettings.get("proximity", True)
     LoiteringModel = ModelSettings.get("loitering", True)
     MaskModel = ModelSettings.get("mask", True)
-    return (BackgroundModel, ProximityModel, LoiteringModel, MaskModel)
\ No newline at end of file
+    return (BackgroundModel, ProximityModel, LoiteringModel, MaskModel)
+
+class CachedReference:
+    def __init__(self, Cache, Name):
+        """ Stands in for a database reference by reading the cached snapshot instead
+
+        Arguments:
+        - Cache (SettingsCache): Cache holding the snapshot
+        - Name (str): Name of the reference in the cache
+
+        Returns:
+        - None
+        """
+        self.Cache = Cache
+        self.Name = Name
+
+    def get(self):
+        """ Return the cached value, like firebase_admin.db.Reference.get
+
+        Returns:
+        - (dict): Latest known settings
+        """
+        return self.Cache.Get(self.Name)
+
+class SettingsCache:
+    def __init__(self, References, ResyncInterval=None):
+        """ Keeps a local snapshot of settings updated by database change events
+
+        Arguments:
+        - References (hashmap[str][firebase_admin.db.Reference]): Settings to keep, by name
+        - ResyncInterval (float): Seconds between full reads of every setting, None to rely on events only
+
+        Attributes:
+        - References (hashmap[str][firebase_admin.db.Reference]): Settings to keep, by name
+        - ResyncInterval (float): Seconds between full reads of every setting
+        - Snapshot (hashmap[str][dict]): Latest known value of each setting
+        - Versions (hashmap[str][int]): Number of events applied to each setting, so a full read never replaces a newer event
+        - Listeners (list[firebase_admin.db.ListenerRegistration]): Open change streams
+        - LastResync (float): Timestamp of the latest full read
+        - Lock (threading.Lock): Avoid reading the snapshot while an event updates it
+
+        Returns:
+        - None
+        """
+        self.References = References
+        self.ResyncInterval = ResyncInterval
+        self.Snapshot = {Name: {} for Name in References}
+        self.Versions = {Name: 0 for Name in References}
+        self.Listeners = []
+        self.LastResync = 0.0
+        self.Lock = threading.Lock()
+
+    def Start(self):
+        """ Read every setting once then listen for changes
+
+        Returns:
+        - None
+        """
+        self.Resync()
+        for Name, Reference in self.References.items():
+            self.Listeners.append(Reference.listen(lambda Event, Name=Name: self.OnEvent(Name, Event)))
+
+    def Resync(self):
+        """ Read every setting in full, in case an event was missed, keeping the snapshot if an event arrived during the read
+
+        Returns:
+        - None
+        """
+        for Name, Reference in self.References.items():
+            with self.Lock:
+                Version = self.Versions[Name]
+            Value = Reference.get()
+            with self.Lock:
+                # The event already holds data at least as new as the read, and the next resync catches anything else
+                if self.Versions[Name] == Version:
+                    self.Snapshot[Name] = Value if isinstance(Value, dict) else {}
+        self.LastResync = time.time()
+
+    def MaybeResync(self):
+        """ Resync if the interval has passed since the latest full read
+
+        Returns:
+        - None
+        """
+        if self.ResyncInterval is not None and time.time() - self.LastResync >= self.ResyncInterval:
+            self.Resync()
+
+    def OnEvent(self, Name, Event):
+        """ Apply a put or patch event to the snapshot
+
+        Arguments:
+        - Name (str): Setting the event belongs to
+        - Event (firebase_admin.db.Event): Change sent by the database
+
+        Returns:
+        - None
+        """
+        Keys = [Key for Key in Event.path.split("/") if Key]
+        with self.Lock:
+            Snapshot = copy.deepcopy(self.Snapshot[Name])
+            if not Keys and Event.event_type == "put":
+                Snapshot = Event.data if isinstance(Event.data, dict) else {}
+            else:
+                Parent = Snapshot
+                for Key in Keys[:-1]:
+                    if not isinstance(Parent.get(Key), dict):
+                        Parent[Key] = {}
+                    Parent = Parent[Key]
+
+                if Event.event_type == "patch":
+                    if Keys:
+                        if not isinstance(Parent.get(Keys[-1]), dict):
+                            Parent[Keys[-1]] = {}
+                        Parent = Parent[Keys[-1]]
+                    Changes = Event.data or {}
+                else:
+                    Changes = {Keys[-1]: Event.data}
+
+                for Key, Value in Changes.items():
+                    if Value is None:
+                        Parent.pop(Key, None)
+                    else:
+                        Parent[Key] = Value
+            self.Snapshot[Name] = Snapshot
+            self.Versions[Name] += 1
+
+    def Get(self, Name):
+        """ Return the latest known value of a setting
+
+        Arguments:
+        - Name (str): Setting wanted
+
+        Returns:
+        - (dict): Copy of the setting
+        """
+        with self.Lock:
+            return copy.deepcopy(self.Snapshot[Name])
+
+    def Reference(self, Name):
+        """ Return an object that can be passed to the Retrieve functions in place of the database reference
+
+        Arguments:
+        - Name (str): Setting wanted
+
+        Returns:
+        - (CachedReference): Reads the cached setting
+        """
+        return CachedReference(self, Name)
+
+    def Release(self):
+        """ Stop listening for changes
+
+        Returns:
+        - None
+        """
+        for Listener in self.Listeners:
+            Listener.close()
+        self.Listeners = []
@@ -0,0 +1,113 @@
+import os
+import time
+import numpy as np
+from collections import deque
+from ultralytics import YOLO
+
+class DetectorEngine:
+    def __init__(self, ModelPath="yolo11n.pt", Engine="torch", InputSize=640, WarmupRuns=3, Window=500):
+        """ Loads the detector through PyTorch, ONNX Runtime or OpenVINO at a fixed input size and warms it up
+
+        Arguments:
+        - ModelPath (str): PyTorch weights of the detector
+        - Engine (str): Either torch, onnx or openvino
+        - InputSize (int): Size frames are resized to for the model, fixed so exports stay static
+        - WarmupRuns (int): Blank frames run at startup so the first real frame doesn't pay allocation costs
+        - Window (int): Number of recent calls kept for latency reporting
+
+        Attributes:
+        - Engine (str): Either torch, onnx or openvino
+        - InputSize (int): Size frames are resized to for the model
+        - ModelPath (str): Path of the model actually loaded
+        - Model (YOLO): Detector
+        - Latencies (collections.deque): Seconds taken by recent calls
+        - Calls (int): Number of calls made, excluding warm up
+        - WarmupTime (float): Seconds taken to warm up
+
+        Raises:
+        - ValueError: Unknown engine
+
+        Returns:
+        - None
+        """
+        if Engine not in ("torch", "onnx", "openvino"):
+            raise ValueError(f"Unknown inference engine {Engine}")
+
+        self.Engine = Engine
+        self.InputSize = InputSize
+        self.ModelPath = self.Export(ModelPath) if Engine != "torch" else ModelPath
+        self.Model = YOLO(self.ModelPath, task="detect")
+        self.Latencies = deque(maxlen=Window)
+        self.Calls = 0
+        self.WarmupTime = self.Warmup(WarmupRuns)
+
+    def Export(self, ModelPath):
+        """ Find the exported model next to the weights, exporting it the first time
+
+        Arguments:
+        - ModelPath (str): PyTorch weights of the detector
+
+        Returns:
+        - (str): Path to the ONNX file or OpenVINO folder
+        """
+        Stem = os.path.splitext(ModelPath)[0]
+        ExportPath = f"{Stem}.onnx" if self.Engine == "onnx" else f"{Stem}_openvino_model"
+        if not os.path.exists(ExportPath):
+            ExportPath = YOLO(ModelPath).export(format=self.Engine, imgsz=self.InputSize, dynamic=False, half=False)
+        return ExportPath
+
+    def Warmup(self, Runs):
+        """ Run blank frames through the detector
+
+        Arguments:
+        - Runs (int): Number of blank frames
+
+        Returns:
+        - (float): Seconds taken
+        """
+        Blank = np.zeros((self.InputSize, self.InputSize, 3), dtype=np.uint8)
+        Start = time.perf_counter()
+        for _ in range(Runs):
+            self.Model(Blank, imgsz=self.InputSize, device="cpu", verbose=False)
+        return time.perf_counter() - Start
+
+    def __call__(self, Frame, **Options):
+        """ Run the detector, used in place of a YOLO model
+
+        Arguments:
+        - Frame (np.ndarray): Current frame
+        - Options (dict): Extra YOLO prediction arguments
+
+        Returns:
+        - (list[ultralytics.engine.results.Results]): Detector output
+        """
+        Options.setdefault("imgsz", self.InputSize)
+        Options.setdefault("device", "cpu")
+        Start = time.perf_counter()
+        Results = self.Model(Frame, **Options)
+        self.Latencies.append(time.perf_counter() - Start)
+        self.Calls += 1
+        return Results
+
+    def Latency(self):
+        """ Latency of recent calls in milliseconds
+
+        Returns:
+        - (hashmap[str][float]): Engine, calls, mean, p50 and p95 latency, and warm up time
+        """
+        Report = {"Engine": self.Engine, "Calls": self.Calls, "WarmupMs": round(1000 * self.WarmupTime, 2)}
+        if self.Latencies:
+            Milliseconds = 1000 * np.array(self.Latencies)
+            Report["MeanMs"] = round(float(Milliseconds.mean()), 2)
+            Report["P50Ms"] = round(float(np.percentile(Milliseconds, 50)), 2)
+            Report["P95Ms"] = round(float(np.percentile(Milliseconds, 95)), 2)
+        return Report
+
+if __name__ == "__main__":
+    # Compare the engines on the same frames
+    Frame = np.random.randint(0, 255, (700, 900, 3), dtype=np.uint8)
+    for Engine in ("torch", "onnx", "openvino"):
+        Detector = DetectorEngine("yolo11n.pt", Engine)
+        for _ in range(50):
+            Detector(Frame, verbose=False)
+        print(Detector.Latency())
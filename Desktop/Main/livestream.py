@@ -1,10 +1,150 @@
 import cv2
 import time 
-from fastapi import FastAPI 
+from fastapi import FastAPI, HTTPException 
 from fastapi.responses import StreamingResponse 
 import uvicorn
 import threading
 
+# Highest quality first, the order adaptive streams step down through
+StreamProfiles = {
+    "high": {"Size": (900, 700), "Quality": 95, "FPS": 30},
+    "medium": {"Size": (640, 480), "Quality": 70, "FPS": 15},
+    "low": {"Size": (320, 240), "Quality": 45, "FPS": 5},
+}
+
+# Smallest and largest value a client may request for each setting
+StreamLimits = {
+    "Width": (16, 1920),
+    "Height": (16, 1080),
+    "Quality": (1, 100),
+    "FPS": (0.1, 60),
+}
+
+class StreamQuality:
+    def __init__(self, Profile="high", Width=None, Height=None, Quality=None, FPS=None, Adaptive=True):
+        """ Tracks the resolution, JPEG quality and frame rate sent to one client, stepping down when sends back up
+
+        Arguments:
+        - Profile (str): Name of the requested profile in StreamProfiles
+        - Width (int): Requested width, overrides the profile, the height follows the profile's aspect ratio if not given
+        - Height (int): Requested height, overrides the profile, the width follows the profile's aspect ratio if not given
+        - Quality (int): Requested JPEG quality between 1 and 100, overrides the profile
+        - FPS (float): Requested maximum frame rate, overrides the profile
+        - Adaptive (bool): True to step down automatically when the client falls behind
+
+        Attributes:
+        - Names (list[str]): Profile names, highest quality first
+        - Requested (int): Index of the requested profile
+        - Level (int): Index of the profile currently used
+        - Overrides (hashmap[str][any]): Values requested on top of the profile, within StreamLimits
+        - Adaptive (bool): True to step down automatically
+        - SlowSends (int): Consecutive sends that took longer than a frame
+        - LastChange (float): Timestamp of the last step up or down
+        - SlowLimit (int): Slow sends in a row before stepping down
+        - RecoverAfter (float): Seconds without slow sends before stepping back up
+
+        Raises:
+        - ValueError: Unknown profile, or a requested value that isn't positive
+
+        Returns:
+        - None
+        """
+        self.Names = list(StreamProfiles)
+        if Profile not in StreamProfiles:
+            raise ValueError(f"Unknown profile {Profile}, expected one of {', '.join(self.Names)}")
+        self.Requested = self.Names.index(Profile)
+        self.Level = self.Requested
+        self.Overrides = {"Width": Width, "Height": Height, "Quality": Quality, "FPS": FPS}
+        for Key, Requested in self.Overrides.items():
+            if Requested is not None and not Requested > 0:
+                raise ValueError(f"{Key} must be positive, got {Requested}")
+
+        if (Width is None) != (Height is None):
+            ProfileWidth, ProfileHeight = StreamProfiles[Profile]["Size"]
+            if Height is None:
+                Height = Width * ProfileHeight / ProfileWidth
+            else:
+                Width = Height * ProfileWidth / ProfileHeight
+        if Width is not None:
+            # Scale both sides together so clamping keeps the aspect ratio
+            Scale = min(1.0, StreamLimits["Width"][1] / Width, StreamLimits["Height"][1] / Height)
+            Scale = max(Scale, StreamLimits["Width"][0] / Width, StreamLimits["Height"][0] / Height)
+            self.Overrides["Width"] = min(StreamLimits["Width"][1], max(StreamLimits["Width"][0], round(Width * Scale)))
+            self.Overrides["Height"] = min(StreamLimits["Height"][1], max(StreamLimits["Height"][0], round(Height * Scale)))
+        for Key in ("Quality", "FPS"):
+            if self.Overrides[Key] is not None:
+                Lowest, Highest = StreamLimits[Key]
+                self.Overrides[Key] = min(Highest, max(Lowest, self.Overrides[Key]))
+        self.Adaptive = Adaptive
+        self.SlowSends = 0
+        self.LastChange = time.time()
+        self.SlowLimit = 3
+        self.RecoverAfter = 10.0
+
+    def Current(self):
+        """ Settings to encode and pace the next frame with, never above what the client requested
+
+        Returns:
+        - Tuple:
+            - Size (tuple[int, int]): Width and height
+            - Quality (int): JPEG quality
+            - FPS (float): Maximum frame rate
+        """
+        Profile = StreamProfiles[self.Names[self.Level]]
+        Values = {
+            "Width": Profile["Size"][0],
+            "Height": Profile["Size"][1],
+            "Quality": Profile["Quality"],
+            "FPS": Profile["FPS"]
+        }
+
+        if self.Overrides["Width"] is not None:
+            Scale = 1.0
+            if self.Level > self.Requested:
+                # Shrink the requested size to fit the lower profile without changing its shape
+                Scale = min(1.0, Values["Width"] / self.Overrides["Width"], Values["Height"] / self.Overrides["Height"])
+            Values["Width"] = max(1, round(self.Overrides["Width"] * Scale))
+            Values["Height"] = max(1, round(self.Overrides["Height"] * Scale))
+
+        for Key in ("Quality", "FPS"):
+            Requested = self.Overrides[Key]
+            if Requested is None:
+                continue
+            if self.Level > self.Requested:
+                Values[Key] = min(Values[Key], Requested)
+            else:
+                Values[Key] = Requested
+
+        Size = (int(Values["Width"]), int(Values["Height"]))
+        return Size, max(1, min(100, int(Values["Quality"]))), max(0.1, float(Values["FPS"]))
+
+    def Report(self, SendTime):
+        """ Step the profile down if sends keep taking longer than a frame, back up once they recover
+
+        Arguments:
+        - SendTime (float): Seconds the client took to take the last frame
+
+        Returns:
+        - None
+        """
+        if not self.Adaptive:
+            return
+
+        Size, Quality, FPS = self.Current()
+        CurrentTime = time.time()
+        if SendTime > 1.0 / FPS:
+            self.SlowSends += 1
+            if self.SlowSends >= self.SlowLimit and self.Level < len(self.Names) - 1:
+                self.Level += 1
+                self.SlowSends = 0
+                self.LastChange = CurrentTime
+            return
+
+        self.SlowSends = 0
+        if self.Level > self.Requested and CurrentTime - self.LastChange >= self.RecoverAfter:
+            self.Level -= 1
+            self.LastChange = CurrentTime
+
 class LiveStream:
     def __init__(self):
         """ Ensure frames are streamed without them being overwritten
@@ -13,6 +153,11 @@ class LiveStream:
         - Frame (np.ndarray): Current frame
         - On (bool): Determine if live stream is on or not
         - Lock (thread.lock): Threading lock to avoid overwriting frames sent to live stream
+        - Condition (threading.Condition): Wakes clients when a new frame arrives
+        - Sequence (int): Number of the current frame
+        - Encoded (hashmap[tuple][bytes]): Current frame encoded as JPEG, by sequence, resolution and quality
+        - Encoding (hashmap[tuple][threading.Event]): Encodes in progress, set once done so other clients wait instead of encoding again
+        - Encodes (int): Number of frames encoded
 
         Returns:
         - None
@@ -20,6 +165,11 @@ class LiveStream:
         self.Frame = None 
         self.On = False
         self.Lock = threading.Lock()
+        self.Condition = threading.Condition(self.Lock)
+        self.Sequence = 0
+        self.Encoded = {}
+        self.Encoding = {}
+        self.Encodes = 0
 
     def Update(self, Frame):
         """ Uses the lock to update the frame to stream
@@ -30,52 +180,122 @@ class LiveStream:
         Returns:
         - None
         """
-        with self.Lock:
+        with self.Condition:
             self.Frame = Frame.copy()
+            self.Sequence += 1
+            self.Encoded = {}
+            self.Condition.notify_all()
+
+    def Next(self, LastSequence, Size=None, Quality=95, Timeout=1.0):
+        """ Wait for a frame newer than the one the client last sent, encoding it once per resolution and quality
+
+        Arguments:
+        - LastSequence (int): Number of the frame the client last sent
+        - Size (tuple[int, int]): Width and height to send, None for the frame's own size
+        - Quality (int): JPEG quality
+        - Timeout (float): Seconds to wait for a new frame
+
+        Returns:
+        - Tuple:
+            - Sequence (int): Number of the returned frame
+            - Encoded (bytes): JPEG of the frame, None if no new frame arrived
+        """
+        with self.Condition:
+            self.Condition.wait_for(lambda: self.Frame is not None and self.Sequence != LastSequence, timeout=Timeout)
+            if self.Frame is None or self.Sequence == LastSequence:
+                return LastSequence, None
+
+            # Update swaps in a new copy rather than writing into this one, so it's safe to encode without the lock
+            Sequence, Frame = self.Sequence, self.Frame
+            Key = (Sequence, Size, Quality)
+            if Key in self.Encoded:
+                return Sequence, self.Encoded[Key]
+            Done = self.Encoding.get(Key)
+            if Done is None:
+                self.Encoding[Key] = threading.Event()
 
-    def Frames(self):
-        """ Streams the current frame if there is one via the locking mechanism
+        if Done is not None:
+            Done.wait(Timeout)
+            with self.Condition:
+                return Sequence, self.Encoded.get(Key)
+
+        Encoded = None
+        try:
+            if Size is not None and Size != (Frame.shape[1], Frame.shape[0]):
+                Frame = cv2.resize(Frame, Size, interpolation=cv2.INTER_AREA)
+            Success, Buffer = cv2.imencode(".jpg", Frame, [cv2.IMWRITE_JPEG_QUALITY, Quality])
+            if Success:
+                Encoded = Buffer.tobytes()
+        finally:
+            with self.Condition:
+                if Encoded is not None:
+                    self.Encodes += 1
+                    # Kept even if a newer frame arrived, for clients waiting on this encode, and dropped on the next update
+                    self.Encoded[Key] = Encoded
+                self.Encoding.pop(Key).set()
+        return Sequence, Encoded
+
+    def Frames(self, Quality=None):
+        """ Streams each new frame once, skipping frames the client was too slow to send
+
+        Arguments:
+        - Quality (StreamQuality): Resolution, JPEG quality and frame rate for this client
 
         Returns:
         - None
         """
+        if Quality is None:
+            Quality = StreamQuality()
+        LastSequence = 0
         while True:
             if not self.On:
                 time.sleep(0.1)
                 continue 
 
-            with self.Lock:
-                if self.Frame is None:
-                    Frame = None
-                else:
-                    Frame = self.Frame.copy()
-
-            if Frame is None:
-                time.sleep(0.1)
-                continue 
-
-            Success, Buffer = cv2.imencode(".jpg", Frame)
-            if not Success:
+            Size, JPEGQuality, FPS = Quality.Current()
+            FrameStart = time.time()
+            Sequence, Encoded = self.Next(LastSequence, Size, JPEGQuality)
+            LastSequence = Sequence
+            if Encoded is None:
                 continue 
 
+            SendStart = time.time()
             yield (
                 b"--frame\r\n"
                 b"Content-Type: image/jpeg\r\n\r\n" +
-                Buffer.tobytes() + b"\r\n"
+                Encoded + b"\r\n"
             )
+            Quality.Report(time.time() - SendStart)
+            time.sleep(max(0.0, 1.0 / FPS - (time.time() - FrameStart)))
 
 App = FastAPI()
 Streamer = LiveStream()
 
 @App.get("/Stream")
-def Stream():
+def Stream(profile: str = "high", width: int = None, height: int = None, quality: int = None, fps: float = None, adaptive: bool = True):
     """ Streams the frames to a local HTTP server
 
+    Arguments:
+    - profile (str): Starting profile, one of high, medium or low
+    - width (int): Width of the frames, overrides the profile, keeping its aspect ratio if height isn't given
+    - height (int): Height of the frames, overrides the profile, keeping its aspect ratio if width isn't given
+    - quality (int): JPEG quality between 1 and 100, overrides the profile
+    - fps (float): Maximum frames per second, overrides the profile
+    - adaptive (bool): True to lower the quality when the client falls behind
+
+    Raises:
+    - HTTPException: Unknown profile or a value that isn't positive, before any frame is streamed
+
     Returns:
     - None
     """
+    try:
+        Quality = StreamQuality(profile, width, height, quality, fps, adaptive)
+    except ValueError as Error:
+        raise HTTPException(status_code=400, detail=str(Error))
+
     return StreamingResponse(
-        Streamer.Frames(),
+        Streamer.Frames(Quality),
         media_type = "multipart/x-mixed-replace; boundary=frame"
     )
 
@@ -99,9 +319,11 @@ def StreamLoop(Camera):
     Returns:
     - None
     """
+    LastSequence = 0
     while True:
         if Camera is not None and Streamer.On:
-            Frame = Camera.GetFrame()
-            if Frame is not None:
-                Streamer.Update(Frame)
+            Captured = Camera.Latest()
+            if Captured is not None and Captured.Sequence != LastSequence:
+                LastSequence = Captured.Sequence
+                Streamer.Update(Captured.Resize(Camera.Size))
         time.sleep(0.03)
\ No newline at end of file
@@ -1,7 +1,70 @@
 import time
 import ctypes
 
-def Main(BackgroundModel, ProximityModel, LoiteringModel, MaskModel, Frame, Monitors):
+def DetectorTasks(Enabled, Frame, Context):
+    """ Calls that run each enabled person detector on a frame
+
+    Arguments:
+    - Enabled (hashmap[str][any]): Enabled monitors by name
+    - Frame (np.ndarray): Current frame
+    - Context (FrameContext): Shared model outputs for the current frame
+
+    Returns:
+    - Tasks (hashmap[str][function]): Detector name and the call that returns its result
+    """
+    Tasks = {}
+    for Name in ("Loitering", "Proximity", "Mask"):
+        if Name in Enabled:
+            Tasks[Name] = lambda Monitor=Enabled[Name]: Monitor.Live(Frame, Context)
+    return Tasks
+
+def SubmitMonitors(Enabled, Frame, Context, Scheduler, Gate=None):
+    """ Start the enabled frame monitors, skipping the person detectors while the gate sees a still scene
+
+    Arguments:
+    - Enabled (hashmap[str][any]): Enabled monitors by name
+    - Frame (np.ndarray): Current frame
+    - Context (FrameContext): Shared model outputs for the current frame
+    - Scheduler (MonitorScheduler): Runs the monitors at the same time
+    - Gate (MotionGate): Skips the person detectors while the scene is still, None to always run them
+
+    Returns:
+    - Ran (bool): True if any person detector was started
+    """
+    Tasks = DetectorTasks(Enabled, Frame, Context)
+    if Gate is not None and Tasks:
+        Ran = Gate.ShouldRun(Frame)
+        Gate.Count(list(Tasks), Ran)
+        if not Ran:
+            Tasks = {}
+    else:
+        Ran = bool(Tasks)
+    if "Background" in Enabled:
+        Tasks["Background"] = lambda: Enabled["Background"].Live(Frame)
+    Scheduler.Submit(Tasks)
+    return Ran
+
+def CollectMonitors(Context, Scheduler, Gate=None, Ran=False):
+    """ Wait for the monitors started by SubmitMonitors, telling the gate whether a person was seen
+
+    Arguments:
+    - Context (FrameContext): Shared model outputs for the current frame
+    - Scheduler (MonitorScheduler): Runs the monitors at the same time
+    - Gate (MotionGate): Skips the person detectors while the scene is still, None to always run them
+    - Ran (bool): True if any person detector was started
+
+    Returns:
+    - Results (hashmap[str][any]): Result of each monitor that finished in time
+    """
+    Results = Scheduler.Collect()
+    if Gate is not None and Ran:
+        Boxes = Context.Peek("PersonBoxes")
+        Pose = Context.Peek("Pose")
+        PersonPresent = (Boxes is not None and len(Boxes) > 0) or (Pose is not None and Pose.pose_landmarks is not None)
+        Gate.Observe(PersonPresent or any(Results.get(Name) for Name in ("Loitering", "Proximity", "Mask")))
+    return Results
+
+def Main(BackgroundModel, ProximityModel, LoiteringModel, MaskModel, Frame, Monitors, Scheduler, Gate=None):
     """ Calls computer vision components
 
     Argments:
@@ -10,37 +73,62 @@ def Main(BackgroundModel, ProximityModel, LoiteringModel, MaskModel, Frame, Moni
     - LoiteringModel (bool): True if activated
     - MaskModel (bool): True if activated
     - Frame (np.ndarray): Current frame
-    - Monitors (tuple): List of all the monitors
-    
+    - Monitors (MonitorRegistry): Builds monitors when enabled and releases them when disabled
+    - Scheduler (MonitorScheduler): Runs the computer vision components at the same time
+    - Gate (MotionGate): Skips the person detectors while the scene is still, None to always run them
+
     Returns:
     - None
     """
     ctypes.windll.kernel32.SetThreadExecutionState(0x80000002)
-    LoiteringMonitor, ProximityMonitor, MaskMonitor, BackgroundMonitor, USBMonitor, BatteryMonitor, KeyboardMonitor, TrackpadMonitor = Monitors
+    Enabled = Monitors.Enable({
+        "Loitering": LoiteringModel,
+        "Proximity": ProximityModel,
+        "Mask": MaskModel,
+        "Background": BackgroundModel,
+        "USB": True,
+        "Battery": True,
+        "Keyboard": True,
+        "Trackpad": True
+    })
+    Context = Monitors.Context
+    Context.Update(Frame)
 
     try:
+        Ran = SubmitMonitors(Enabled, Frame, Context, Scheduler, Gate)
+
         Message = ""
-        if LoiteringModel and LoiteringMonitor.Live(Frame):
+        USBChanged = Enabled["USB"].Live()
+        BatteryLow = Enabled["Battery"].Live()
+        KeyUsed = Enabled["Keyboard"].Live()
+        MouseMoved = Enabled["Trackpad"].LiveMove()
+        MouseClicked = Enabled["Trackpad"].LiveClick()
+        MouseScrolled = Enabled["Trackpad"].LiveScroll()
+
+        Results = CollectMonitors(Context, Scheduler, Gate, Ran)
+        if Results.get("Loitering"):
             Message += "Someone is loitering\n"
-        if ProximityModel and ProximityMonitor.Live(Frame):
+        if Results.get("Proximity"):
             Message += "Someone is within proximity\n"
-        if MaskModel and MaskMonitor.Live(Frame):
+        if Results.get("Mask"):
             Message += "Someone is wearing a mask\n"
-        if BackgroundModel and BackgroundMonitor.Live(Frame):
+        if Results.get("Background"):
             Message += "Background has changed\n"
-        if USBMonitor.Live():
+        if USBChanged:
             Message += "USB has been modified\n"
-        if BatteryMonitor.Live():
+        if BatteryLow:
             Message += "Battery is low\n"
-        if KeyboardMonitor.Live():
+        if KeyUsed:
             Message += "Keyboard was used\n"
-        if TrackpadMonitor.LiveMove():
+        if MouseMoved:
             Message += "Mouse was moved\n"
-        if TrackpadMonitor.LiveClick():
+        if MouseClicked:
             Message += "Mouse was clicked\n"
-        if TrackpadMonitor.LiveScroll():
+        if MouseScrolled:
             Message += "Mouse was scrolled\n"
-            
+        if Scheduler.Late:
+            print("Late:", ", ".join(Scheduler.Late))
+
         if Message != "":
             return (True,Message)
         else:
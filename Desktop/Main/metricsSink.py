@@ -0,0 +1,250 @@
+import os
+import csv
+import time
+import uuid
+import atexit
+import threading
+
+Casts = {"int64": int, "float64": float, "bool": bool, "string": str}
+
+class MetricsSink:
+    def __init__(self, Path, Header, BatchSize=200, FlushInterval=5.0, Format="csv", Types=None):
+        """ Buffers metric rows in memory and writes them in batches through one open file
+
+        Arguments:
+        - Path (str): Log file, its extension is swapped for a folder of parquet or arrow parts
+        - Header (list[str]): Column names
+        - BatchSize (int): Rows buffered before they're written
+        - FlushInterval (float): Seconds rows may wait in the buffer
+        - Format (str): Either csv, parquet or arrow
+        - Types (list[str]): Type of each column for parquet and arrow output, either int64, float64, bool or string, all string by default
+
+        Attributes:
+        - Path (str): Log file, or folder of parts for parquet and arrow output
+        - Header (list[str]): Column names
+        - Types (list[str]): Type of each column
+        - BatchSize (int): Rows buffered before they're written
+        - MaxRows (int): Rows kept while writes fail, the oldest are dropped past this
+        - FlushInterval (float): Seconds rows may wait in the buffer
+        - Format (str): Either csv, parquet or arrow
+        - Rows (list[list]): Rows waiting to be written
+        - File (file): Open csv file, None until the first write
+        - Writer (csv.writer or pyarrow writer): Writes batches to the file
+        - Part (str): Parquet or arrow file of this run, None until the first write
+        - LastFlush (float): Timestamp of the last write
+        - Lock (threading.Lock): Guards the buffer, as monitors log from worker threads
+
+        Raises:
+        - ValueError: Unknown format, or types that don't match the header
+
+        Returns:
+        - None
+        """
+        if Format not in ("csv", "parquet", "arrow"):
+            raise ValueError(f"Unknown metrics format {Format}")
+        if Format != "csv":
+            Path = os.path.splitext(Path)[0] + f".{Format}"
+        Types = list(Types) if Types is not None else ["string"] * len(Header)
+        if len(Types) != len(Header) or any(Type not in Casts for Type in Types):
+            raise ValueError(f"Metrics types {Types} don't match header {list(Header)}")
+
+        self.Path = Path
+        self.Header = list(Header)
+        self.Types = Types
+        self.BatchSize = BatchSize
+        self.MaxRows = 10 * BatchSize
+        self.FlushInterval = FlushInterval
+        self.Format = Format
+        self.Rows = []
+        self.File = None
+        self.Writer = None
+        self.Part = None
+        self.LastFlush = time.time()
+        self.Lock = threading.Lock()
+
+    def Write(self, Row):
+        """ Add a row, writing the buffer once it's full or old enough
+
+        Arguments:
+        - Row (list): Values in header order
+
+        Returns:
+        - None
+        """
+        with self.Lock:
+            self.Rows.append(Row)
+            if len(self.Rows) >= self.BatchSize or time.time() - self.LastFlush >= self.FlushInterval:
+                self.FlushLocked()
+
+    def Open(self):
+        """ Open the log for appending, writing the header to a new csv file
+
+        Returns:
+        - None
+        """
+        if self.Format == "csv":
+            New = not os.path.exists(self.Path) or os.path.getsize(self.Path) == 0
+            self.File = open(self.Path, "a", newline="")
+            self.Writer = csv.writer(self.File)
+            if New:
+                self.Writer.writerow(self.Header)
+
+    def Schema(self):
+        """ Column types of parquet and arrow output, from the header and types rather than the values so empty columns keep their type
+
+        Returns:
+        - (pyarrow.Schema): Schema of every part
+        """
+        import pyarrow as pa
+        return pa.schema([(Name, pa.type_for_alias(Type)) for Name, Type in zip(self.Header, self.Types)])
+
+    def Cast(self, Value, Type):
+        """ Convert a value to its column's type, as null if it can't be
+
+        Arguments:
+        - Value (any): Value logged
+        - Type (str): Type of the column
+
+        Returns:
+        - (any): Converted value
+        """
+        if Value is None:
+            return None
+        try:
+            return Casts[Type](Value)
+        except (TypeError, ValueError):
+            return None
+
+    def WriteArrow(self, Rows):
+        """ Write rows as one record batch, starting this run's part on the first batch so earlier runs are kept
+
+        Arguments:
+        - Rows (list[list]): Rows to write
+
+        Returns:
+        - None
+        """
+        import pyarrow as pa
+        Schema = self.Schema()
+        if self.Writer is None:
+            os.makedirs(self.Path, exist_ok=True)
+            self.Part = os.path.join(self.Path, f"part-{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}.{self.Format}")
+            if self.Format == "parquet":
+                import pyarrow.parquet as pq
+                self.Writer = pq.ParquetWriter(self.Part, Schema)
+            else:
+                self.Writer = pa.ipc.new_file(self.Part, Schema)
+        Columns = {Name: [self.Cast(Row[Index], self.Types[Index]) for Row in Rows] for Index, Name in enumerate(self.Header)}
+        self.Writer.write_table(pa.Table.from_pydict(Columns, schema=Schema))
+
+    def CloseWriter(self):
+        """ Close the open file or part, ignoring errors so a broken writer can be replaced
+
+        Returns:
+        - None
+        """
+        try:
+            if self.File is not None:
+                self.File.close()
+            elif self.Writer is not None:
+                self.Writer.close()
+        except Exception as Error:
+            print(f"Failed to close {self.Path}: {Error}")
+        self.File = None
+        self.Writer = None
+
+    def FlushLocked(self):
+        """ Write the buffer, with the lock already held, keeping the rows to retry if the write fails
+
+        Returns:
+        - (bool): True if the buffer was written
+        """
+        self.LastFlush = time.time()
+        if not self.Rows:
+            return True
+        try:
+            if self.Format == "csv":
+                if self.File is None:
+                    self.Open()
+                self.Writer.writerows(self.Rows)
+                self.File.flush()
+            else:
+                self.WriteArrow(self.Rows)
+        except Exception as Error:
+            print(f"Failed to write metrics to {self.Path}: {Error}")
+            self.CloseWriter()
+            if len(self.Rows) > self.MaxRows:
+                print(f"Dropping {len(self.Rows) - self.MaxRows} oldest metric rows of {self.Path}")
+                del self.Rows[:-self.MaxRows]
+            return False
+        self.Rows = []
+        return True
+
+    def Flush(self):
+        """ Write the buffer
+
+        Returns:
+        - (bool): True if the buffer was written
+        """
+        with self.Lock:
+            return self.FlushLocked()
+
+    def Close(self):
+        """ Write the buffer and close the file
+
+        Returns:
+        - None
+        """
+        with self.Lock:
+            self.FlushLocked()
+            self.CloseWriter()
+
+Sinks = {}
+SinksLock = threading.Lock()
+
+def FlushLoop(Interval):
+    """ Write buffers that have waited too long, for logs that stop receiving rows
+
+    Arguments:
+    - Interval (float): Seconds between checks
+
+    Returns:
+    - None
+    """
+    while True:
+        time.sleep(Interval)
+        with SinksLock:
+            Open = list(Sinks.values())
+        for Sink in Open:
+            if time.time() - Sink.LastFlush >= Sink.FlushInterval:
+                Sink.Flush()
+
+def CloseAll():
+    """ Write and close every log, run at exit
+
+    Returns:
+    - None
+    """
+    with SinksLock:
+        Open = list(Sinks.values())
+    for Sink in Open:
+        Sink.Close()
+
+def GetSink(Path, Header, Types=None):
+    """ Return the shared sink of a log, creating it on first use
+
+    Arguments:
+    - Path (str): Log file
+    - Header (list[str]): Column names
+    - Types (list[str]): Type of each column for parquet and arrow output
+
+    Returns:
+    - (MetricsSink): Sink of the log, in the format set by METRICS_FORMAT
+    """
+    with SinksLock:
+        if not Sinks:
+            atexit.register(CloseAll)
+            threading.Thread(target=FlushLoop, args=(5.0,), daemon=True).start()
+        if Path not in Sinks:
+            Sinks[Path] = MetricsSink(Path, Header, Format=os.getenv("METRICS_FORMAT", "csv"), Types=Types)
+        return Sinks[Path]
@@ -0,0 +1,115 @@
+import cv2
+import time
+import numpy as np
+
+class MotionGate:
+    def __init__(self, Size=(32, 24), Threshold=10, Fraction=0.01, IdleInterval=5, Hold=3.0):
+        """ Cheap frame differencing on a tiny thumbnail that decides when the expensive monitors need to run
+
+        Arguments:
+        - Size (tuple[int, int]): Width and height of the thumbnail
+        - Threshold (int): Grayscale difference for a thumbnail pixel to count as changed
+        - Fraction (float): Fraction of changed thumbnail pixels counted as motion
+        - IdleInterval (int): While nothing moves, run the monitors once every this many ticks
+        - Hold (float): Seconds to stay at full rate after the last motion or person
+
+        Attributes:
+        - Size (tuple[int, int]): Width and height of the thumbnail
+        - Threshold (int): Grayscale difference for a thumbnail pixel to count as changed
+        - Fraction (float): Fraction of changed thumbnail pixels counted as motion
+        - IdleInterval (int): While nothing moves, run the monitors once every this many ticks
+        - Hold (float): Seconds to stay at full rate after the last motion or person
+        - Previous (np.ndarray): Thumbnail of the previous frame
+        - LastActive (float): Timestamp of the last motion or person
+        - IdleTicks (int): Ticks since the monitors last ran while idle
+        - PersonPresent (bool): A person was seen on the latest tick the monitors ran
+        - Runs (hashmap[str][int]): Times each monitor ran
+        - Skips (hashmap[str][int]): Times each monitor was skipped
+
+        Returns:
+        - None
+        """
+        self.Size = Size
+        self.Threshold = Threshold
+        self.Fraction = Fraction
+        self.IdleInterval = IdleInterval
+        self.Hold = Hold
+        self.Previous = None
+        self.LastActive = 0.0
+        self.IdleTicks = 0
+        self.PersonPresent = False
+        self.Runs = {}
+        self.Skips = {}
+
+    def Moved(self, Frame):
+        """ Compare the frame's thumbnail with the previous one
+
+        Arguments:
+        - Frame (np.ndarray): Current frame
+
+        Returns:
+        - (bool): True if enough of the thumbnail changed
+        """
+        Thumbnail = cv2.resize(cv2.cvtColor(Frame, cv2.COLOR_BGR2GRAY), self.Size, interpolation=cv2.INTER_AREA).astype(np.int16)
+        Previous = self.Previous
+        self.Previous = Thumbnail
+        if Previous is None:
+            return True
+        return np.mean(np.abs(Thumbnail - Previous) > self.Threshold) > self.Fraction
+
+    def ShouldRun(self, Frame):
+        """ Decide whether the expensive monitors run on this frame
+
+        Arguments:
+        - Frame (np.ndarray): Current frame
+
+        Returns:
+        - (bool): True at full rate while there is motion or a person, otherwise once every IdleInterval ticks
+        """
+        CurrentTime = time.time()
+        if self.Moved(Frame) or self.PersonPresent:
+            self.LastActive = CurrentTime
+
+        if CurrentTime - self.LastActive <= self.Hold:
+            self.IdleTicks = 0
+            return True
+
+        self.IdleTicks += 1
+        if self.IdleTicks >= self.IdleInterval:
+            self.IdleTicks = 0
+            return True
+        return False
+
+    def Observe(self, PersonPresent):
+        """ Record whether the monitors saw a person, so a still person keeps the full rate
+
+        Arguments:
+        - PersonPresent (bool): True if a person was seen
+
+        Returns:
+        - None
+        """
+        self.PersonPresent = PersonPresent
+
+    def Count(self, Names, Ran):
+        """ Add to the run or skip counters
+
+        Arguments:
+        - Names (list[str]): Monitors affected
+        - Ran (bool): True if they ran, False if they were skipped
+
+        Returns:
+        - None
+        """
+        Counters = self.Runs if Ran else self.Skips
+        for Name in Names:
+            Counters[Name] = Counters.get(Name, 0) + 1
+
+    def Summary(self):
+        """ Runs and skips of each monitor
+
+        Returns:
+        - (hashmap[str][hashmap[str][int]]): Runs and skips keyed by monitor
+        """
+        Names = set(self.Runs) | set(self.Skips)
+        return {Name: {"Runs": self.Runs.get(Name, 0), "Skips": self.Skips.get(Name, 0)} for Name in sorted(Names)}
@@ -0,0 +1,67 @@
+import numpy as np
+from matplotlib.collections import PolyCollection
+
+def EncodeStatus(Statuses, Convert):
+    """ Convert a status column to numbers, converting each distinct status once through its categorical codes
+
+    Arguments:
+    - Statuses (pd.Series): Status of each frame
+    - Convert (function): Converts one status to a number
+
+    Returns:
+    - (np.ndarray): Number of each frame, missing statuses go through Convert too, nan if it can't take them
+    """
+    Categories = Statuses.astype("category")
+    try:
+        Missing = Convert(np.nan)
+    except (AttributeError, TypeError):
+        Missing = np.nan
+    Values = np.array([Convert(Category) for Category in Categories.cat.categories] + [Missing], dtype=np.float64)
+    # Missing statuses have code -1, which picks the trailing value
+    return Values[Categories.cat.codes.to_numpy()]
+
+def RunLengths(Mask, X=None):
+    """ Find the runs of consecutive true values
+
+    Arguments:
+    - Mask (np.ndarray): True or false for each frame
+    - X (np.ndarray): Position of each frame, runs are split where positions skip, None to only use row order
+
+    Returns:
+    - Tuple:
+        - Starts (np.ndarray): Index of the first frame of each run
+        - Ends (np.ndarray): Index of the last frame of each run
+    """
+    Mask = np.asarray(Mask, dtype=bool)
+    # Whether each frame carries on the run of the frame before it
+    Joined = np.zeros(len(Mask), dtype=bool)
+    Joined[1:] = Mask[1:] & Mask[:-1]
+    if X is not None:
+        Joined[1:] &= np.diff(np.asarray(X, dtype=np.float64)) == 1
+    Last = Mask.copy()
+    Last[:-1] &= ~Joined[1:]
+    return np.flatnonzero(Mask & ~Joined), np.flatnonzero(Last)
+
+def DrawSpans(Ax, X, Mask, Padding=0.5, **Style):
+    """ Shade every run of true frames as one collection, instead of a span per frame, without bridging skipped positions
+
+    Arguments:
+    - Ax (matplotlib.axes.Axes): Axis to draw on
+    - X (np.ndarray): Position of each frame
+    - Mask (np.ndarray): Frames to shade
+    - Padding (float): Distance shaded either side of a run
+    - Style (dict): Colour, alpha and other collection styling
+
+    Returns:
+    - (matplotlib.collections.PolyCollection): Shaded runs, None if there are none
+    """
+    X = np.asarray(X, dtype=np.float64)
+    Starts, Ends = RunLengths(Mask, X)
+    if len(Starts) == 0:
+        return None
+    Left = X[Starts] - Padding
+    Right = X[Ends] + Padding
+    Vertices = [[(L, 0), (L, 1), (R, 1), (R, 0)] for L, R in zip(Left, Right)]
+    Collection = PolyCollection(Vertices, transform=Ax.get_xaxis_transform(), linewidth=0, **Style)
+    Ax.add_collection(Collection, autolim=False)
+    return Collection
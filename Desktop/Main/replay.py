@@ -0,0 +1,224 @@
+import os
+import csv
+import cv2
+import time
+import argparse
+from Desktop.Main.camera import CapturedFrame
+from Desktop.Main.main import SubmitMonitors, CollectMonitors
+from Desktop.Main.generateMonitors import GenerateMonitors
+from Desktop.Main.scheduler import MonitorScheduler
+from Desktop.Main.motionGate import MotionGate
+from Desktop.Performance.performance import PerformanceMonitor
+
+class ReplaySource:
+    def __init__(self, Path, FPS=None, Size=(900, 700)):
+        """ Reads frames from a recorded video or a folder of images in place of the camera
+
+        Arguments:
+        - Path (str): Video file, or folder of .jpg / .png images read in name order
+        - FPS (float): Frames per second to replay at, None to replay as fast as possible
+        - Size (tuple[int, int]): Resolution frames are resized to, matching the camera
+
+        Attributes:
+        - Path (str): Video file or folder of images
+        - FPS (float): Frames per second to replay at, None for as fast as possible
+        - Size (tuple[int, int]): Resolution frames are resized to
+        - Images (list[str]): Image paths when replaying a folder, None for a video
+
+        Raises:
+        - FileNotFoundError: Recording doesn't exist
+
+        Returns:
+        - None
+        """
+        if not os.path.exists(Path):
+            raise FileNotFoundError(f"Recording not found at {Path}")
+
+        self.Path = Path
+        self.FPS = FPS
+        self.Size = Size
+        self.Images = None
+        if os.path.isdir(Path):
+            self.Images = sorted(
+                os.path.join(Path, Name) for Name in os.listdir(Path)
+                if Name.lower().endswith((".jpg", ".jpeg", ".png"))
+            )
+
+    def Read(self):
+        """ Read every frame of the recording once
+
+        Returns:
+        - (generator[tuple[np.ndarray, float]]): Frame and its position in the recording in seconds
+        """
+        if self.Images is not None:
+            Interval = 1 / self.FPS if self.FPS else 1.0
+            for Index, ImagePath in enumerate(self.Images):
+                Frame = cv2.imread(ImagePath)
+                if Frame is not None:
+                    yield Frame, Index * Interval
+            return
+
+        Capture = cv2.VideoCapture(self.Path)
+        SourceFPS = Capture.get(cv2.CAP_PROP_FPS) or 30.0
+        Index = 0
+        try:
+            while True:
+                Ret, Frame = Capture.read()
+                if not Ret:
+                    break
+                yield Frame, Index / SourceFPS
+                Index += 1
+        finally:
+            Capture.release()
+
+    def Frames(self):
+        """ Replay the recording, paced to the chosen frame rate if one was given
+
+        Returns:
+        - (generator[CapturedFrame]): Frames in order
+        """
+        Start = time.perf_counter()
+        for Sequence, (Frame, Position) in enumerate(self.Read(), start=1):
+            if self.FPS:
+                Delay = Start + (Sequence - 1) / self.FPS - time.perf_counter()
+                if Delay > 0:
+                    time.sleep(Delay)
+            Captured = CapturedFrame(Frame, Position, Sequence)
+            Captured.Resized[self.Size] = cv2.resize(Frame, self.Size)
+            yield Captured
+
+class ReplayRunner:
+    def __init__(self, Source, Models=None, UseGate=False, Deadline=60.0):
+        """ Runs recorded frames through the same monitor Live() paths as the firebase loop, without a camera
+
+        Arguments:
+        - Source (ReplaySource): Recorded frames
+        - Models (hashmap[str][bool]): Which of Background, Proximity, Loitering and Mask run, all by default
+        - UseGate (bool): True to skip the person detectors on still frames like the live loop can
+        - Deadline (float): Seconds each frame waits for the monitors, long so offline runs never drop results
+
+        Attributes:
+        - Source (ReplaySource): Recorded frames
+        - Models (hashmap[str][bool]): Which monitors run
+        - Monitors (MonitorRegistry): Builds the enabled monitors
+        - Performance (PerformanceMonitor): Records monitor and frame latencies
+        - Scheduler (MonitorScheduler): Runs the monitors at the same time
+        - Gate (MotionGate): Skips the person detectors on still frames, None to run them on every frame
+        - Rows (list[dict]): Results of each frame
+
+        Returns:
+        - None
+        """
+        self.Source = Source
+        if Models is None:
+            Models = {"Background": True, "Proximity": True, "Loitering": True, "Mask": True}
+        self.Models = Models
+        self.Performance = PerformanceMonitor(Window=100000)
+        self.Scheduler = MonitorScheduler(Deadline=Deadline, Performance=self.Performance)
+        self.Monitors = GenerateMonitors(self.Scheduler)
+        self.Gate = MotionGate() if UseGate else None
+        self.Rows = []
+
+    def Step(self, Captured):
+        """ Run the enabled monitors on one frame
+
+        Arguments:
+        - Captured (CapturedFrame): Recorded frame
+
+        Returns:
+        - Row (hashmap[str][any]): Frame number, position, result of each monitor and time taken
+        """
+        self.Performance.StartTick()
+        Start = time.perf_counter()
+        Frame = Captured.Resize(self.Source.Size)
+        Enabled = self.Monitors.Enable(self.Models)
+        Context = self.Monitors.Context
+        Context.Update(Frame)
+
+        Ran = SubmitMonitors(Enabled, Frame, Context, self.Scheduler, self.Gate)
+        Results = CollectMonitors(Context, self.Scheduler, self.Gate, Ran)
+        self.Performance.EndTick()
+
+        Row = {"Frame": Captured.Sequence, "Position": round(Captured.Timestamp, 3)}
+        for Name, On in self.Models.items():
+            if On:
+                Row[Name] = Results.get(Name)
+        Row["Milliseconds"] = round(1000 * (time.perf_counter() - Start), 2)
+        return Row
+
+    def Run(self, MaxFrames=None):
+        """ Replay the whole recording
+
+        Arguments:
+        - MaxFrames (int): Stop after this many frames, None for the whole recording
+
+        Returns:
+        - Rows (list[dict]): Results of each frame
+        """
+        for Captured in self.Source.Frames():
+            self.Rows.append(self.Step(Captured))
+            if MaxFrames is not None and len(self.Rows) >= MaxFrames:
+                break
+        return self.Rows
+
+    def Write(self, OutputPath):
+        """ Save the per frame results table
+
+        Arguments:
+        - OutputPath (str): CSV file to write
+
+        Returns:
+        - None
+        """
+        if not self.Rows:
+            return
+        with open(OutputPath, "w", newline="") as File:
+            Writer = csv.DictWriter(File, fieldnames=list(self.Rows[0]))
+            Writer.writeheader()
+            Writer.writerows(self.Rows)
+
+    def Summary(self):
+        """ Throughput and latency of the replay
+
+        Returns:
+        - (hashmap[str][any]): Frames, frames per second, frame and monitor latencies
+        """
+        Snapshot = self.Performance.Snapshot()
+        return {
+            "Frames": len(self.Rows),
+            "FPS": Snapshot["FPS"],
+            "Frame": Snapshot["Tick"],
+            "Monitors": Snapshot["Monitors"],
+            "Gate": self.Gate.Summary() if self.Gate is not None else {}
+        }
+
+    def Release(self):
+        """ Stop the monitors and their threads
+
+        Returns:
+        - None
+        """
+        self.Scheduler.Release()
+        self.Monitors.ReleaseAll()
+
+if __name__ == "__main__":
+    Parser = argparse.ArgumentParser(description="Replay a recording through the monitors without a camera")
+    Parser.add_argument("Path", help="Video file or folder of images")
+    Parser.add_argument("--fps", type=float, default=None, help="Replay rate, as fast as possible if not given")
+    Parser.add_argument("--models", default="Background,Proximity,Loitering,Mask", help="Comma separated monitors to run")
+    Parser.add_argument("--gate", action="store_true", help="Skip the person detectors on still frames")
+    Parser.add_argument("--frames", type=int, default=None, help="Stop after this many frames")
+    Parser.add_argument("--output", default="Replay.csv", help="Per frame results table")
+    Arguments = Parser.parse_args()
+
+    Models = {Name: True for Name in Arguments.models.split(",") if Name}
+    Runner = ReplayRunner(ReplaySource(Arguments.Path, Arguments.fps), Models, Arguments.gate)
+    try:
+        Runner.Run(Arguments.frames)
+    finally:
+        # Keep the frames already replayed even if the run or releasing the monitors fails
+        try:
+            Runner.Write(Arguments.output)
+        finally:
+            Runner.Release()
+    print(Runner.Summary())
@@ -0,0 +1,92 @@
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+class MonitorScheduler:
+    def __init__(self, Deadline=1.0, Workers=4, Performance=None):
+        """ Runs monitors at the same time and collects whatever finished before the deadline
+
+        Arguments:
+        - Deadline (float): Seconds each tick waits for monitors before marking them late
+        - Workers (int): Number of monitors that can run at once
+        - Performance (PerformanceMonitor): Records how long each monitor takes, None to not record
+
+        Attributes:
+        - Deadline (float): Seconds each tick waits for monitors before marking them late
+        - Executor (ThreadPoolExecutor): Threads the monitors run on
+        - Running (hashmap[str][Future]): Monitors submitted and not yet collected
+        - SubmitTime (float): Timestamp of the latest submission
+        - Late (list[str]): Monitors that missed the latest tick
+        - Performance (PerformanceMonitor): Records how long each monitor takes
+
+        Returns:
+        - None
+        """
+        self.Deadline = Deadline
+        self.Executor = ThreadPoolExecutor(max_workers=Workers, thread_name_prefix="Monitor")
+        self.Running = {}
+        self.SubmitTime = time.time()
+        self.Late = []
+        self.Performance = Performance
+
+    def Timed(self, Name, Task):
+        """ Run a monitor and record how long it took
+
+        Arguments:
+        - Name (str): Name of the monitor
+        - Task (function): Call that returns its result
+
+        Returns:
+        - (bool): Result of the monitor
+        """
+        Start = time.perf_counter()
+        try:
+            return Task()
+        finally:
+            if self.Performance is not None:
+                self.Performance.Record(Name, time.perf_counter() - Start)
+
+    def Submit(self, Tasks):
+        """ Start monitors, skipping those still late from a previous tick so their result is collected instead
+
+        Arguments:
+        - Tasks (hashmap[str][function]): Monitor name and the call that returns its result
+
+        Returns:
+        - None
+        """
+        self.SubmitTime = time.time()
+        for Name, Task in Tasks.items():
+            if Name in self.Running:
+                continue
+            self.Running[Name] = self.Executor.submit(self.Timed, Name, Task)
+
+    def Collect(self):
+        """ Wait until the deadline for submitted monitors and return those that finished
+
+        Returns:
+        - Results (hashmap[str][bool]): Result of each monitor that finished in time
+        """
+        Remaining = max(0.0, self.Deadline - (time.time() - self.SubmitTime))
+        wait(list(self.Running.values()), timeout=Remaining)
+
+        Results = {}
+        self.Late = []
+        for Name, Future in list(self.Running.items()):
+            if not Future.done():
+                self.Late.append(Name)
+                continue
+            del self.Running[Name]
+            try:
+                Results[Name] = Future.result()
+            except Exception as Error:
+                print(f"{Name} monitor failed: {Error}")
+                Results[Name] = False
+        return Results
+
+    def Release(self):
+        """ Stops the threads
+
+        Returns:
+        - None
+        """
+        self.Executor.shutdown(wait=False, cancel_futures=True)
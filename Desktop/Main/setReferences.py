@@ -1,21 +1,30 @@
-def SetIP(IPReference, LocalIP):
+import time
+import threading
+
+def SetIP(IPReference, LocalIP, Publisher=None):
     """ Set IP used
 
     Arguments:
     - IPReference (firebase_admin.db.Reference): Reference to IP storage
     - LocalIP (str): Local IP used
+    - Publisher (ReferencePublisher): Sends the write in the background if provided
 
     Returns:
     - None
     """
-    IPReference.set({"ip": LocalIP})
+    Value = {"ip": LocalIP}
+    if Publisher is None:
+        IPReference.set(Value)
+    else:
+        Publisher.Publish(IPReference, Value)
 
-def SetLocation(LocationReference, Latitude, Longitude):
+def SetLocation(LocationReference, Latitude, Longitude, Publisher=None):
     """ Set the current location
 
     - LocationReference (firebase_admin.db.Reference): Reference to location storage
     - Latitude (float): Current latitude
     - Longitude (float): Current longiutde
+    - Publisher (ReferencePublisher): Sends the write in the background if provided
 
     Returns:
     - None
@@ -24,9 +33,12 @@ def SetLocation(LocationReference, Latitude, Longitude):
         "latitude": Latitude,
         "longitude": Longitude,
     }
-    LocationReference.set(Location)
+    if Publisher is None:
+        LocationReference.set(Location)
+    else:
+        Publisher.Publish(LocationReference, Location)
 
-def SetBackend(BackendReference, SuspiciousDetected, Message, Timestamp):
+def SetBackend(BackendReference, SuspiciousDetected, Message, Timestamp, Publisher=None):
     """ Send message via firebase
 
     Arguments:
@@ -34,12 +46,171 @@ def SetBackend(BackendReference, SuspiciousDetected, Message, Timestamp):
     - SuspiciousDetected (bool): True if something is detected
     - Message (str): Message of what occurred
     - Timestamp (int): Current time
+    - Publisher (ReferencePublisher): Sends the write in the background if provided
 
     Returns:
     - None
     """
-    BackendReference.set({
+    Value = {
         "alert": SuspiciousDetected,
         "message": Message,
         "timestamp": Timestamp
-    })
\ No newline at end of file
+    }
+    if Publisher is None:
+        BackendReference.set(Value)
+    else:
+        # The app alarms on every alert it receives, so alerts are always sent
+        Publisher.Publish(BackendReference, Value, IgnoreKeys=("timestamp",), Force=SuspiciousDetected)
+
+class ReferencePublisher:
+    def __init__(self, RootReference, Heartbeat=10.0, Interval=0.5):
+        """ Sends database writes from a background thread, skipping values that haven't changed
+
+        Arguments:
+        - RootReference (firebase_admin.db.Reference): Root of the database, used for multi-path updates
+        - Heartbeat (float): Seconds after which an unchanged value is sent again so the app knows the laptop is alive
+        - Interval (float): Seconds between batches
+
+        Attributes:
+        - RootReference (firebase_admin.db.Reference): Root of the database
+        - Heartbeat (float): Seconds after which an unchanged value is sent again
+        - Interval (float): Seconds between batches
+        - Pending (hashmap[str][list[tuple]]): Values, ignored keys and force flags waiting to be sent, by path, oldest first
+        - Sent (hashmap[str][tuple]): Last compared value and time it was sent, by path
+        - WritesSent (int): Number of values sent
+        - WritesSaved (int): Number of values replaced before they were sent or skipped as unchanged
+        - Batches (int): Number of updates made
+        - Condition (threading.Condition): Wakes the thread when values are waiting
+        - Running (bool): True while the thread should keep sending
+        - Thread (threading.Thread): Sends the batches
+
+        Returns:
+        - None
+        """
+        self.RootReference = RootReference
+        self.Heartbeat = Heartbeat
+        self.Interval = Interval
+        self.Pending = {}
+        self.Sent = {}
+        self.WritesSent = 0
+        self.WritesSaved = 0
+        self.Batches = 0
+        self.Condition = threading.Condition()
+        self.Running = True
+        self.Thread = threading.Thread(target=self.PublishLoop, daemon=True)
+        self.Thread.start()
+
+    def Publish(self, Reference, Value, IgnoreKeys=(), Force=False):
+        """ Queue a value to be written, replacing an unforced value still waiting for the same reference
+
+        Forced values are never replaced, as the app alarms on each alert, so each is sent in its own batch
+
+        Arguments:
+        - Reference (firebase_admin.db.Reference): Where to write
+        - Value (dict): Value to write
+        - IgnoreKeys (tuple[str]): Keys that don't count as a change, such as timestamps
+        - Force (bool): True to send even if nothing changed
+
+        Returns:
+        - None
+        """
+        Path = Reference.path.strip("/")
+        with self.Condition:
+            Queue = self.Pending.setdefault(Path, [])
+            if Queue and not Queue[-1][2]:
+                Queue[-1] = (Value, IgnoreKeys, Force)
+                self.WritesSaved += 1
+            else:
+                Queue.append((Value, IgnoreKeys, Force))
+            self.Condition.notify()
+
+    def Compared(self, Value, IgnoreKeys):
+        """ Part of the value used to decide if it changed
+
+        Arguments:
+        - Value (dict): Value to write
+        - IgnoreKeys (tuple[str]): Keys left out
+
+        Returns:
+        - (dict): Value without the ignored keys
+        """
+        if not isinstance(Value, dict):
+            return Value
+        return {Key: Item for Key, Item in Value.items() if Key not in IgnoreKeys}
+
+    def Flush(self):
+        """ Send the oldest waiting value of each reference if it changed, is forced or is due a heartbeat
+
+        Returns:
+        - (bool): False if the update failed and the values were queued again
+        """
+        with self.Condition:
+            Pending = {}
+            for Path, Queue in list(self.Pending.items()):
+                Pending[Path] = Queue.pop(0)
+                if not Queue:
+                    del self.Pending[Path]
+
+        CurrentTime = time.time()
+        Updates = {}
+        for Path, (Value, IgnoreKeys, Force) in Pending.items():
+            Compared = self.Compared(Value, IgnoreKeys)
+            Previous = self.Sent.get(Path)
+            if not Force and Previous is not None and Previous[0] == Compared and CurrentTime - Previous[1] < self.Heartbeat:
+                self.WritesSaved += 1
+                continue
+            Updates[Path] = Value
+
+        if not Updates:
+            return True
+
+        try:
+            self.RootReference.update(Updates)
+        except Exception as Error:
+            print(f"Failed to publish: {Error}")
+            with self.Condition:
+                for Path, Entry in Pending.items():
+                    if Path in Updates:
+                        self.Pending.setdefault(Path, []).insert(0, Entry)
+            return False
+
+        for Path, Value in Updates.items():
+            self.Sent[Path] = (self.Compared(Value, Pending[Path][1]), CurrentTime)
+        self.WritesSent += len(Updates)
+        self.Batches += 1
+        return True
+
+    def Waiting(self):
+        """ Number of values waiting to be sent
+
+        Returns:
+        - (int): Values queued across every reference
+        """
+        with self.Condition:
+            return sum(len(Queue) for Queue in self.Pending.values())
+
+    def PublishLoop(self):
+        """ Send a batch every interval while values are waiting
+
+        Returns:
+        - None
+        """
+        while self.Running:
+            with self.Condition:
+                if not self.Pending:
+                    self.Condition.wait(self.Interval)
+            self.Flush()
+            time.sleep(self.Interval)
+
+    def Release(self):
+        """ Send what's left, including every queued alert, and stop the thread
+
+        Returns:
+        - None
+        """
+        self.Running = False
+        with self.Condition:
+            self.Condition.notify()
+        self.Thread.join(timeout=2.0)
+        while self.Pending and self.Flush():
+            pass
@@ -1,7 +1,8 @@
-import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import os
+from Desktop.Main.experimentStore import ExperimentStore
+from Desktop.Main.plotSegments import EncodeStatus, DrawSpans
 
 class MetricsVisualiser:
     def __init__(self):
@@ -10,6 +11,7 @@ class MetricsVisualiser:
         Attributes:
         - Methods (dict): Different implementation names
         - OutputDirectory (str): Folder to store comparisons
+        - Experiments (hashmap[tuple[str, str]][pd.DataFrame]): Every method, read in one scan
 
         Returns:
         - None
@@ -20,8 +22,9 @@ class MetricsVisualiser:
             "O": "Occlusion Based"
         }
 
-        self.OutputDirectory = "Plots"
+        self.OutputDirectory = os.path.join(os.path.dirname(__file__), "Plots")
         os.makedirs(self.OutputDirectory, exist_ok=True)
+        self.Experiments = ExperimentStore().Load("Mask", Methods=list(self.Methods.values()))
 
     def LoadCSV(self, Method):
         """ Retrieve metrics for provided method
@@ -32,7 +35,7 @@ class MetricsVisualiser:
         Returns:
         - pd.DataFrame: Implemetation metrics csv
         """
-        return pd.read_csv(f"{self.Methods[Method]} MaskLog.csv")
+        return self.Experiments[(self.Methods[Method], "All")].copy()
 
     def StatusToNumeric(self, Status):
         """ Convert status to binary to signal if mask was detected or not, to plot
@@ -62,7 +65,7 @@ class MetricsVisualiser:
         """
         DF = self.LoadCSV(Method)
 
-        DF["StatusNumeric"] = DF["Status"].apply(self.StatusToNumeric)
+        DF["StatusNumeric"] = EncodeStatus(DF["Status"], self.StatusToNumeric)
         Frames = len(DF)
         Time = DF["FrameNumber"]
 
@@ -75,10 +78,8 @@ class MetricsVisualiser:
         plt.plot(Time, DF["StatusNumeric"], linewidth=2, color="tab:blue", alpha=0.9, label="Achieved")
         plt.axvspan(0, 0, color="red", alpha=0.12, label="Undetected")
 
-        NoDetection = DF["Status"].str.lower().str.contains("no detection", na=False)
-        for i in np.where(NoDetection)[0]:
-            Second = Time.iloc[i]
-            plt.axvspan(Second - 0.5, Second + 0.5, color="red", alpha=0.12)
+        NoDetection = DF["Status"].str.lower().str.contains("no detection", na=False).to_numpy()
+        DrawSpans(plt.gca(), Time.to_numpy(), NoDetection, color="red", alpha=0.12)
 
         plt.yticks([0, 1], ["No Mask (0)", "Mask (1)"])
         plt.xlabel("Frame Number")
@@ -1,11 +1,8 @@
-import csv
 import os
+from Desktop.Main.metricsSink import GetSink
 
 LogFile = os.path.join(os.path.dirname(__file__), "MaskLog.csv")
-if not os.path.exists(LogFile):
-    with open(LogFile, "w", newline="") as File:
-        writer = csv.writer(File)
-        writer.writerow(["FrameNumber", "Status", "Confidence"])
+Sink = GetSink(LogFile, ["FrameNumber", "Status", "Confidence"], ["int64", "string", "float64"])
 
 def LogMask(FrameNumber, Status, Confidence):
     """ Stores metrics from evaluating mask detection implementations
@@ -18,6 +15,4 @@ def LogMask(FrameNumber, Status, Confidence):
     Returns:
     - None
     """
-    with open(LogFile, "a", newline="") as File:
-        writer = csv.writer(File)
-        writer.writerow([FrameNumber, Status, round(Confidence, 2)])
\ No newline at end of file
+    Sink.Write([FrameNumber, Status, round(Confidence, 2)])
\ No newline at end of file
@@ -0,0 +1,168 @@
+import numpy as np
+from types import SimpleNamespace
+from Desktop.Mask.mask import MaskMonitor
+
+class CountingBackend:
+    def __init__(self, Masked=True):
+        """ Mask model stand in counting how often it's asked
+
+        Arguments:
+        - Masked (bool): Verdict returned for every person
+
+        Attributes:
+        - Masked (bool): Verdict returned for every person
+        - Regions (list[tuple]): Region of each call
+
+        Returns:
+        - None
+        """
+        self.Masked = Masked
+        self.Regions = []
+
+    def Infer(self, Frame, Region=None):
+        """ Record the call and return one detection
+
+        Arguments:
+        - Frame (np.ndarray): Current frame
+        - Region (tuple[float, float, float, float]): x1, y1, x2, y2 asked about
+
+        Returns:
+        - (list[dict]): Single detection
+        """
+        self.Regions.append(Region)
+        return [{"class": "mask" if self.Masked else "no-mask", "confidence": 0.9}]
+
+class MaskCacheTests:
+    def __init__(self):
+        """ Create a frame with a face to track
+
+        Attributes:
+        - Frame (np.ndarray): BGR frame with a grey face region, wider than the box so small moves keep the same face
+        - Box (np.ndarray): x1, y1, x2, y2 of the person
+
+        Returns:
+        - None
+        """
+        self.Frame = np.zeros((240, 320, 3), dtype=np.uint8)
+        self.Frame[30:90, 90:190] = 150
+        self.Box = np.array([100, 40, 180, 160], dtype=np.float32)
+
+    def Monitor(self, Masked=True):
+        """ Build a monitor around the counting backend
+
+        Arguments:
+        - Masked (bool): Verdict the backend returns
+
+        Returns:
+        - (MaskMonitor): Monitor with a local stand in model
+        """
+        Monitor = MaskMonitor(Backend="remote")
+        Monitor.Backend = CountingBackend(Masked)
+        return Monitor
+
+    def Context(self, *Boxes):
+        """ Frame context stand in returning fixed person boxes
+
+        Arguments:
+        - Boxes (list[np.ndarray]): x1, y1, x2, y2 of each person
+
+        Returns:
+        - (SimpleNamespace): Context with PersonBoxes
+        """
+        return SimpleNamespace(PersonBoxes=lambda: np.array(Boxes, dtype=np.float32).reshape(-1, 4))
+
+    def TestNoPerson(self):
+        """ Tests the model isn't asked when nobody is present
+
+        Returns:
+        - (bool): True if the frame is skipped
+        """
+        Monitor = self.Monitor()
+        Masked = Monitor.Live(self.Frame, self.Context())
+        return Masked is False and Monitor.InferenceCalls == 0 and Monitor.Skipped == 1
+
+    def TestReuse(self):
+        """ Tests the verdict of a person who barely moved is reused
+
+        Returns:
+        - (bool): True if the model is asked once over two frames
+        """
+        Monitor = self.Monitor()
+        First = Monitor.Live(self.Frame, self.Context(self.Box))
+        Second = Monitor.Live(self.Frame, self.Context(self.Box + 4))
+        return First and Second and Monitor.InferenceCalls == 1 and Monitor.CacheHits == 1
+
+    def TestMoved(self):
+        """ Tests a box that no longer overlaps its track counts as a new person
+
+        Returns:
+        - (bool): True if the model is asked again
+        """
+        Monitor = self.Monitor()
+        Monitor.Live(self.Frame, self.Context(self.Box))
+        Monitor.Live(self.Frame, self.Context(self.Box + np.array([120, 0, 120, 0], dtype=np.float32)))
+        return Monitor.InferenceCalls == 2 and Monitor.CacheHits == 0
+
+    def TestExpired(self):
+        """ Tests a verdict older than the TTL isn't reused
+
+        Returns:
+        - (bool): True if the model is asked again
+        """
+        Monitor = self.Monitor()
+        Monitor.Live(self.Frame, self.Context(self.Box))
+        Monitor.Tracks[0]["Time"] -= Monitor.VerdictTTL
+        Monitor.Live(self.Frame, self.Context(self.Box))
+        return Monitor.InferenceCalls == 2
+
+    def TestFaceChange(self):
+        """ Tests the model is asked again when the face changes under the same box
+
+        Returns:
+        - (bool): True if the changed face is checked again
+        """
+        Monitor = self.Monitor()
+        Monitor.Live(self.Frame, self.Context(self.Box))
+        Changed = self.Frame.copy()
+        Changed[30:90, 90:190] = 40
+        Monitor.Live(Changed, self.Context(self.Box))
+        return Monitor.InferenceCalls == 2
+
+    def TestRegions(self):
+        """ Tests each person is sent as their own region
+
+        Returns:
+        - (bool): True if one call is made per person with their box
+        """
+        Monitor = self.Monitor(Masked=False)
+        Other = np.array([10, 10, 60, 100], dtype=np.float32)
+        Masked = Monitor.Live(self.Frame, self.Context(self.Box, Other))
+        return Masked is False and Monitor.Backend.Regions == [tuple(self.Box), tuple(Other)]
+
+    def RunAllTests(self):
+        """ Run all tests for the person gated mask cache
+
+        Returns:
+        - None
+        """
+        Results = {
+            "No Person": self.TestNoPerson(),
+            "Reuse": self.TestReuse(),
+            "Moved": self.TestMoved(),
+            "Expired": self.TestExpired(),
+            "Face Change": self.TestFaceChange(),
+            "Regions": self.TestRegions()
+        }
+
+        Passed = sum(1 for r in Results.values() if r)
+        Total = len(Results)
+
+        print("\nTest Summary:")
+        for Name, Result in Results.items():
+            print(f" - {Name}: {'PASS' if Result else 'FAIL'}")
+
+        print(f"\nFinal Result: {Passed}/{Total} tests passed.")
+
+if __name__ == "__main__":
+    Tests = MaskCacheTests()
+    Tests.RunAllTests()
@@ -0,0 +1,198 @@
+import cv2
+import os
+import base64
+
+def CropRegion(Frame, Region=None, Padding=0.15, MaxSide=None):
+    """ Crop the frame to a region and shrink it so the model only sees what it needs
+
+    Arguments:
+    - Frame (np.ndarray): Current video frame
+    - Region (tuple[float, float, float, float]): x1, y1, x2, y2 to keep, None for the whole frame
+    - Padding (float): Fraction of the region's size added on each side
+    - MaxSide (int): Longest side allowed after shrinking, None to keep the size
+
+    Returns:
+    - Tuple:
+        - Crop (np.ndarray): Cropped and shrunk frame
+        - OffsetX (int): Left edge of the crop in the frame
+        - OffsetY (int): Top edge of the crop in the frame
+        - Scale (float): Size of the crop relative to the frame
+    """
+    FrameHeight, FrameWidth = Frame.shape[:2]
+    OffsetX, OffsetY = 0, 0
+    Crop = Frame
+
+    if Region is not None:
+        X1, Y1, X2, Y2 = Region
+        PadX = (X2 - X1) * Padding
+        PadY = (Y2 - Y1) * Padding
+        OffsetX = max(0, int(X1 - PadX))
+        OffsetY = max(0, int(Y1 - PadY))
+        Right = min(FrameWidth, int(X2 + PadX))
+        Bottom = min(FrameHeight, int(Y2 + PadY))
+        if Right > OffsetX and Bottom > OffsetY:
+            Crop = Frame[OffsetY:Bottom, OffsetX:Right]
+        else:
+            OffsetX, OffsetY = 0, 0
+
+    Scale = 1.0
+    if MaxSide is not None and max(Crop.shape[:2]) > MaxSide:
+        Scale = MaxSide / max(Crop.shape[:2])
+        Crop = cv2.resize(Crop, (max(1, int(Crop.shape[1] * Scale)), max(1, int(Crop.shape[0] * Scale))), interpolation=cv2.INTER_AREA)
+
+    return Crop, OffsetX, OffsetY, Scale
+
+def RestorePredictions(Predictions, OffsetX, OffsetY, Scale):
+    """ Move predictions made on a crop back onto the full frame
+
+    Arguments:
+    - Predictions (list[dict]): Predictions on the crop
+    - OffsetX (int): Left edge of the crop in the frame
+    - OffsetY (int): Top edge of the crop in the frame
+    - Scale (float): Size of the crop relative to the frame
+
+    Returns:
+    - Predictions (list[dict]): Predictions in frame coordinates
+    """
+    if OffsetX == 0 and OffsetY == 0 and Scale == 1.0:
+        return Predictions
+
+    for Prediction in Predictions:
+        Prediction["x"] = Prediction["x"] / Scale + OffsetX
+        Prediction["y"] = Prediction["y"] / Scale + OffsetY
+        Prediction["width"] = Prediction["width"] / Scale
+        Prediction["height"] = Prediction["height"] / Scale
+    return Predictions
+
+class RoboflowBackend:
+    def __init__(self, APIKey, ModelID, MaxSide=640, Quality=85, Timeout=5.0):
+        """ Runs the mask model on Roboflow's hosted API, sending in memory JPEGs over one pooled session
+
+        Arguments:
+        - APIKey (str): Roboflow API key for the model
+        - ModelID (str): Name of the model used
+        - MaxSide (int): Longest side of the image sent
+        - Quality (int): JPEG quality of the image sent
+        - Timeout (float): Seconds to wait for the API
+
+        Attributes:
+        - APIKey (str): Roboflow API key for the model
+        - URL (str): Endpoint of the model
+        - Session (requests.Session): Keeps connections to the API open between calls
+        - MaxSide (int): Longest side of the image sent
+        - Quality (int): JPEG quality of the image sent
+        - Timeout (float): Seconds to wait for the API
+        - BytesSent (int): Size of all images sent
+
+        Returns:
+        - None
+        """
+        import requests
+        from requests.adapters import HTTPAdapter
+        self.__APIKey = APIKey
+        self.URL = f"https://serverless.roboflow.com/{ModelID}"
+        self.Session = requests.Session()
+        self.Session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=2))
+        self.MaxSide = MaxSide
+        self.Quality = Quality
+        self.Timeout = Timeout
+        self.BytesSent = 0
+
+    def Infer(self, Frame, Region=None):
+        """ Encode the current frame in memory, send it to the API and retrieve predictions
+
+        Arguments:
+        - Frame (np.ndarray): Current video frame
+        - Region (tuple[float, float, float, float]): x1, y1, x2, y2 of the person, None for the whole frame
+
+        Returns:
+        - list[dict]: Results from the model, in frame coordinates
+        """
+        Crop, OffsetX, OffsetY, Scale = CropRegion(Frame, Region, MaxSide=self.MaxSide)
+        Success, Buffer = cv2.imencode(".jpg", Crop, [cv2.IMWRITE_JPEG_QUALITY, self.Quality])
+        if not Success:
+            return []
+
+        Image = base64.b64encode(Buffer.tobytes())
+        self.BytesSent += len(Image)
+        Response = self.Session.post(
+            self.URL,
+            params={"api_key": self.__APIKey},
+            data=Image,
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+            timeout=self.Timeout
+        )
+        Response.raise_for_status()
+        Predictions = Response.json().get("predictions", [])
+        return RestorePredictions(Predictions, OffsetX, OffsetY, Scale)
+
+class LocalBackend:
+    def __init__(self, ModelPath, Confidence=0.4, InputSize=640, ClassMap=None):
+        """ Runs an exported mask detector in process on the CPU, with no network needed
+
+        Arguments:
+        - ModelPath (str): Path to the detector, either PyTorch weights or an ONNX / OpenVINO export
+        - Confidence (float): Minimum confidence of a detection
+        - InputSize (int): Size frames are resized to for the model
+        - ClassMap (hashmap[str][str]): Renames the model's classes to the Roboflow ones
+
+        Attributes:
+        - Model (YOLO): Mask detector
+        - Confidence (float): Minimum confidence of a detection
+        - InputSize (int): Size frames are resized to for the model
+        - ClassMap (hashmap[str][str]): Renames the model's classes to the Roboflow ones
+
+        Raises:
+        - FileNotFoundError: Model doesn't exist
+
+        Returns:
+        - None
+        """
+        if not os.path.exists(ModelPath):
+            raise FileNotFoundError(f"Mask model not found at {ModelPath}")
+
+        from ultralytics import YOLO
+        self.Model = YOLO(ModelPath, task="detect")
+        self.Confidence = Confidence
+        self.InputSize = InputSize
+        if ClassMap is None:
+            ClassMap = {
+                "with_mask": "mask",
+                "without_mask": "no-mask",
+                "mask_weared_incorrect": "no-mask"
+            }
+        self.ClassMap = ClassMap
+
+    def Infer(self, Frame, Region=None):
+        """ Run the detector on the current frame and return predictions in the Roboflow format
+
+        Arguments:
+        - Frame (np.ndarray): Current video frame
+        - Region (tuple[float, float, float, float]): x1, y1, x2, y2 of the person, None for the whole frame
+
+        Returns:
+        - list[dict]: Results from the model, with centre x, y, width, height, confidence and class
+        """
+        Frame, OffsetX, OffsetY, Scale = CropRegion(Frame, Region)
+        Result = self.Model(Frame, conf=self.Confidence, imgsz=self.InputSize, device="cpu", verbose=False)[0]
+        Boxes = Result.boxes
+        if Boxes is None or len(Boxes) == 0:
+            return []
+
+        XYWH = Boxes.xywh.cpu().numpy()
+        Confidences = Boxes.conf.cpu().numpy()
+        Classes = Boxes.cls.cpu().numpy().astype(int)
+
+        Predictions = []
+        for (X, Y, Width, Height), Confidence, ClassID in zip(XYWH, Confidences, Classes):
+            Name = Result.names[ClassID]
+            Predictions.append({
+                "x": float(X),
+                "y": float(Y),
+                "width": float(Width),
+                "height": float(Height),
+                "confidence": float(Confidence),
+                "class": self.ClassMap.get(Name, Name),
+                "class_id": int(ClassID)
+            })
+        return RestorePredictions(Predictions, OffsetX, OffsetY, Scale)
@@ -1,27 +1,39 @@
 import cv2
 import time
 import os
+import numpy as np
 from dotenv import load_dotenv
 from pathlib import Path
-import tempfile
-from inference_sdk import InferenceHTTPClient
 from Desktop.Mask.Metrics.metrics import LogMask
+from Desktop.Mask.backends import RoboflowBackend, LocalBackend
 
 # https://universe.roboflow.com/joseph-nelson/mask-wearing
 class MaskMonitor:
-    def __init__(self):
+    def __init__(self, Backend=None, ModelPath=None):
         """ Instantiate attributes to run the model
 
+        Arguments:
+        - Backend (str): Either remote to call Roboflow, or local to run an exported model on the CPU, defaults to MASK_BACKEND in .env
+        - ModelPath (str): Path to the exported model for the local backend, defaults to MASK_MODEL_PATH in .env
+
         Attributes:
         - APIKey (str): Roboflow API key for the model
         - Cap (cv2.VideoCapture): Camera used
-        - Client (InferenceHTTPClient): Call to use account for the model
         - ModelID (str): Name of the model used
+        - Backend (RoboflowBackend or LocalBackend): Runs the model
         - MaxFrames (int): Max number of frames to test monitor on
         - FrameNumber (int): Current frame
+        - Tracks (list[dict]): Persons seen in the last frame with their box, verdict, time queried and face signature
+        - VerdictTTL (float): Seconds a persons verdict is reused before the model is asked again
+        - IOUThreshold (float): Overlap needed for a box to be treated as the same person
+        - FaceChange (float): Mean pixel difference of the face that forces the model to be asked again
+        - InferenceCalls (int): Number of times the model was asked
+        - CacheHits (int): Number of persons whose verdict was reused
+        - Skipped (int): Number of frames skipped as nobody was present
 
         Raises:
         - RuntimeError: Camera not accessible
+        - ValueError: Unknown backend
 
         Returns:
         - None
@@ -32,10 +44,26 @@ class MaskMonitor:
         #if not self.Cap.isOpened():
         #    raise RuntimeError("Camera not accessible.")
 
-        self.Client = InferenceHTTPClient(api_url="https://serverless.roboflow.com", api_key=self.__APIKey)
         self.ModelID = "mask-wearing/18"
+        Backend = Backend or os.getenv("MASK_BACKEND", "remote")
+        ModelPath = ModelPath or os.getenv("MASK_MODEL_PATH")
+        if Backend == "remote":
+            self.Backend = RoboflowBackend(self.__APIKey, self.ModelID)
+        elif Backend == "local":
+            if ModelPath is None:
+                ModelPath = os.path.join(os.path.dirname(__file__), "Models", "mask.onnx")
+            self.Backend = LocalBackend(ModelPath)
+        else:
+            raise ValueError(f"Unknown mask backend {Backend}")
         self.MaxFrames = 120
         self.FrameNumber = 0
+        self.Tracks = []
+        self.VerdictTTL = 10.0
+        self.IOUThreshold = 0.5
+        self.FaceChange = 20.0
+        self.InferenceCalls = 0
+        self.CacheHits = 0
+        self.Skipped = 0
 
     def GetFrame(self):
         """ Retrieve current frame
@@ -51,25 +79,116 @@ class MaskMonitor:
             raise RuntimeError("Error: Failed to read camera frame.")
         return cv2.resize(Frame, (640, 480))
 
-    def RunInference(self, Frame):
-        """ Convert the current frame to provide to the API and retrieve predictions
+    def RunInference(self, Frame, Region=None):
+        """ Run the selected backend on the current frame and retrieve predictions
 
         Arguments:
         - Frame (np.ndarray): Current video frame
+        - Region (tuple[float, float, float, float]): x1, y1, x2, y2 to send, None for the whole frame
 
         Returns:
         - list[dict]: Results from the model
         """
-        TempFile = tempfile.NamedTemporaryFile(suffix=".jpg", delete=False)
-        try:
-            cv2.imwrite(TempFile.name, Frame)
-            TempFile.close()
-            Result = self.Client.infer(TempFile.name, model_id=self.ModelID)
-        finally:
-            os.unlink(TempFile.name)
-
-        return Result.get("predictions", [])
-    
+        return self.Backend.Infer(Frame, Region)
+
+    def FaceSignature(self, Frame, Box):
+        """ Small grayscale thumbnail of the top of a persons box, used to notice when their face changes
+
+        Arguments:
+        - Frame (np.ndarray): Current frame
+        - Box (np.ndarray): x1, y1, x2, y2 of the person
+
+        Returns:
+        - (np.ndarray): 16x16 thumbnail, None if the box is empty
+        """
+        X1, Y1, X2, Y2 = [int(Value) for Value in Box]
+        X1, Y1 = max(0, X1), max(0, Y1)
+        Head = Frame[Y1:Y1 + max(1, (Y2 - Y1) // 3), X1:max(X1 + 1, X2)]
+        if Head.size == 0:
+            return None
+        Gray = cv2.cvtColor(Head, cv2.COLOR_BGR2GRAY)
+        return cv2.resize(Gray, (16, 16), interpolation=cv2.INTER_AREA).astype(np.float32)
+
+    def BoxIOU(self, First, Second):
+        """ Overlap between two boxes
+
+        Arguments:
+        - First (np.ndarray): x1, y1, x2, y2 of the first box
+        - Second (np.ndarray): x1, y1, x2, y2 of the second box
+
+        Returns:
+        - (float): Intersection over union, between 0 and 1
+        """
+        Width = max(0.0, min(First[2], Second[2]) - max(First[0], Second[0]))
+        Height = max(0.0, min(First[3], Second[3]) - max(First[1], Second[1]))
+        Intersection = Width * Height
+        Union = (First[2] - First[0]) * (First[3] - First[1]) + (Second[2] - Second[0]) * (Second[3] - Second[1]) - Intersection
+        if Union <= 0:
+            return 0.0
+        return float(Intersection / Union)
+
+    def MatchTrack(self, Box):
+        """ Find the person from the last frame this box most likely belongs to
+
+        Arguments:
+        - Box (np.ndarray): x1, y1, x2, y2 of the person
+
+        Returns:
+        - (dict): Matching track, None if nobody overlaps enough
+        """
+        Best, BestIOU = None, self.IOUThreshold
+        for Track in self.Tracks:
+            IOU = self.BoxIOU(Box, Track["Box"])
+            if IOU >= BestIOU:
+                Best, BestIOU = Track, IOU
+        return Best
+
+    def LiveTracked(self, Frame, Context):
+        """ Only ask the model about persons that are new, changed, or whose verdict has expired
+
+        Arguments:
+        - Frame (np.ndarray): Current frame captured
+        - Context (FrameContext): Shared model outputs for the current frame
+
+        Returns:
+        - Masked (bool): True if any person is wearing a mask
+        """
+        Boxes = Context.PersonBoxes()
+        if len(Boxes) == 0:
+            self.Tracks = []
+            self.Skipped += 1
+            return False
+
+        CurrentTime = time.time()
+        Tracks = []
+        Masked = False
+        for Box in Boxes:
+            Signature = self.FaceSignature(Frame, Box)
+            Track = self.MatchTrack(Box)
+
+            Reuse = (
+                Track is not None
+                and CurrentTime - Track["Time"] < self.VerdictTTL
+                and Signature is not None
+                and Track["Signature"] is not None
+                and float(np.mean(np.abs(Signature - Track["Signature"]))) < self.FaceChange
+            )
+
+            if Reuse:
+                self.CacheHits += 1
+                Track = dict(Track, Box=Box)
+            else:
+                Detections = self.RunInference(Frame, tuple(Box))
+                self.InferenceCalls += 1
+                Verdict, Confidence = self.ProcessFrame(Detections)
+                Track = {"Box": Box, "Masked": Verdict, "Time": CurrentTime, "Signature": Signature}
+
+            Tracks.append(Track)
+            Masked = Masked or Track["Masked"]
+
+        self.Tracks = Tracks
+        return Masked
+
     def ProcessFrame(self, Detections):
         """ Retrieve the model results and extract its most confident outcome and return values reflecting that
 
@@ -136,16 +255,19 @@ class MaskMonitor:
         #cv2.imshow("Mask Experiment (1 FPS)", Frame)
         return Status
     
-    def Live(self, Frame):
+    def Live(self, Frame, Context=None):
         """ For live implementation to constantly return the results
 
         Arguments:
         - Frame (np.ndarray): Current frame captured
+        - Context (FrameContext): Shared model outputs, used to only ask the model about persons present
 
         Returns:
         - Masked (bool): True if mask is worn else false
         """
         self.FrameNumber += 1
+        if Context is not None:
+            return self.LiveTracked(Frame, Context)
         Detections = self.RunInference(Frame)
         Masked, Confidence = self.ProcessFrame(Detections)
         #Status = self.GetDisplay(Frame, Detections, Masked)
@@ -1,8 +1,9 @@
-import pandas as pd
 import matplotlib.pyplot as plt
 import os
 import numpy as np
 from matplotlib.patches import Patch
+from Desktop.Main.experimentStore import ExperimentStore
+from Desktop.Main.plotSegments import EncodeStatus, DrawSpans
 
 class MetricsVisualiser:
     def __init__(self):
@@ -12,6 +13,7 @@ class MetricsVisualiser:
         - Methods (dict): Different implementations
         - Scenarios (list): Different scenarios
         - OutputDirectory (str): Folder to store graphs
+        - Experiments (hashmap[tuple[str, str]][pd.DataFrame]): Every method and scenario, read in one scan
 
         Returns:
         - None
@@ -24,8 +26,9 @@ class MetricsVisualiser:
         }
 
         self.Scenarios = ["Standing", "Sitting", "Crouch"]
-        self.OutputDirectory = "Plots"
+        self.OutputDirectory = os.path.join(os.path.dirname(__file__), "Plots")
         os.makedirs(self.OutputDirectory, exist_ok=True)
+        self.Experiments = ExperimentStore().Load("Movement", Methods=list(self.Methods), Scenarios=self.Scenarios)
 
     def LoadCSV(self, Method, Scenario):
         """ Load CSV for specific implementation and scenario
@@ -35,10 +38,10 @@ class MetricsVisualiser:
         - Scenario (str): Name of situation
 
         Returns:
-        - pd.DataFrame: CSV contents
+        - pd.DataFrame: CSV contents, None if it wasn't recorded
         """
-        FileName = f"{Method} - {Scenario}.csv"
-        return pd.read_csv(FileName)
+        DF = self.Experiments.get((Method, Scenario))
+        return DF.copy() if DF is not None else None
 
     def StatusToNumeric(self, Status):
         """ Converts status to 1 or 0 to signal if persons too close, to graph it
@@ -74,7 +77,7 @@ class MetricsVisualiser:
             Ax.axis("off")
             return
 
-        DF["StatusNumeric"] = DF["Status"].apply(self.StatusToNumeric)
+        DF["StatusNumeric"] = EncodeStatus(DF["Status"], self.StatusToNumeric)
         Frames = len(DF)
 
         if Frames >= 200:
@@ -89,10 +92,8 @@ class MetricsVisualiser:
         Ax.plot(ExpectedPlot, linestyle="--", linewidth=2.2, alpha=0.65, color="#AA00FF", label="Expected")
         Ax.plot(DF["StatusNumeric"], linewidth=2, label="Achieved", alpha=0.9, color="tab:blue")
 
-        MissingValues = DF["Status"].str.lower().str.contains("no", na=False)
-        if MissingValues.any():
-            for IndexMissing in np.where(MissingValues)[0]:
-                Ax.axvspan(IndexMissing - 0.5, IndexMissing + 0.5, color="red", alpha=0.12)
+        MissingValues = DF["Status"].str.lower().str.contains("no", na=False).to_numpy()
+        DrawSpans(Ax, np.arange(Frames), MissingValues, color="red", alpha=0.12)
 
         Ax.set_title(Scenario, fontsize=13, weight="bold")
         Ax.set_ylabel("Status")
@@ -1,18 +1,10 @@
-import csv
 import os
+from Desktop.Main.metricsSink import GetSink
 
 DistanceLogFile = os.path.join(os.path.dirname(__file__), "DistanceLog.csv")
 GestureLogFile = os.path.join(os.path.dirname(__file__), "GestureLog.csv")
-
-if not os.path.exists(DistanceLogFile):
-    with open(DistanceLogFile, "w", newline="") as f:
-        writer = csv.writer(f)
-        writer.writerow(["Distance", "Approach", "Status"])
-
-if not os.path.exists(GestureLogFile):
-    with open(GestureLogFile, "w", newline="") as f:
-        writer = csv.writer(f)
-        writer.writerow(["FrameNumber", "HandDetected", "HandConfidence", "ProximityPixel", "Status"])
+DistanceSink = GetSink(DistanceLogFile, ["Distance", "Approach", "Status"], ["float64", "float64", "string"])
+GestureSink = GetSink(GestureLogFile, ["FrameNumber", "HandDetected", "HandConfidence", "ProximityPixel", "Status"], ["int64", "int64", "float64", "float64", "string"])
 
 def LogDistance(Distance, Approach, Status):
     """ Stores the distance, approach, and status to be analysed later
@@ -25,9 +17,7 @@ def LogDistance(Distance, Approach, Status):
     Returns:
     - None
     """
-    with open(DistanceLogFile, "a", newline="") as f:
-        writer = csv.writer(f) 
-        writer.writerow([round(Distance, 2) if Distance is not None else None, round(Approach, 2) if Approach is not None else None, Status])
+    DistanceSink.Write([round(Distance, 2) if Distance is not None else None, round(Approach, 2) if Approach is not None else None, Status])
 
 def SafeCasting(Metric, Cast, Default):
     """ Casting values safely in case values aren't recorded due to issue with the model
@@ -63,6 +53,4 @@ def LogGesture(FrameNumber, HandDetected, HandConfidence, ProximityPixel, Status
     ProximityPixel = SafeCasting(ProximityPixel, float, 0.0)
     Status = SafeCasting(Status, str, "Unknown")
 
-    with open(GestureLogFile, "a", newline="") as f:
-        writer = csv.writer(f)
-        writer.writerow([int(FrameNumber) if FrameNumber is not None else None, HandDetected, round(HandConfidence, 3), round(ProximityPixel, 2), Status])
\ No newline at end of file
+    GestureSink.Write([int(FrameNumber) if FrameNumber is not None else None, HandDetected, round(HandConfidence, 3), round(ProximityPixel, 2), Status])
\ No newline at end of file
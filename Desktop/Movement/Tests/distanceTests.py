@@ -2,55 +2,23 @@ import numpy as np
 from types import SimpleNamespace
 from Desktop.Movement.distance import DistanceMonitor
 
-class BoundingBoxSimulation:
-    def __init__(self, Coordinates):
-        """ Simulated bounding box
-
-        Arguments:
-        - Coordinates (list[float]): Bounding box coordinates
-
-        Attributes:
-        - Coordinates (list[float]): Bounding box coordinates
-
-        Returns:
-        - None
-        """
-        self.Coordinates = np.array(Coordinates, dtype=np.float32)
-
-    def cpu(self):
-        """ Simulates bounding box tensor interface
-            
-        Returns:
-        - BoundingBoxSimulation: Stored bounding box coordinates
-        """   
-        return self
-
-    def numpy(self):
-        """ Returns simulated bounding box coordinates as NumPy array
-        
-        Returns:
-        - Coordinates (np.ndarray): Bounding box coordinates
-        """
-        return self.Coordinates
-
 class BoundingBoxValues:
-    def __init__(self, Height=None):
+    def __init__(self, Height=None, Others=()):
         """ Detect and creates bounding box
 
         Arguments:
         - Height (float): Persons bounding box height
+        - Others (list[float]): Bounding box heights of other persons in the frame
 
         Returns:
         - None
         """
-        if Height is None:
-            Boxes = SimpleNamespace(xyxy=[], cls=[])
-        else:
-            x1, y1 = 100, 100
-            x2 = 300
-            y2 = 100 + Height
-            SimulatedBox = BoundingBoxSimulation([x1, y1, x2, y2])
-            Boxes = SimpleNamespace(xyxy=[SimulatedBox], cls=[0])
+        Heights = list(Others) if Height is None else [Height] + list(Others)
+        Coordinates = [[100 + 220 * Index, 100, 300 + 220 * Index, 100 + Value] for Index, Value in enumerate(Heights)]
+        Boxes = SimpleNamespace(
+            xyxy=np.array(Coordinates, dtype=np.float32).reshape(-1, 4),
+            cls=np.zeros(len(Heights), dtype=np.float32)
+        )
 
         self.boxes = Boxes
 
@@ -80,32 +48,30 @@ class DistanceMonitorTests:
         - PoseThreshold (float): Threshold to determine if pose is too close
 
         Attributes:
-        - self.Monitor (DistanceMonitor): Instantiated version of distance monitor for testing
+        - self.Monitor (DistanceMonitor): Instantiated version of distance monitor for testing, with stub models replaced each simulation
 
         Returns:
         - None
         """
-        self.Monitor = DistanceMonitor(YoloModel=None, BoxThreshold=BoxThreshold, PoseThreshold=PoseThreshold, MaxRows=1, CameraIndex=0)
-
-        try:
-            self.Monitor.Cap.release()
-        except Exception:
-            pass
+        Pose = SimpleNamespace(process=lambda Frame: SimpleNamespace(pose_landmarks=None))
+        Yolo = lambda Frame, verbose=False: [BoundingBoxValues()]
+        self.Monitor = DistanceMonitor(Pose=Pose, Yolo=Yolo)
+        self.Monitor.BoxThreshold = BoxThreshold
+        self.Monitor.PoseThreshold = PoseThreshold
 
-        self.Monitor.Cap = None
-
-    def Simulate(self, BoxHeight=None, ShoulderWidth=None):
+    def Simulate(self, BoxHeight=None, ShoulderWidth=None, OtherHeights=()):
         """ Generates frame to be tested
         
         Arguments:
         - BoxHeight (float): Simulated persons bounding box height
         - ShoulderWidth (float): Simulated persons shoulder width distance
+        - OtherHeights (list[float]): Simulated bounding box heights of other persons
 
         Returns:
         - dict: Output of distance monitor processing the frame
         """
         Frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        self.Monitor.Yolo = lambda img, verbose=False: [BoundingBoxValues(BoxHeight)]
+        self.Monitor.Yolo = lambda img, verbose=False: [BoundingBoxValues(BoxHeight, OtherHeights)]
 
         if ShoulderWidth is None:
             SimulatedPoseResult = SimpleNamespace(pose_landmarks=None)  
@@ -178,6 +144,15 @@ class DistanceMonitorTests:
         Result = self.Simulate(BoxHeight=None, ShoulderWidth=None)
         return (Result["FinalStatus"] == "Safe") and (Result["BoxStatus"] == "No Person")
 
+    def TestCloserSecondPerson(self):
+        """ Tests if a second person closer than the first is detected
+
+        Returns:
+        - bool: True if the closer second person is too close
+        """
+        Result = self.Simulate(BoxHeight=200, ShoulderWidth=100, OtherHeights=[520])
+        return Result["BoxStatus"] == "TOO CLOSE (Box)" and Result["Height"] == 520
+
     def RunAllTests(self):
         """ Runs all unit tests and return results
 
@@ -191,7 +166,8 @@ class DistanceMonitorTests:
             "Sitting Far": self.TestSittingFar(),
             "Crouching Close": self.TestCrouchingClose(),
             "Crouching Far": self.TestCrouchingFar(),
-            "No Person": self.TestNoPerson()
+            "No Person": self.TestNoPerson(),
+            "Closer Second Person": self.TestCloserSecondPerson()
         }
 
         Passed = sum(1 for r in Results.values() if r)
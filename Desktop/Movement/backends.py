@@ -0,0 +1,75 @@
+import numpy as np
+from types import SimpleNamespace
+
+class PoseKeypointBackend:
+    def __init__(self, ModelPath="yolo11n-pose.pt", Confidence=0.5, KeypointConfidence=0.5):
+        """ Runs a single keypoint model that returns each person's box and shoulders in one pass
+
+        Arguments:
+        - ModelPath (str): Path to the keypoint model weights or export
+        - Confidence (float): Minimum confidence of a person
+        - KeypointConfidence (float): Minimum confidence of both shoulders for them to be used
+
+        Attributes:
+        - Model (YOLO): Keypoint model
+        - Confidence (float): Minimum confidence of a person
+        - KeypointConfidence (float): Minimum confidence of both shoulders for them to be used
+        - LeftShoulder (int): Index of the left shoulder in the model's keypoints
+        - RightShoulder (int): Index of the right shoulder in the model's keypoints
+
+        Returns:
+        - None
+        """
+        from ultralytics import YOLO
+        self.Model = YOLO(ModelPath, task="pose")
+        self.Confidence = Confidence
+        self.KeypointConfidence = KeypointConfidence
+        self.LeftShoulder = 5
+        self.RightShoulder = 6
+
+    def ToLandmarks(self, Keypoints):
+        """ Shape a person's shoulders like MediaPipe landmarks so ComputePoseDistance can read them
+
+        Arguments:
+        - Keypoints (np.ndarray): Normalised x, y of each keypoint
+
+        Returns:
+        - (hashmap[int][SimpleNamespace]): Shoulders keyed by MediaPipe's LEFT_SHOULDER and RIGHT_SHOULDER
+        """
+        # PoseLandmark is an IntEnum, so these keys match MediaPipe's landmark indices
+        Left = Keypoints[self.LeftShoulder]
+        Right = Keypoints[self.RightShoulder]
+        return {
+            11: SimpleNamespace(x=float(Left[0]), y=float(Left[1])),
+            12: SimpleNamespace(x=float(Right[0]), y=float(Right[1]))
+        }
+
+    def Infer(self, Frame):
+        """ Detect every person and their shoulders
+
+        Arguments:
+        - Frame (np.ndarray): Current frame
+
+        Returns:
+        - Tuple:
+            - Result (ultralytics.engine.results.Results): Model output, with person boxes in Result.boxes
+            - Landmarks (list[hashmap]): Shoulders of each person in box order, None where they weren't visible
+        """
+        Result = self.Model(Frame, conf=self.Confidence, verbose=False)[0]
+        Keypoints = Result.keypoints
+        if Keypoints is None or Result.boxes is None or len(Result.boxes) == 0:
+            return Result, []
+
+        Positions = Keypoints.xyn.cpu().numpy()
+        if Keypoints.conf is not None:
+            Confidences = Keypoints.conf.cpu().numpy()
+        else:
+            Confidences = np.ones(Positions.shape[:2], dtype=np.float32)
+
+        Landmarks = []
+        for Person, Confidence in zip(Positions, Confidences):
+            if min(Confidence[self.LeftShoulder], Confidence[self.RightShoulder]) < self.KeypointConfidence:
+                Landmarks.append(None)
+            else:
+                Landmarks.append(self.ToLandmarks(Person))
+        return Result, Landmarks
@@ -4,23 +4,32 @@ import numpy as np
 import mediapipe as mp
 from ultralytics import YOLO
 from Desktop.Movement.Metrics.metrics import LogDistance
+from Desktop.Movement.backends import PoseKeypointBackend
 
 class DistanceMonitor:
-    def __init__(self):
+    def __init__(self, Pose=None, Yolo=None, Backend="separate", KeypointModelPath="yolo11n-pose.pt"):
         """ Initialise parameters to determine if persons too close and models to capture this
 
+        Arguments:
+        - Pose (mediapipe.solutions.pose.Pose): Shared pose estimation model, created if not provided
+        - Yolo (YOLO): Shared object detection model, created if not provided
+        - Backend (str): Either separate to run YOLO and MediaPipe Pose, or keypoints to get boxes and shoulders from one keypoint model
+        - KeypointModelPath (str): Weights of the keypoint model for the keypoints backend
+
         Attributes:
         - Cap (cv2.VideoCapture): Laptop's camera
-        - Yolo (YOLO): Model for pose detection and bounding box
+        - Yolo (YOLO): Model for pose detection and bounding box, None with the keypoints backend
+        - Keypoints (PoseKeypointBackend): Model for bounding boxes and shoulders in one pass, None with the separate backend
         - BoxThreshold (float): Measurement of persons bounding box before they're too close
         - MpPose (mediapipe.solutions.pose): Run pose estimator
-        - Pose (mediapipe.solutions.pose.Pose): Pose estimation model
+        - Pose (mediapipe.solutions.pose.Pose): Pose estimation model, None with the keypoints backend
         - PoseThreshold (float): Measurement of persons pose before they're too close 
         - MaxFrames (int): Number of frames to test implementation 
         - FrameNumber (int): Current frame
 
         Raises:
         - RuntimeError: Camera not accessible
+        - ValueError: Unknown backend
 
         Returns:
         - None
@@ -31,14 +40,23 @@ class DistanceMonitor:
 
         #self.Cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
         #self.Cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
-        self.Yolo = YOLO("yolo11n.pt")
-
         self.BoxThreshold = 478.5
         self.MpPose = mp.solutions.pose
-        self.Pose = self.MpPose.Pose(
-            min_detection_confidence=0.5,
-            min_tracking_confidence=0.5
-        )
+        self.Keypoints = None
+        if Backend == "keypoints":
+            self.Keypoints = PoseKeypointBackend(KeypointModelPath)
+        elif Backend == "separate":
+            if Yolo is None:
+                Yolo = YOLO("yolo11n.pt")
+            if Pose is None:
+                Pose = self.MpPose.Pose(
+                    min_detection_confidence=0.5,
+                    min_tracking_confidence=0.5
+                )
+        else:
+            raise ValueError(f"Unknown distance backend {Backend}")
+        self.Yolo = Yolo
+        self.Pose = Pose
 
         self.PoseThreshold = 0.5
         self.MaxFrames = 200000
@@ -59,20 +77,19 @@ class DistanceMonitor:
         return cv2.resize(Frame, (640, 480))
 
     def DetectPersonHeight(self, Boxes):
-        """ Extract persons bounding box
+        """ Extract the tallest persons bounding box height, as the tallest is the closest
 
         Arguments:
         - Boxes (ultralytics.engine.results.Boxes): List of bounding box coordinates
 
         Returns:
-        - Height (float): Persons bounding box height
+        - Height (float): Tallest persons bounding box height, None if nobody is detected
         """ 
-        for Box, PersonClass in zip(Boxes.xyxy, Boxes.cls):
-            if int(PersonClass) == 0:
-                X1, Y1, X2, Y2 = Box.cpu().numpy()
-                Height = Y2 - Y1
-                return Height
-        return None
+        Persons = Boxes.xyxy[Boxes.cls == 0]
+        if len(Persons) == 0:
+            return None
+        Heights = Persons[:, 3] - Persons[:, 1]
+        return float(Heights.max())
 
     def ComputeBoxStatus(self, PersonHeight):
         """ Determines if persons bounding box height is within the bounding box threshold
@@ -178,11 +195,12 @@ class DistanceMonitor:
         #cv2.putText(Frame, Text, (20, 40), cv2.FONT_HERSHEY_SIMPLEX, 0.7, Colour, 2)
         #cv2.imshow("Distance Monitor", Frame)
 
-    def ProcessFrame(self, Frame):
+    def ProcessFrame(self, Frame, Context=None):
         """ Determines if persons too close via pose and bounding box distance via current frame
 
         Arguments:
         - Frame (np.ndarray): Current frame
+        - Context (FrameContext): Shared model outputs for the current frame
 
         Returns:
         - Dictionary:
@@ -192,16 +210,32 @@ class DistanceMonitor:
             - BoxStatus (str): If persons bounding box determins they're too close
             - FinalStatus (str): If persons determined too close
         """
-        RGBFrame = cv2.cvtColor(Frame, cv2.COLOR_BGR2RGB)
-
-        ResultsPose = self.Pose.process(RGBFrame)
-        if ResultsPose.pose_landmarks:
-            Landmarks = ResultsPose.pose_landmarks.landmark 
-        else: 
-            Landmarks = None
-        TorsoMeasure, PoseStatus, PoseAlert = self.ComputePoseDistance(Landmarks, Frame.shape)
-
-        ResultsBox = self.Yolo(Frame, verbose=False)[0]
+        if self.Keypoints is not None:
+            if Context is not None:
+                ResultsBox, People = Context.Get("Keypoints", self.Keypoints.Infer)
+            else:
+                ResultsBox, People = self.Keypoints.Infer(Frame)
+            Distances = [self.ComputePoseDistance(Landmarks, Frame.shape) for Landmarks in People if Landmarks is not None]
+            if Distances:
+                TorsoMeasure, PoseStatus, PoseAlert = max(Distances, key=lambda Distance: Distance[0])
+            else:
+                TorsoMeasure, PoseStatus, PoseAlert = self.ComputePoseDistance(None, Frame.shape)
+        else:
+            if Context is not None:
+                ResultsPose = Context.PoseResults()
+            else:
+                RGBFrame = cv2.cvtColor(Frame, cv2.COLOR_BGR2RGB)
+                ResultsPose = self.Pose.process(RGBFrame)
+            if ResultsPose.pose_landmarks:
+                Landmarks = ResultsPose.pose_landmarks.landmark 
+            else: 
+                Landmarks = None
+            TorsoMeasure, PoseStatus, PoseAlert = self.ComputePoseDistance(Landmarks, Frame.shape)
+
+            if Context is not None:
+                ResultsBox = Context.YoloResults()
+            else:
+                ResultsBox = self.Yolo(Frame, verbose=False)[0]
         PersonHeight = self.DetectPersonHeight(ResultsBox.boxes)
         BoxStatus, BoxAlert = self.ComputeBoxStatus(PersonHeight)
 
@@ -221,17 +255,18 @@ class DistanceMonitor:
             "Height": PersonHeight
         }
     
-    def Live(self, Frame):
+    def Live(self, Frame, Context=None):
         """ For live implementation to constantly return the results
 
         Arguments:
         - Frame (np.ndarray): Current frame
+        - Context (FrameContext): Shared model outputs for the current frame
 
         Returns:
         - (bool): True if close else false
         """
         self.FrameNumber += 1
-        Results = self.ProcessFrame(Frame)
+        Results = self.ProcessFrame(Frame, Context)
         #self.GetDisplay(Frame, Results["BoxStatus"], Results["PoseStatus"], self.FrameNumber, Results["Torso"], Results["Height"])
         return Results["PoseAlert"] or Results["BoxAlert"]
 
@@ -0,0 +1,99 @@
+import os
+import json
+import tempfile
+from Desktop.Performance.performance import PerformanceMonitor
+
+class StubReference:
+    def __init__(self):
+        """ Simulated database reference
+
+        Attributes:
+        - Values (list[dict]): Values set on the reference
+
+        Returns:
+        - None
+        """
+        self.Values = []
+
+    def set(self, Value):
+        """ Simulates setting the reference
+
+        Arguments:
+        - Value (dict): Value set
+
+        Returns:
+        - None
+        """
+        self.Values.append(Value)
+
+class PerformanceMonitorTests:
+    def __init__(self):
+        """ Establish a performance monitor writing to a temporary folder
+
+        Attributes:
+        - Directory (str): Temporary folder for snapshots
+        - Monitor (PerformanceMonitor): Records performance
+
+        Returns:
+        - None
+        """
+        self.Directory = tempfile.mkdtemp()
+        self.Monitor = PerformanceMonitor(OutputPath=os.path.join(self.Directory, "Snapshot.json"))
+
+    def TestPercentiles(self):
+        """ Tests if monitor latencies are summarised in milliseconds
+
+        Returns:
+        - (bool): True if the percentiles match the samples
+        """
+        for Milliseconds in range(1, 101):
+            self.Monitor.Record("Proximity", Milliseconds / 1000)
+        Summary = self.Monitor.Snapshot()["Monitors"]["Proximity"]
+        return Summary["Count"] == 100 and Summary["MaxMs"] == 100.0 and 49 <= Summary["P50Ms"] <= 51 and Summary["P99Ms"] >= 99
+
+    def TestQueueDepths(self):
+        """ Tests if tracked queues are included in snapshots
+
+        Returns:
+        - (bool): True if the queue depth is reported
+        """
+        self.Monitor.Track("Uploads", lambda: 3)
+        return self.Monitor.Snapshot()["Queues"]["Uploads"] == 3
+
+    def TestPublishInterval(self):
+        """ Tests if snapshots are only published once per interval and saved locally
+
+        Returns:
+        - (bool): True if a single snapshot was published and written
+        """
+        Reference = StubReference()
+        First = self.Monitor.MaybePublish(Reference)
+        Second = self.Monitor.MaybePublish(Reference)
+        with open(self.Monitor.OutputPath) as File:
+            Saved = json.load(File)
+        return First is not None and Second is None and len(Reference.Values) == 1 and Saved["timestamp"] == First["timestamp"]
+
+    def RunAllTests(self):
+        """ Run all tests for performance monitoring
+
+        Returns:
+        - None
+        """
+        Results = {
+            "Percentiles": self.TestPercentiles(),
+            "Queue Depths": self.TestQueueDepths(),
+            "Publish Interval": self.TestPublishInterval()
+        }
+
+        Passed = sum(1 for r in Results.values() if r)
+        Total = len(Results)
+
+        print("\nTest Summary:")
+        for Name, Result in Results.items():
+            print(f" - {Name}: {'PASS' if Result else 'FAIL'}")
+
+        print(f"\nFinal Result: {Passed}/{Total} tests passed.")
+
+if __name__ == "__main__":
+    Tests = PerformanceMonitorTests()
+    Tests.RunAllTests()
@@ -0,0 +1,334 @@
+import os
+import sys
+import cv2
+import json
+import time
+import argparse
+import tracemalloc
+import numpy as np
+from Desktop.Performance.performance import PerformanceMonitor
+
+class BenchmarkSuite:
+    def __init__(self, Frames, Threshold=0.2, BaselinePath=None):
+        """ Times each pipeline stage over the same frames and compares the results with a stored baseline
+
+        Arguments:
+        - Frames (list[np.ndarray]): Frames at the camera's resolution, in order
+        - Threshold (float): Fraction a stage's p95 may grow over the baseline before it counts as a regression
+        - BaselinePath (str): JSON file holding the baseline, defaults to Performance/Baseline.json
+
+        Attributes:
+        - Size (tuple[int, int]): Resolution the pipeline runs at
+        - Native (list[np.ndarray]): Frames at the camera's resolution, which the resize stage is timed over
+        - Frames (list[np.ndarray]): Frames resized to the pipeline's resolution, which the other stages are timed over
+        - Threshold (float): Fraction a stage's p95 may grow over the baseline
+        - BaselinePath (str): JSON file holding the baseline
+        - Summariser (PerformanceMonitor): Summarises timings into percentiles
+        - Releases (list[function]): Frees the devices and models of the stage being timed
+        - Builders (hashmap[str][function]): Builds each stage, returning a call that takes the frame index
+
+        Returns:
+        - None
+        """
+        self.Size = (900, 700)
+        self.Native = Frames
+        self.Frames = [cv2.resize(Frame, self.Size) for Frame in Frames]
+        self.Threshold = Threshold
+        if BaselinePath is None:
+            BaselinePath = os.path.join(os.path.dirname(__file__), "Baseline.json")
+        self.BaselinePath = BaselinePath
+        self.Summariser = PerformanceMonitor()
+        self.Releases = []
+        self.Builders = {
+            "Capture": self.BuildCapture,
+            "Resize": self.BuildResize,
+            "Colour": self.BuildColour,
+            "Pose": self.BuildPose,
+            "Yolo": self.BuildYolo,
+            "Mask": self.BuildMask,
+            "Flow": self.BuildFlow,
+            "SSIM": self.BuildSSIM,
+            "JPEG": self.BuildJPEG,
+            "Enqueue": self.BuildEnqueue
+        }
+
+    def BuildCapture(self):
+        """ Read frames from the camera
+
+        Raises:
+        - RuntimeError: Camera not accessible
+
+        Returns:
+        - (function): Reads one frame
+        """
+        Cap = cv2.VideoCapture(0)
+        self.Releases.append(Cap.release)
+        if not Cap.isOpened():
+            raise RuntimeError("Can't access camera")
+        return lambda Index: Cap.read()
+
+    def BuildResize(self):
+        """ Resize camera frames to the pipeline's resolution
+
+        Returns:
+        - (function): Resizes one frame
+        """
+        return lambda Index: cv2.resize(self.Native[Index], self.Size)
+
+    def BuildColour(self):
+        """ Convert frames to RGB and grayscale, as the models and background monitor need
+
+        Returns:
+        - (function): Converts one frame
+        """
+        return lambda Index: (cv2.cvtColor(self.Frames[Index], cv2.COLOR_BGR2RGB), cv2.cvtColor(self.Frames[Index], cv2.COLOR_BGR2GRAY))
+
+    def BuildPose(self):
+        """ Run MediaPipe Pose
+
+        Returns:
+        - (function): Runs pose estimation on one frame
+        """
+        import mediapipe as mp
+        Pose = mp.solutions.pose.Pose(model_complexity=0, min_detection_confidence=0.5, min_tracking_confidence=0.5)
+        self.Releases.append(Pose.close)
+        RGB = [cv2.cvtColor(Frame, cv2.COLOR_BGR2RGB) for Frame in self.Frames]
+        return lambda Index: Pose.process(RGB[Index])
+
+    def BuildYolo(self):
+        """ Run the shared detector through the engine picked by YOLO_ENGINE
+
+        Returns:
+        - (function): Runs the detector on one frame
+        """
+        from Desktop.Main.inferenceEngine import DetectorEngine
+        Detector = DetectorEngine("yolo11n.pt", os.getenv("YOLO_ENGINE", "torch"))
+        return lambda Index: Detector(self.Frames[Index], verbose=False)
+
+    def BuildMask(self):
+        """ Run the local mask detector, as timing the remote one would time the network
+
+        Raises:
+        - FileNotFoundError: Mask model doesn't exist
+
+        Returns:
+        - (function): Runs mask detection on one frame
+        """
+        from Desktop.Mask.backends import LocalBackend
+        ModelPath = os.getenv("MASK_MODEL_PATH") or os.path.join(os.path.dirname(__file__), "..", "Mask", "Models", "mask.onnx")
+        Backend = LocalBackend(ModelPath)
+        return lambda Index: Backend.Infer(self.Frames[Index])
+
+    def BuildFlow(self):
+        """ Compute optical flow between consecutive frames as the background monitor does
+
+        Returns:
+        - (function): Computes motion between one frame and the previous
+        """
+        from Desktop.Background.background import BackgroundMonitor
+        Monitor = BackgroundMonitor()
+        Gray = [Monitor.Shrink(cv2.cvtColor(Frame, cv2.COLOR_BGR2GRAY)) for Frame in self.Frames]
+        return lambda Index: Monitor.ComputeMotion(Gray[Index - 1], Gray[Index])
+
+    def BuildSSIM(self):
+        """ Compare frames with the first frame as the background monitor does
+
+        Returns:
+        - (function): Computes SSIM of one frame
+        """
+        from Desktop.Background.background import BackgroundMonitor
+        Monitor = BackgroundMonitor()
+        Gray = [cv2.cvtColor(Frame, cv2.COLOR_BGR2GRAY) for Frame in self.Frames]
+        Monitor.SetReference(Gray[0])
+        return lambda Index: Monitor.ComputeSSIM(Gray[Index])
+
+    def BuildJPEG(self):
+        """ Encode frames as the livestream does
+
+        Returns:
+        - (function): Encodes one frame
+        """
+        return lambda Index: cv2.imencode(".jpg", self.Frames[Index], [cv2.IMWRITE_JPEG_QUALITY, 95])
+
+    def BuildEnqueue(self):
+        """ Hand frames to the upload queue, without upload threads so nothing is sent
+
+        Returns:
+        - (function): Enqueues one frame and takes it back off
+        """
+        from Desktop.Main.cloud import UploadQueue
+        Uploader = UploadQueue(Workers=0)
+
+        def Enqueue(Index):
+            Uploader.Enqueue(self.Frames[Index], "Benchmark", Index)
+            Uploader.Queue.get_nowait()
+        return Enqueue
+
+    def Measure(self, Call):
+        """ Time a stage over every frame, then measure its allocations in a separate pass so tracing doesn't skew the timings
+
+        Arguments:
+        - Call (function): Runs the stage on the frame at an index
+
+        Returns:
+        - (hashmap[str][float]): Latency percentiles, peak and per call allocated kilobytes
+        """
+        Call(1)
+        Samples = []
+        for Index in range(1, len(self.Frames)):
+            Start = time.perf_counter()
+            Call(Index)
+            Samples.append(time.perf_counter() - Start)
+        Result = self.Summariser.Percentiles(Samples)
+
+        Calls = min(10, len(self.Frames) - 1)
+        tracemalloc.start()
+        Before = tracemalloc.take_snapshot()
+        for Index in range(1, Calls + 1):
+            Call(Index)
+        After = tracemalloc.take_snapshot()
+        Current, Peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        Allocated = sum(Stat.size_diff for Stat in After.compare_to(Before, "filename") if Stat.size_diff > 0)
+        Result["PeakKB"] = round(Peak / 1024, 1)
+        Result["AllocatedKB"] = round(Allocated / 1024 / max(1, Calls), 1)
+        return Result
+
+    def Run(self, Stages=None):
+        """ Time each stage, skipping stages whose model or device isn't available, and free each stage's devices once it's timed
+
+        Arguments:
+        - Stages (list[str]): Stages to run, all by default
+
+        Returns:
+        - Results (hashmap[str][hashmap]): Measurements of each stage, or why it was skipped
+        """
+        Results = {}
+        for Name in Stages or list(self.Builders):
+            try:
+                Call = self.Builders[Name]()
+                Results[Name] = self.Measure(Call)
+                print(f"{Name}: {Results[Name]}")
+            except (ImportError, OSError, RuntimeError) as Error:
+                Results[Name] = {"Skipped": str(Error)}
+                print(f"{Name}: skipped, {Error}")
+            finally:
+                while self.Releases:
+                    self.Releases.pop()()
+        return Results
+
+    def LoadBaseline(self):
+        """ Read the stored baseline
+
+        Returns:
+        - (hashmap[str][hashmap]): Measurements of each stage, empty if there's no baseline
+        """
+        if not os.path.exists(self.BaselinePath):
+            return {}
+        with open(self.BaselinePath) as File:
+            return json.load(File)
+
+    def SaveBaseline(self, Results):
+        """ Store measurements as the new baseline
+
+        Arguments:
+        - Results (hashmap[str][hashmap]): Measurements of each stage
+
+        Returns:
+        - None
+        """
+        with open(self.BaselinePath, "w") as File:
+            json.dump(Results, File, indent=2)
+
+    def Compare(self, Results, Baseline):
+        """ Find stages whose p95 grew past the threshold, or that the baseline measured but this run skipped
+
+        Arguments:
+        - Results (hashmap[str][hashmap]): New measurements, stages not asked for are left out
+        - Baseline (hashmap[str][hashmap]): Stored measurements
+
+        Returns:
+        - Regressions (list[str]): Description of each regression
+        """
+        Regressions = []
+        for Name, Result in Results.items():
+            Previous = Baseline.get(Name, {})
+            if "P95Ms" not in Previous:
+                continue
+            if "P95Ms" not in Result:
+                Regressions.append(f"{Name}: missing from this run, {Result.get('Skipped', 'not measured')}")
+                continue
+            Limit = Previous["P95Ms"] * (1 + self.Threshold)
+            if Result["P95Ms"] > Limit:
+                Regressions.append(f"{Name}: p95 {Result['P95Ms']} ms over {round(Limit, 2)} ms (baseline {Previous['P95Ms']} ms)")
+        return Regressions
+
+def SyntheticFrames(Count=60, Size=(1280, 720)):
+    """ Noisy frames with a square moving across, so flow and SSIM have something to measure
+
+    Arguments:
+    - Count (int): Number of frames
+    - Size (tuple[int, int]): Width and height, a common webcam resolution by default
+
+    Returns:
+    - Frames (list[np.ndarray]): Generated frames
+    """
+    Width, Height = Size
+    Generator = np.random.default_rng(0)
+    Background = Generator.integers(0, 255, (Height, Width, 3), dtype=np.uint8)
+    Frames = []
+    for Index in range(Count):
+        Frame = Background.copy()
+        X = (Index * 10) % (Width - 150)
+        cv2.rectangle(Frame, (X, Height // 3), (X + 150, Height // 3 + 250), (40, 40, 200), -1)
+        Frames.append(Frame)
+    return Frames
+
+def RecordedFrames(Path, Count=60):
+    """ Frames from a recording, at the resolution they were recorded at
+
+    Arguments:
+    - Path (str): Video file or folder of images
+    - Count (int): Maximum number of frames
+
+    Returns:
+    - Frames (list[np.ndarray]): Recorded frames
+    """
+    from Desktop.Main.replay import ReplaySource
+    Frames = []
+    for Frame, Position in ReplaySource(Path).Read():
+        Frames.append(Frame)
+        if len(Frames) >= Count:
+            break
+    return Frames
+
+if __name__ == "__main__":
+    Parser = argparse.ArgumentParser(description="Time each pipeline stage and check for regressions against a baseline")
+    Parser.add_argument("--recording", default=None, help="Video file or folder of images, synthetic frames if not given")
+    Parser.add_argument("--frames", type=int, default=60, help="Frames each stage is timed over")
+    Parser.add_argument("--size", default="1280x720", help="Camera resolution of synthetic frames, as WIDTHxHEIGHT")
+    Parser.add_argument("--stages", default=None, help="Comma separated stages to run, all by default")
+    Parser.add_argument("--baseline", default=None, help="Baseline JSON file")
+    Parser.add_argument("--threshold", type=float, default=0.2, help="Allowed p95 growth over the baseline")
+    Parser.add_argument("--update", action="store_true", help="Store the results as the new baseline")
+    Arguments = Parser.parse_args()
+
+    if Arguments.recording:
+        Frames = RecordedFrames(Arguments.recording, Arguments.frames)
+    else:
+        Frames = SyntheticFrames(Arguments.frames, tuple(int(Side) for Side in Arguments.size.lower().split("x")))
+    if len(Frames) < 2:
+        sys.exit("Need at least two frames to benchmark")
+
+    Suite = BenchmarkSuite(Frames, Arguments.threshold, Arguments.baseline)
+    Results = Suite.Run(Arguments.stages.split(",") if Arguments.stages else None)
+
+    if Arguments.update:
+        Suite.SaveBaseline(Results)
+        print(f"Baseline saved to {Suite.BaselinePath}")
+        sys.exit(0)
+
+    Regressions = Suite.Compare(Results, Suite.LoadBaseline())
+    for Regression in Regressions:
+        print(f"REGRESSION {Regression}")
+    sys.exit(1 if Regressions else 0)
@@ -0,0 +1,213 @@
+import os
+import json
+import time
+import threading
+import psutil
+import numpy as np
+from collections import deque
+
+class PerformanceMonitor:
+    def __init__(self, Window=300, PublishInterval=30.0, OutputPath=None):
+        """ Records how long monitors and loop ticks take along with process usage, and rolls them up into snapshots
+
+        Arguments:
+        - Window (int): Number of recent samples kept for each measurement
+        - PublishInterval (float): Seconds between snapshots sent to the database
+        - OutputPath (str): JSON file the latest snapshot is written to, defaults to Performance/Snapshot.json
+
+        Attributes:
+        - Window (int): Number of recent samples kept for each measurement
+        - PublishInterval (float): Seconds between snapshots sent to the database
+        - OutputPath (str): JSON file the latest snapshot is written to
+        - Latencies (hashmap[str][collections.deque]): Seconds taken by recent runs of each monitor
+        - TickDurations (collections.deque): Seconds of work in recent ticks
+        - TickStarts (collections.deque): Timestamps recent ticks started at
+        - TickStart (float): Timestamp the current tick started at
+        - Queues (hashmap[str][function]): Returns the depth of each tracked queue
+        - Extras (hashmap[str][function]): Returns extra figures added to each snapshot
+        - Process (psutil.Process): This process
+        - LastPublish (float): Timestamp of the last snapshot sent
+        - Lock (threading.Lock): Guards the samples, as monitors report from worker threads
+
+        Returns:
+        - None
+        """
+        self.Window = Window
+        self.PublishInterval = PublishInterval
+        if OutputPath is None:
+            OutputPath = os.path.join(os.path.dirname(__file__), "Snapshot.json")
+        self.OutputPath = OutputPath
+        self.Latencies = {}
+        self.TickDurations = deque(maxlen=Window)
+        self.TickStarts = deque(maxlen=Window)
+        self.TickStart = None
+        self.Queues = {}
+        self.Extras = {}
+        self.Process = psutil.Process()
+        self.Process.cpu_percent(None)
+        self.LastPublish = 0.0
+        self.Lock = threading.Lock()
+
+    def Record(self, Name, Seconds):
+        """ Add how long a monitor took
+
+        Arguments:
+        - Name (str): Name of the monitor
+        - Seconds (float): Time taken
+
+        Returns:
+        - None
+        """
+        with self.Lock:
+            if Name not in self.Latencies:
+                self.Latencies[Name] = deque(maxlen=self.Window)
+            self.Latencies[Name].append(Seconds)
+
+    def StartTick(self):
+        """ Mark the start of a loop tick
+
+        Returns:
+        - None
+        """
+        self.TickStart = time.perf_counter()
+        with self.Lock:
+            self.TickStarts.append(self.TickStart)
+
+    def EndTick(self):
+        """ Mark the end of the work in a loop tick, before any sleep
+
+        Returns:
+        - None
+        """
+        if self.TickStart is None:
+            return
+        with self.Lock:
+            self.TickDurations.append(time.perf_counter() - self.TickStart)
+        self.TickStart = None
+
+    def Track(self, Name, Depth):
+        """ Include a queue's depth in each snapshot
+
+        Arguments:
+        - Name (str): Name of the queue
+        - Depth (function): Returns the number of items waiting
+
+        Returns:
+        - None
+        """
+        self.Queues[Name] = Depth
+
+    def Extra(self, Name, Report):
+        """ Include extra figures in each snapshot, such as run and skip counters
+
+        Arguments:
+        - Name (str): Name of the figures
+        - Report (function): Returns the figures
+
+        Returns:
+        - None
+        """
+        self.Extras[Name] = Report
+
+    def Percentiles(self, Samples):
+        """ Summarise samples in milliseconds
+
+        Arguments:
+        - Samples (collections.deque): Seconds taken
+
+        Returns:
+        - (hashmap[str][float]): Count, mean, p50, p95, p99 and max
+        """
+        if not Samples:
+            return {"Count": 0}
+        Milliseconds = 1000 * np.array(Samples, dtype=np.float64)
+        P50, P95, P99 = np.percentile(Milliseconds, [50, 95, 99])
+        return {
+            "Count": len(Milliseconds),
+            "MeanMs": round(float(Milliseconds.mean()), 2),
+            "P50Ms": round(float(P50), 2),
+            "P95Ms": round(float(P95), 2),
+            "P99Ms": round(float(P99), 2),
+            "MaxMs": round(float(Milliseconds.max()), 2)
+        }
+
+    def Snapshot(self):
+        """ Roll up the recent samples
+
+        Returns:
+        - (hashmap[str][any]): Timestamp, FPS, tick and monitor latencies, CPU, memory, queue depths and extras
+        """
+        with self.Lock:
+            Latencies = {Name: list(Samples) for Name, Samples in self.Latencies.items()}
+            TickDurations = list(self.TickDurations)
+            TickStarts = list(self.TickStarts)
+
+        FPS = 0.0
+        if len(TickStarts) > 1 and TickStarts[-1] > TickStarts[0]:
+            FPS = (len(TickStarts) - 1) / (TickStarts[-1] - TickStarts[0])
+
+        Queues = {}
+        for Name, Depth in self.Queues.items():
+            try:
+                Queues[Name] = int(Depth())
+            except Exception as Error:
+                print(f"Queue depth of {Name} failed: {Error}")
+
+        Extras = {}
+        for Name, Report in self.Extras.items():
+            try:
+                Extras[Name] = Report()
+            except Exception as Error:
+                print(f"Performance report of {Name} failed: {Error}")
+
+        return {
+            "timestamp": int(time.time()),
+            "FPS": round(FPS, 2),
+            "Tick": self.Percentiles(TickDurations),
+            "Monitors": {Name: self.Percentiles(Samples) for Name, Samples in Latencies.items()},
+            "CPU": self.Process.cpu_percent(None),
+            "RSSMB": round(self.Process.memory_info().rss / 2 ** 20, 1),
+            "Queues": Queues,
+            "Extras": Extras
+        }
+
+    def Write(self, Snapshot):
+        """ Save a snapshot locally, replacing the previous one in one step so readers never see half a file
+
+        Arguments:
+        - Snapshot (hashmap[str][any]): Snapshot to save
+
+        Returns:
+        - None
+        """
+        TemporaryPath = self.OutputPath + ".tmp"
+        with open(TemporaryPath, "w") as File:
+            json.dump(Snapshot, File, indent=2)
+        os.replace(TemporaryPath, self.OutputPath)
+
+    def MaybePublish(self, PerformanceReference, Publisher=None):
+        """ Save and send a snapshot if the publish interval has passed
+
+        Arguments:
+        - PerformanceReference (firebase_admin.db.Reference): Reference to performance storage
+        - Publisher (ReferencePublisher): Sends the write in the background if provided
+
+        Returns:
+        - (hashmap[str][any]): Snapshot sent, None if it wasn't due
+        """
+        CurrentTime = time.time()
+        if CurrentTime - self.LastPublish < self.PublishInterval:
+            return None
+        self.LastPublish = CurrentTime
+
+        Snapshot = self.Snapshot()
+        try:
+            self.Write(Snapshot)
+        except OSError as Error:
+            print(f"Performance snapshot not saved: {Error}")
+
+        if Publisher is None:
+            PerformanceReference.set(Snapshot)
+        else:
+            Publisher.Publish(PerformanceReference, Snapshot)
+        return Snapshot